@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark do carregamento paralelo de arquivos LNEGC (--jobs).
+
+Gera um projeto sintético e mede o tempo de carregamento e parse para diferentes números
+de processos, exibindo a curva de aceleração em relação ao carregamento sequencial.
+
+Uso:
+    python docs/scripts/bench_jobs.py [--files 5000] [--jobs 1 2 4 8]
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from lnegc.src.core.processor import LNEGCProcessor
+
+ENTITY = """# LNEGC v1.0
+# Autor: LNEGC Team
+
+[ENTIDADE]
+Nome: Entidade{index}
+Tipo: Domínio
+Linguagem: Python
+Versão: 1.0.0
+
+## Atributos
+{attributes}
+
+## Validações
+{validations}
+
+[IMPLEMENTAÇÃO]
+```python
+{implementation}
+```
+"""
+
+
+def create_project(directory: Path, files: int) -> None:
+    """Cria um projeto sintético com o número de arquivos informado."""
+    kinds = ["componentes", "entidades", "interfaces", "testes"]
+    for kind in kinds:
+        (directory / kind).mkdir(parents=True)
+    for index in range(files):
+        content = ENTITY.format(
+            index=index,
+            attributes="\n".join(f"- campo{i}: str (obrigatório)" for i in range(40)),
+            validations="\n".join(f"- campo{i} deve ser válido" for i in range(40)),
+            implementation="\n".join(f"campo{i} = None" for i in range(200)),
+        )
+        path = directory / kinds[index % len(kinds)] / f"spec{index}.lnegc"
+        path.write_text(content, encoding="utf-8")
+
+
+def measure(directory: Path, jobs: int, repeat: int) -> float:
+    """Retorna o melhor tempo de carregamento entre as repetições."""
+    best = float("inf")
+    for _ in range(repeat):
+        processor = LNEGCProcessor(directory, jobs=jobs)
+        start = time.perf_counter()
+        processor.parse_all()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Função principal do benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000, help="Número de arquivos gerados")
+    parser.add_argument("--jobs", type=int, nargs="+", default=None, help="Valores de --jobs")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por medição")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    jobs_values = args.jobs or sorted({1, 2, 4, 8, 16, cpus} & set(range(1, cpus + 1)))
+
+    directory = Path(tempfile.mkdtemp())
+    try:
+        create_project(directory, args.files)
+        baseline = None
+        print(f"{args.files} arquivos, {cpus} CPUs")
+        print(f"{'jobs':>6} {'tempo (s)':>10} {'aceleração':>11}")
+        for jobs in jobs_values:
+            elapsed = measure(directory, jobs, args.repeat)
+            baseline = baseline or elapsed
+            print(f"{jobs:>6} {elapsed:>10.3f} {baseline / elapsed:>10.2f}x")
+    finally:
+        shutil.rmtree(directory)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
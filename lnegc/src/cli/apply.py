@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc apply`: grava o código das respostas do modelo nos arquivos do projeto.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.workspace import Workspace
+from lnegc.src.core.writeback import (
+    extract_blocks,
+    kind_directory,
+    spec_files,
+    spec_name,
+    write_files,
+)
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando apply.
+
+    Args:
+        args: Lista de argumentos após `apply`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc apply",
+        description="Grava os blocos de código das respostas de lnegc send nos arquivos "
+        "indicados pela seção [DIRETÓRIOS] e pelo Nome de cada especificação",
+    )
+
+    parser.add_argument(
+        "responses",
+        nargs="+",
+        help="Arquivos JSON Lines gerados por lnegc send",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        nargs="+",
+        required=True,
+        help="Diretórios dos projetos usados no envio",
+    )
+
+    parser.add_argument(
+        "--target",
+        type=str,
+        default=None,
+        help="Diretório de destino do código (padrão: o diretório de cada projeto; com "
+        "várias raízes, cada uma usa um subdiretório com o seu nome)",
+    )
+
+    parser.add_argument(
+        "--language",
+        type=str,
+        default=None,
+        help="Linguagem alvo usada no envio, para blocos sem linguagem",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="Número de gravações simultâneas (padrão: 0, usa todas as CPUs)",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Apenas lista os arquivos que seriam gravados",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Exibe os arquivos gravados e os que não mudaram",
+    )
+
+    return parser.parse_args(args)
+
+
+def _records(paths: List[str]) -> List[Dict]:
+    """Respostas bem-sucedidas, na ordem das especificações e das partes."""
+    records = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "error" not in record and record.get("response"):
+                    records.append(record)
+    # As respostas chegam na ordem em que terminaram; a ordem por especificação e parte
+    # torna o conteúdo dos arquivos independente dessa ordem
+    records.sort(key=lambda r: (r.get("root") or "", r["source"], r.get("part", 1)))
+    return records
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando apply.
+
+    Args:
+        args: Lista de argumentos após `apply`.
+
+    Returns:
+        0 se todas as respostas foram gravadas, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dirs = [Path(directory).resolve() for directory in parsed_args.dir]
+    for base_dir in base_dirs:
+        if not base_dir.is_dir():
+            print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+            return 1
+
+    failed = 0
+    try:
+        records = _records(parsed_args.responses)
+        cache = ParseCache.for_project(Workspace.cache_root(base_dirs), PARSER_VERSION)
+        workspace = Workspace(
+            base_dirs, parsed_args.language, cache=cache, jobs=parsed_args.jobs
+        )
+        with workspace:
+            multiple = len(workspace.roots) > 1
+            roots = {workspace.label(root): root for root in workspace.roots}
+            targets = {}
+            for label, root in roots.items():
+                if parsed_args.target is None:
+                    targets[root] = root
+                else:
+                    target = Path(parsed_args.target).resolve()
+                    targets[root] = target / label if multiple else target
+
+            # Arquivo -> blocos de código, na ordem das especificações e das partes
+            files: Dict[Path, List[str]] = {}
+            # Arquivo -> especificação de origem; duas especificações não gravam o mesmo
+            # arquivo
+            owners: Dict[Path, str] = {}
+            conflicts = set()
+            for record in records:
+                root = roots.get(record["root"]) if multiple else workspace.roots[0]
+                if root is None:
+                    print(f"Erro: raiz desconhecida: {record['root']}", file=sys.stderr)
+                    failed += 1
+                    continue
+                processor = workspace.processors[root]
+                directory = kind_directory(targets[root], record["kind"], processor.config)
+                try:
+                    blocks = spec_files(
+                        extract_blocks(record["response"]),
+                        directory,
+                        spec_name(record["source"], cache),
+                        processor.target_language,
+                        targets[root],
+                    )
+                except ValueError as e:
+                    print(f"Erro em {record['source']}: {e}", file=sys.stderr)
+                    failed += 1
+                    continue
+                if not blocks:
+                    print(f"Aviso: nenhum bloco de código em {record['source']}", file=sys.stderr)
+                for path, code in blocks:
+                    owner = owners.setdefault(path, record["source"])
+                    if owner != record["source"] and path not in conflicts:
+                        print(
+                            f"Erro: {owner} e {record['source']} geram o mesmo arquivo: "
+                            f"{path}",
+                            file=sys.stderr,
+                        )
+                        conflicts.add(path)
+                        failed += 1
+                    files.setdefault(path, []).append(code)
+
+            contents = {
+                path: "\n\n".join(code.rstrip("\n") for code in codes) + "\n"
+                for path, codes in files.items()
+                if path not in conflicts
+            }
+            if parsed_args.dry_run:
+                for path in contents:
+                    print(path)
+                return 1 if failed else 0
+
+            written, unchanged = write_files(contents, workspace.pools.threads)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    if parsed_args.verbose:
+        for path in written:
+            print(f"Gravado: {path}")
+        for path in unchanged:
+            print(f"Sem alteração: {path}")
+    print(f"{len(written)} arquivos gravados, {len(unchanged)} sem alteração.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc bundle`: converte pacotes gerados com --format bundle.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.bundle import expand
+from lnegc.src.core.output import TextWriter
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando bundle.
+
+    Args:
+        args: Lista de argumentos após `bundle`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc bundle",
+        description="Converte pacotes de prompts gerados com --format bundle",
+    )
+
+    parser.add_argument(
+        "action",
+        choices=["expand"],
+        help="expand reconstrói os prompts completos, como na saída --format text",
+    )
+
+    parser.add_argument(
+        "bundle",
+        type=str,
+        help="Arquivo do pacote",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Arquivo de saída para os prompts completos",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando bundle.
+
+    Args:
+        args: Lista de argumentos após `bundle`.
+
+    Returns:
+        0 em caso de sucesso, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    output_path = Path(parsed_args.output).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(parsed_args.bundle, "r", encoding="utf-8") as source, open(
+            output_path, "w", encoding="utf-8"
+        ) as output:
+            writer = TextWriter(output)
+            for record, prompt in expand(source):
+                writer.write(record["kind"], record["source"], prompt, record.get("root"))
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    return 0
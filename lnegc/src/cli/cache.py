@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc cache`: gerencia o cache persistente de parse.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando cache.
+
+    Args:
+        args: Lista de argumentos após `cache`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc cache",
+        description="Gerencia o cache de parse em .lnegc/cache",
+    )
+
+    parser.add_argument(
+        "action",
+        choices=["clear", "rebuild"],
+        help="clear remove todas as entradas; rebuild remove e processa novamente o projeto",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        default=".",
+        help="Diretório do projeto (padrão: diretório atual)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Exibe informações detalhadas durante o processamento",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando cache.
+
+    Args:
+        args: Lista de argumentos após `cache`.
+
+    Returns:
+        0 em caso de sucesso, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dir = Path(parsed_args.dir).resolve()
+    if not base_dir.is_dir():
+        print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+        return 1
+
+    cache = ParseCache.for_project(base_dir, PARSER_VERSION)
+    cache.clear()
+    if parsed_args.verbose:
+        print(f"Cache removido: {cache.root}")
+
+    if parsed_args.action == "rebuild":
+        processor = LNEGCProcessor(base_dir, cache=cache)
+        processor.parse_all()
+        if parsed_args.verbose:
+            print(f"Cache reconstruído com {cache.misses} arquivos.")
+
+    return 0
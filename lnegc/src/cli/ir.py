@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc ir`: grava a representação intermediária (IR) de um projeto.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.ir import IR_ENCODINGS
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando ir.
+
+    Args:
+        args: Lista de argumentos após `ir`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc ir",
+        description="Grava o projeto processado (metadados, seções, atributos, "
+        "relacionamentos e validação) como representação intermediária versionada",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        default=".",
+        help="Diretório do projeto (padrão: diretório atual)",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Arquivo de destino da IR",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=IR_ENCODINGS,
+        default="json",
+        help="json ou msgpack, mais compacto e rápido de carregar (requer o pacote "
+        "msgpack: pip install lnegc[msgpack]). Padrão: json",
+    )
+
+    parser.add_argument(
+        "--language",
+        type=str,
+        default=None,
+        help="Linguagem alvo registrada na IR",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Número de processos para carregar os arquivos (0 usa todas as CPUs)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Não usa o cache de parse em .lnegc/cache",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando ir.
+
+    Args:
+        args: Lista de argumentos após `ir`.
+
+    Returns:
+        0 em caso de sucesso, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dir = Path(parsed_args.dir).resolve()
+    if not base_dir.is_dir():
+        print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+        return 1
+
+    cache = None
+    if not parsed_args.no_cache:
+        cache = ParseCache.for_project(base_dir, PARSER_VERSION)
+    processor = LNEGCProcessor(
+        base_dir, parsed_args.language, cache=cache, jobs=parsed_args.jobs
+    )
+    output_path = Path(parsed_args.output).resolve()
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        processor.export_ir(output_path, parsed_args.format)
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
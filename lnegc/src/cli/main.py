@@ -7,10 +7,51 @@ Interface de linha de comando para o processador LNEGC.
 
 import argparse
 import sys
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, ContextManager, List, Optional, Tuple
 
-from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.cli import (
+    apply,
+    bundle,
+    cache,
+    ir,
+    merge,
+    query,
+    responses,
+    send,
+    tokens,
+    watch,
+)
+from lnegc.src.core.bundle import BundleWriter
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.output import JsonlWriter, TextWriter
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.shard import parse_shard, relative_path
+from lnegc.src.core.tokens import DEFAULT_TOKENIZER, TOKENIZERS
+from lnegc.src.core.workspace import Workspace
+
+# Subcomandos: o primeiro argumento seleciona o módulo que trata o restante
+COMMANDS = {
+    "apply": apply.main,
+    "bundle": bundle.main,
+    "cache": cache.main,
+    "ir": ir.main,
+    "merge": merge.main,
+    "query": query.main,
+    "responses": responses.main,
+    "send": send.main,
+    "tokens": tokens.main,
+    "watch": watch.main,
+}
+
+
+def _shard(text: str) -> Tuple[int, int]:
+    """Converte o argumento --shard, informando erros no formato do argparse."""
+    try:
+        return parse_shard(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
 
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
@@ -31,15 +72,17 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument(
         "--dir",
         type=str,
+        nargs="+",
         required=True,
-        help="Diretório contendo os arquivos .lnegc",
+        help="Diretório contendo os arquivos .lnegc. Vários diretórios podem ser "
+        "informados; cada um é processado com a sua própria configuração.",
     )
 
     parser.add_argument(
         "--output",
         type=str,
         required=True,
-        help="Arquivo de saída para os prompts gerados",
+        help="Arquivo de saída para os prompts gerados (- para a saída padrão)",
     )
 
     parser.add_argument(
@@ -49,12 +92,84 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         help="Linguagem alvo para geração de código (se não especificado, usa a linguagem do arquivo de configuração)",
     )
 
+    parser.add_argument(
+        "--format",
+        choices=["text", "bundle", "jsonl"],
+        default="text",
+        help="text: prompts completos separados por linha em branco; bundle: pacote JSON "
+        "Lines com os blocos de referência gravados uma única vez (veja `lnegc bundle`); "
+        "jsonl: um objeto JSON por linha com tipo, origem, hash e prompt",
+    )
+
+    parser.add_argument(
+        "--layout",
+        choices=["padrao", "prefixo"],
+        default="padrao",
+        help="prefixo: instruções fixas e implementações de referência no início de cada "
+        "prompt, para aproveitar o cache de prefixo do provedor do modelo",
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Limite de tokens por prompt: especificações maiores são divididas em partes "
+        "com o mesmo cabeçalho de metadados (veja `lnegc tokens`)",
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        type=str,
+        default=DEFAULT_TOKENIZER,
+        help=f"Tokenizador usado com --budget ({', '.join(TOKENIZERS)}). "
+        f"Padrão: {DEFAULT_TOKENIZER}",
+    )
+
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        default=None,
+        metavar="i/N",
+        help="Processa apenas o i-ésimo de N shards do projeto (partição estável pelo "
+        "caminho dos arquivos). Combine as saídas, geradas com --format jsonl, com "
+        "`lnegc merge`.",
+    )
+
+    parser.add_argument(
+        "--from-ir",
+        type=str,
+        default=None,
+        metavar="ARQUIVO",
+        help="Gera os prompts a partir de uma IR gravada por `lnegc ir`, sem fazer o "
+        "parse dos arquivos .lnegc (apenas com um diretório em --dir)",
+    )
+
     parser.add_argument(
         "--verbose",
         action="store_true",
         help="Exibe informações detalhadas durante o processamento",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Número de processos para carregar os arquivos (0 usa todas as CPUs)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reaproveita os prompts de arquivos inalterados desde a execução anterior",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Não usa o cache de parse em .lnegc/cache",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -64,6 +179,15 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     return parser.parse_args(args)
 
 
+def _open_output(path: str, stdout: IO[str]) -> ContextManager[IO[str]]:
+    """Abre o arquivo de saída dos prompts, ou usa a saída padrão se path for '-'."""
+    if path == "-":
+        return nullcontext(stdout)
+    output_path = Path(path).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return open(output_path, "w", encoding="utf-8")
+
+
 def main(args: Optional[List[str]] = None) -> int:
     """Função principal do CLI.
 
@@ -74,42 +198,108 @@ def main(args: Optional[List[str]] = None) -> int:
     Returns:
         0 em caso de sucesso, outro valor em caso de erro.
     """
+    if args is None:
+        args = sys.argv[1:]
+    if args and args[0] in COMMANDS:
+        return COMMANDS[args[0]](args[1:])
+
     parsed_args = None
+    stdout = sys.stdout
     try:
         # Processar argumentos
         parsed_args = parse_args(args)
 
-        # Verificar diretório
-        base_dir = Path(parsed_args.dir).resolve()
-        if not base_dir.exists():
-            print(f"Erro: Diretório não encontrado: {base_dir}", file=sys.stderr)
-            return 1
+        # Com --output -, a saída padrão recebe apenas os prompts; mensagens vão para stderr
+        if parsed_args.output == "-":
+            sys.stdout = sys.stderr
+
+        # Verificar diretórios
+        base_dirs = [Path(directory).resolve() for directory in parsed_args.dir]
+        for base_dir in base_dirs:
+            if not base_dir.exists():
+                print(f"Erro: Diretório não encontrado: {base_dir}", file=sys.stderr)
+                return 1
+
+            if not base_dir.is_dir():
+                print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+                return 1
 
-        if not base_dir.is_dir():
-            print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
-            return 1
+        # Criar processadores com a linguagem especificada; o cache e os pools de
+        # workers são compartilhados entre as raízes
+        parse_cache = None
+        if not parsed_args.no_cache:
+            parse_cache = ParseCache.for_project(Workspace.cache_root(base_dirs), PARSER_VERSION)
+        workspace = Workspace(
+            base_dirs,
+            parsed_args.language,
+            cache=parse_cache,
+            jobs=parsed_args.jobs,
+            incremental=parsed_args.incremental,
+            layout=parsed_args.layout,
+            budget=parsed_args.budget,
+            tokenizer=parsed_args.tokenizer,
+            shard=parsed_args.shard,
+        )
 
-        # Criar processador com a linguagem especificada
-        processor = LNEGCProcessor(base_dir, parsed_args.language)
+        if parsed_args.from_ir is not None:
+            if len(workspace.roots) > 1:
+                print("Erro: --from-ir aceita apenas um diretório em --dir.", file=sys.stderr)
+                return 1
+            workspace.processors[workspace.roots[0]].load_ir(parsed_args.from_ir)
 
         # Processar arquivos
         if parsed_args.verbose:
+            for processor in workspace.processors.values():
+                if processor.config is not None:
+                    print(f"Carregando configuração de: {processor.config.path}")
             print("Processando arquivos LNEGC...")
 
-        result = processor.process()
-        prompts = processor.process_all()
+        # Salvar prompts à medida que são gerados
+        counts = {"componentes": 0, "entidades": 0, "interfaces": 0, "testes": 0}
+        reused = 0
+        multiple = len(workspace.roots) > 1
+        with workspace, _open_output(parsed_args.output, stdout) as output:
+            if parsed_args.format == "bundle":
+                blocks = {
+                    block
+                    for processor in workspace.processors.values()
+                    for block in processor.templates.reference_blocks()
+                }
+                writer = BundleWriter(output, blocks)
+            elif parsed_args.format == "jsonl":
+                writer = JsonlWriter(output)
+            else:
+                writer = TextWriter(output)
 
-        # Salvar prompts
-        output_path = Path(parsed_args.output).resolve()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text("\n\n".join(prompts), encoding="utf-8")
+            positions = {root: index for index, root in enumerate(workspace.roots)}
+            for root, kind, name, path, prompt in workspace.iter_specs():
+                label = workspace.label(root) if multiple else None
+                index = positions[root] if multiple else None
+                relative = relative_path(path, root)
+                writer.write(kind, str(path), prompt, label, name, index, relative)
+                counts[kind] += 1
+            writer.flush()
+            for processor in workspace.processors.values():
+                if processor.manifest is not None:
+                    reused += processor.manifest.reused
 
         if parsed_args.verbose:
-            print(f"\nProcessamento concluído. Prompts salvos em {output_path}")
-            print(f"Componentes processados: {len(result['componentes'])}")
-            print(f"Entidades processadas: {len(result['entidades'])}")
-            print(f"Interfaces processadas: {len(result['interfaces'])}")
-            print(f"Testes processados: {len(result['testes'])}")
+            destination = (
+                "a saída padrão"
+                if parsed_args.output == "-"
+                else Path(parsed_args.output).resolve()
+            )
+            print(f"\nProcessamento concluído. Prompts salvos em {destination}")
+            if len(workspace.roots) > 1:
+                print(f"Raízes processadas: {len(workspace.roots)}")
+            print(f"Componentes processados: {counts['componentes']}")
+            print(f"Entidades processadas: {counts['entidades']}")
+            print(f"Interfaces processadas: {counts['interfaces']}")
+            print(f"Testes processados: {counts['testes']}")
+            if parsed_args.incremental:
+                print(f"Arquivos inalterados reaproveitados: {reused}")
+            if parse_cache is not None:
+                print(f"Cache de parse: {parse_cache.hits} acertos, {parse_cache.misses} falhas")
 
         return 0
 
@@ -119,6 +309,8 @@ def main(args: Optional[List[str]] = None) -> int:
             import traceback
             traceback.print_exc()
         return 1
+    finally:
+        sys.stdout = stdout
 
 
 if __name__ == "__main__":
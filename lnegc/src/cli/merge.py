@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc merge`: combina as saídas geradas com --shard.
+"""
+
+import argparse
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.output import JsonlWriter, TextWriter
+from lnegc.src.core.shard import merge
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando merge.
+
+    Args:
+        args: Lista de argumentos após `merge`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc merge",
+        description="Combina as saídas dos shards (geradas com --shard i/N --format jsonl) "
+        "na saída de uma execução sem shards",
+    )
+
+    parser.add_argument(
+        "shards",
+        type=str,
+        nargs="+",
+        help="Arquivos JSON Lines gerados por cada shard",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Arquivo de saída para os prompts combinados",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["text", "jsonl"],
+        default="text",
+        help="Formato da saída, como em `lnegc --format`",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando merge.
+
+    Args:
+        args: Lista de argumentos após `merge`.
+
+    Returns:
+        0 em caso de sucesso, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    output_path = Path(parsed_args.output).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with ExitStack() as stack:
+            shards = [
+                stack.enter_context(open(shard, "r", encoding="utf-8"))
+                for shard in parsed_args.shards
+            ]
+            records = list(merge(shards))
+            output = stack.enter_context(open(output_path, "w", encoding="utf-8"))
+            if parsed_args.format == "jsonl":
+                writer = JsonlWriter(output)
+            else:
+                writer = TextWriter(output)
+            for record in records:
+                writer.write(
+                    record["kind"],
+                    record["source"],
+                    record["prompt"],
+                    record.get("root"),
+                    record["name"],
+                    record.get("root_index"),
+                    record.get("relative"),
+                )
+            writer.flush()
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
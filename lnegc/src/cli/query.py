@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc query`: consulta o índice SQLite das especificações do projeto.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.index import ProjectIndex
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+def _pair(text: str) -> Tuple[str, str]:
+    """Converte um argumento 'Chave=valor'."""
+    key, separator, value = text.partition("=")
+    if not separator or not key.strip():
+        raise argparse.ArgumentTypeError(f"Metadado inválido: {text} (use Chave=valor)")
+    return key.strip(), value.strip()
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando query.
+
+    Args:
+        args: Lista de argumentos após `query`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc query",
+        description="Busca especificações no índice em .lnegc/index.sqlite, atualizado "
+        "antes da consulta com os arquivos alterados. Os critérios são combinados.",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        default=".",
+        help="Diretório do projeto (padrão: diretório atual)",
+    )
+
+    parser.add_argument(
+        "--kind",
+        choices=["componentes", "entidades", "interfaces", "testes"],
+        default=None,
+        help="Tipo da especificação",
+    )
+
+    parser.add_argument(
+        "--name",
+        type=str,
+        default=None,
+        help="Nome da especificação",
+    )
+
+    parser.add_argument(
+        "--attribute",
+        type=str,
+        default=None,
+        help="Especificações com um atributo com este nome (como cpf)",
+    )
+
+    parser.add_argument(
+        "--type",
+        dest="attribute_type",
+        type=str,
+        default=None,
+        help="Especificações com um atributo deste tipo (com --attribute, o tipo do "
+        "atributo informado)",
+    )
+
+    parser.add_argument(
+        "--relates-to",
+        type=str,
+        default=None,
+        help="Especificações que citam este nome nos relacionamentos (como Cidade)",
+    )
+
+    parser.add_argument(
+        "--meta",
+        type=_pair,
+        action="append",
+        default=[],
+        metavar="CHAVE=VALOR",
+        help="Metadado da especificação (como Tipo=Utilitário); pode ser repetido",
+    )
+
+    parser.add_argument(
+        "--validation",
+        type=str,
+        default=None,
+        help="Trecho do texto de uma validação ou regra",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="text: tipo, nome e caminho separados por tabulação; json: um objeto por "
+        "linha",
+    )
+
+    parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="Consulta o índice sem verificar os arquivos alterados",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Número de processos para o parse dos arquivos alterados (0 usa todas as CPUs)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Exibe o número de especificações atualizadas no índice",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando query.
+
+    Args:
+        args: Lista de argumentos após `query`.
+
+    Returns:
+        0 se alguma especificação foi encontrada, 1 se nenhuma, 2 em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dir = Path(parsed_args.dir).resolve()
+    if not base_dir.is_dir():
+        print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+        return 2
+
+    stdout = sys.stdout
+    # A saída padrão recebe apenas os resultados; mensagens vão para stderr
+    sys.stdout = sys.stderr
+    try:
+        with ProjectIndex.for_project(base_dir) as index:
+            if not parsed_args.no_update:
+                cache = ParseCache.for_project(base_dir, PARSER_VERSION)
+                processor = LNEGCProcessor(base_dir, cache=cache, jobs=parsed_args.jobs)
+                updated, removed = index.update(processor)
+                if parsed_args.verbose:
+                    print(f"Índice atualizado: {updated} especificações, {removed} removidas")
+
+            rows = index.query(
+                kind=parsed_args.kind,
+                name=parsed_args.name,
+                attribute=parsed_args.attribute,
+                attribute_type=parsed_args.attribute_type,
+                relates_to=parsed_args.relates_to,
+                metadata=parsed_args.meta,
+                validation=parsed_args.validation,
+            )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+    finally:
+        sys.stdout = stdout
+
+    for kind, name, path in rows:
+        relative = os.path.relpath(path, base_dir)
+        if parsed_args.format == "json":
+            record = {"kind": kind, "name": name, "path": relative}
+            print(json.dumps(record, ensure_ascii=False))
+        else:
+            print(f"{kind}\t{name}\t{relative}")
+    return 0 if rows else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
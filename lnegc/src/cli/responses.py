@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc responses`: gerencia o cache de respostas do modelo.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.responses import DEFAULT_MAX_SIZE, ResponseCache
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando responses.
+
+    Args:
+        args: Lista de argumentos após `responses`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc responses",
+        description="Gerencia o cache de respostas do modelo em .lnegc/responses",
+    )
+
+    parser.add_argument(
+        "action",
+        choices=["stats", "pin", "unpin", "evict", "clear"],
+        help="stats exibe o tamanho do cache; pin e unpin fixam ou liberam respostas; "
+        "evict aplica o limite de tamanho; clear remove as respostas não fixadas",
+    )
+
+    parser.add_argument(
+        "keys",
+        nargs="*",
+        help="Chaves das respostas (campo key da saída de lnegc send)",
+    )
+
+    parser.add_argument(
+        "--from",
+        dest="sources",
+        type=str,
+        nargs="+",
+        default=[],
+        help="Arquivos JSON Lines gerados por lnegc send cujas respostas serão fixadas "
+        "ou liberadas",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        default=".",
+        help="Diretório do projeto (padrão: diretório atual)",
+    )
+
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE // (1024 * 1024),
+        help=f"Tamanho máximo em MiB usado por evict "
+        f"(padrão: {DEFAULT_MAX_SIZE // (1024 * 1024)})",
+    )
+
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Com clear, remove também as respostas fixadas",
+    )
+
+    return parser.parse_args(args)
+
+
+def _keys(parsed_args: argparse.Namespace) -> List[str]:
+    """Chaves informadas na linha de comando e nos arquivos de --from."""
+    keys = list(parsed_args.keys)
+    for source in parsed_args.sources:
+        with open(source, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if "key" in record and "error" not in record:
+                        keys.append(record["key"])
+    return keys
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando responses.
+
+    Args:
+        args: Lista de argumentos após `responses`.
+
+    Returns:
+        0 em caso de sucesso, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dir = Path(parsed_args.dir).resolve()
+    if not base_dir.is_dir():
+        print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+        return 1
+
+    responses = ResponseCache.for_project(
+        base_dir, max_size=parsed_args.max_size * 1024 * 1024
+    )
+    action = parsed_args.action
+
+    if action in ("pin", "unpin"):
+        try:
+            keys = _keys(parsed_args)
+        except (OSError, ValueError) as e:
+            print(f"Erro: {e}", file=sys.stderr)
+            return 1
+        if not keys:
+            print("Erro: informe as chaves ou --from.", file=sys.stderr)
+            return 1
+        if action == "unpin":
+            responses.unpin(keys)
+            return 0
+        missing = responses.pin(keys)
+        for key in missing:
+            print(f"Resposta ausente do cache: {key}", file=sys.stderr)
+        print(f"{len(keys) - len(missing)} respostas fixadas.")
+        return 1 if missing else 0
+
+    if action == "evict":
+        print(f"{responses.evict()} respostas removidas.")
+    elif action == "clear":
+        responses.clear(pinned=parsed_args.all)
+    else:
+        entries = responses.entries()
+        size = sum(entry.stat().st_size for entry in entries)
+        print(f"Respostas: {len(entries)}")
+        print(f"Fixadas: {len(responses.pins)}")
+        print(f"Tamanho: {size / (1024 * 1024):.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
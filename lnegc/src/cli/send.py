@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc send`: envia os prompts gerados para um endpoint compatível com a
+API de chat da OpenAI e grava as respostas.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from typing import IO, Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.manifest import text_hash
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.responses import DEFAULT_MAX_SIZE, ResponseCache
+from lnegc.src.core.sender import ChatSender, Completion, iterate_in_executor
+from lnegc.src.core.tokens import DEFAULT_TOKENIZER
+from lnegc.src.core.workspace import Workspace
+
+# URL base padrão da API
+DEFAULT_URL = "https://api.openai.com/v1"
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando send.
+
+    Args:
+        args: Lista de argumentos após `send`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc send",
+        description="Envia os prompts do projeto para o modelo e grava as respostas em "
+        "JSON Lines",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        nargs="+",
+        required=True,
+        help="Diretório contendo os arquivos .lnegc",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Arquivo JSON Lines de saída para as respostas (- para a saída padrão)",
+    )
+
+    parser.add_argument(
+        "--model",
+        type=str,
+        required=True,
+        help="Modelo usado nas requisições",
+    )
+
+    parser.add_argument(
+        "--url",
+        type=str,
+        default=DEFAULT_URL,
+        help=f"URL base da API compatível com a OpenAI (padrão: {DEFAULT_URL})",
+    )
+
+    parser.add_argument(
+        "--api-key-env",
+        type=str,
+        default="OPENAI_API_KEY",
+        help="Variável de ambiente com a chave da API (padrão: OPENAI_API_KEY)",
+    )
+
+    parser.add_argument(
+        "--language",
+        type=str,
+        default=None,
+        help="Linguagem alvo para geração de código",
+    )
+
+    parser.add_argument(
+        "--layout",
+        choices=["padrao", "prefixo"],
+        default="prefixo",
+        help="Layout dos prompts (padrão: prefixo, que aproveita o cache de prefixo do "
+        "provedor)",
+    )
+
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Número máximo de requisições simultâneas (padrão: 8)",
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help="Limite de requisições por minuto",
+    )
+
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        default=None,
+        help="Limite de tokens de prompt por minuto, contados com --tokenizer",
+    )
+
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=5,
+        help="Novas tentativas após falhas temporárias (padrão: 5)",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300.0,
+        help="Tempo máximo de cada requisição em segundos (padrão: 300)",
+    )
+
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=None,
+        help="Temperatura de amostragem",
+    )
+
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="Pede a resposta completa em vez de streaming",
+    )
+
+    parser.add_argument(
+        "--cache-only",
+        action="store_true",
+        help="Não acessa a rede: usa apenas as respostas do cache em .lnegc/responses e "
+        "registra como erro os prompts sem resposta armazenada",
+    )
+
+    parser.add_argument(
+        "--no-response-cache",
+        action="store_true",
+        help="Não consulta nem grava o cache de respostas",
+    )
+
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE // (1024 * 1024),
+        help=f"Tamanho máximo do cache de respostas em MiB, sem contar as respostas "
+        f"fixadas (padrão: {DEFAULT_MAX_SIZE // (1024 * 1024)})",
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Limite de tokens por prompt; todos os prompts são verificados (e divididos, "
+        "se possível) antes da primeira requisição",
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        type=str,
+        default=DEFAULT_TOKENIZER,
+        help=f"Tokenizador usado com --budget e --tpm (padrão: {DEFAULT_TOKENIZER})",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Exibe o andamento do envio",
+    )
+
+    parsed_args = parser.parse_args(args)
+    if parsed_args.cache_only and parsed_args.no_response_cache:
+        # Sem o cache, --cache-only enviaria todos os prompts pela rede
+        parser.error("--cache-only não pode ser usado com --no-response-cache")
+    return parsed_args
+
+
+class _SendRun:
+    """Envio dos prompts de um workspace, com o cache de respostas."""
+
+    def __init__(
+        self,
+        workspace: Workspace,
+        specs: Iterable[Tuple[Path, str, str, Path, str]],
+        sender: ChatSender,
+        output: IO[str],
+        responses: Optional[ResponseCache],
+        cache_only: bool,
+        verbose: bool,
+    ):
+        self.workspace = workspace
+        self.specs = specs
+        self.sender = sender
+        self.output = output
+        self.responses = responses
+        self.cache_only = cache_only
+        self.verbose = verbose
+        self.written = 0
+        self.failed = 0
+        self.cached = 0
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self.output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.output.flush()
+        self.written += 1
+        if "error" in record:
+            self.failed += 1
+            print(f"Erro em {record['source']}: {record['error']}", file=sys.stderr)
+        elif self.verbose:
+            print(f"[{self.written}] {record['source']}", file=sys.stderr)
+
+    async def _prompts(self) -> AsyncIterator[Tuple[Dict[str, Any], str]]:
+        """
+        Gera os prompts que precisam ser enviados.
+
+        Os prompts são gerados no executor (veja iterate_in_executor()); a consulta ao
+        cache de respostas e a gravação da saída ficam no loop de eventos. Prompts com
+        resposta no cache são gravados na saída sem passar pelo envio.
+        """
+        workspace = self.workspace
+        multiple = len(workspace.roots) > 1
+        part = 0
+        previous = None
+        async for root, kind, name, path, prompt in iterate_in_executor(self.specs):
+            # As partes de uma especificação dividida por --budget são consecutivas
+            part = part + 1 if (root, path) == previous else 1
+            previous = (root, path)
+            record = {"kind": kind, "source": str(path), "name": name, "part": part}
+            record["hash"] = text_hash(prompt)
+            if multiple:
+                record["root"] = workspace.label(root)
+
+            if self.responses is not None:
+                language = workspace.processors[root].target_language
+                record["key"] = key = self.responses.key(prompt, language, self.sender.settings)
+                stored = self.responses.get(key)
+                if stored is not None:
+                    self.cached += 1
+                    self._write({**record, **stored, "attempts": 0, "cached": True})
+                    continue
+                if self.cache_only:
+                    self._write({**record, "error": "Resposta ausente do cache (--cache-only)"})
+                    continue
+            yield record, prompt
+
+    async def run(self) -> None:
+        """Envia os prompts e grava cada resposta assim que ela termina."""
+        async for record, completion in self.sender.send_all(self._prompts()):
+            if self.responses is not None and completion.error is None:
+                self.responses.put(record["key"], self._stored(completion))
+            self._write({**record, **completion.to_dict()})
+
+    @staticmethod
+    def _stored(completion: Completion) -> Dict[str, Any]:
+        """Dados da resposta gravados no cache."""
+        data = completion.to_dict()
+        del data["attempts"]
+        return data
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando send.
+
+    Args:
+        args: Lista de argumentos após `send`.
+
+    Returns:
+        0 se todas as respostas foram recebidas, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dirs = [Path(directory).resolve() for directory in parsed_args.dir]
+    for base_dir in base_dirs:
+        if not base_dir.is_dir():
+            print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+            return 1
+
+    stdout = sys.stdout
+    # A saída padrão recebe apenas as respostas; mensagens vão para stderr
+    sys.stdout = sys.stderr
+    try:
+        cache = ParseCache.for_project(Workspace.cache_root(base_dirs), PARSER_VERSION)
+        workspace = Workspace(
+            base_dirs,
+            parsed_args.language,
+            cache=cache,
+            layout=parsed_args.layout,
+            budget=parsed_args.budget,
+            tokenizer=parsed_args.tokenizer,
+        )
+        with workspace:
+            specs = workspace.iter_specs()
+            if parsed_args.budget is not None:
+                # Prompts acima do limite interrompem o envio antes da primeira requisição;
+                # os prompts gerados na verificação são os enviados
+                specs = list(specs)
+
+            sender = ChatSender(
+                parsed_args.url,
+                parsed_args.model,
+                api_key=os.environ.get(parsed_args.api_key_env),
+                concurrency=parsed_args.concurrency,
+                requests_per_minute=parsed_args.rpm,
+                tokens_per_minute=parsed_args.tpm,
+                retries=parsed_args.retries,
+                timeout=parsed_args.timeout,
+                stream=not parsed_args.no_stream,
+                temperature=parsed_args.temperature,
+                count_tokens=next(iter(workspace.processors.values())).count_tokens,
+            )
+            responses = None
+            if not parsed_args.no_response_cache:
+                responses = ResponseCache.for_project(
+                    workspace.cache_root(base_dirs),
+                    max_size=parsed_args.cache_size * 1024 * 1024,
+                )
+
+            if parsed_args.output == "-":
+                output = stdout
+            else:
+                output_path = Path(parsed_args.output).resolve()
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output = open(output_path, "w", encoding="utf-8")
+            try:
+                run = _SendRun(
+                    workspace,
+                    specs,
+                    sender,
+                    output,
+                    responses,
+                    parsed_args.cache_only,
+                    parsed_args.verbose,
+                )
+                asyncio.run(run.run())
+            finally:
+                if output is not stdout:
+                    output.close()
+            if responses is not None:
+                responses.evict()
+    except (OSError, ValueError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sys.stdout = stdout
+
+    if parsed_args.verbose or run.failed:
+        print(
+            f"{run.written - run.failed} respostas ({run.cached} do cache), "
+            f"{run.failed} falhas",
+            file=sys.stderr,
+        )
+    return 1 if run.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc tokens`: relatório de tokens por prompt, sem chamadas ao modelo.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.tokens import DEFAULT_TOKENIZER, TOKENIZERS
+from lnegc.src.core.workspace import Workspace
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando tokens.
+
+    Args:
+        args: Lista de argumentos após `tokens`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc tokens",
+        description="Conta os tokens de cada prompt e identifica os que excedem o limite",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        nargs="+",
+        required=True,
+        help="Diretório contendo os arquivos .lnegc",
+    )
+
+    parser.add_argument(
+        "--language",
+        type=str,
+        default=None,
+        help="Linguagem alvo para geração de código",
+    )
+
+    parser.add_argument(
+        "--layout",
+        choices=["padrao", "prefixo"],
+        default="padrao",
+        help="Layout dos prompts",
+    )
+
+    parser.add_argument(
+        "--tokenizer",
+        type=str,
+        default=DEFAULT_TOKENIZER,
+        help=f"Tokenizador ({', '.join(TOKENIZERS)}; tiktoken aceita "
+        f"tiktoken:<codificação>). Padrão: {DEFAULT_TOKENIZER}",
+    )
+
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="Limite de tokens por prompt; prompts acima dele são marcados e o comando "
+        "termina com erro",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando tokens.
+
+    Args:
+        args: Lista de argumentos após `tokens`.
+
+    Returns:
+        0 se todos os prompts couberem no limite, 1 caso contrário ou em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dirs = [Path(directory).resolve() for directory in parsed_args.dir]
+    for base_dir in base_dirs:
+        if not base_dir.is_dir():
+            print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+            return 1
+
+    try:
+        cache = ParseCache.for_project(Workspace.cache_root(base_dirs), PARSER_VERSION)
+        # Os prompts são contados sem divisão: o relatório mostra o tamanho real de cada um
+        workspace = Workspace(
+            base_dirs,
+            parsed_args.language,
+            cache=cache,
+            layout=parsed_args.layout,
+            tokenizer=parsed_args.tokenizer,
+        )
+        total = oversized = prompts = 0
+        with workspace:
+            for root, kind, path, prompt in workspace.iter_prompts():
+                tokens = workspace.processors[root].count_tokens(prompt)
+                over = parsed_args.budget is not None and tokens > parsed_args.budget
+                mark = "  acima do limite" if over else ""
+                print(f"{tokens:>8}  {kind:<12} {path}{mark}")
+                total += tokens
+                prompts += 1
+                oversized += over
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{total:>8}  total ({prompts} prompts)")
+    if oversized:
+        print(
+            f"{oversized} prompts acima do limite de {parsed_args.budget} tokens; "
+            "use `lnegc --budget` para dividi-los",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Subcomando `lnegc watch`: gera os prompts novamente a cada alteração no projeto.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.watcher import PollingWatcher, WatchSession, create_watcher
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Processa argumentos do subcomando watch.
+
+    Args:
+        args: Lista de argumentos após `watch`.
+
+    Returns:
+        Namespace com os argumentos processados.
+    """
+    parser = argparse.ArgumentParser(
+        prog="lnegc watch",
+        description="Observa o projeto e atualiza os prompts gerados a cada alteração. "
+        "config.lnegc, .lnegcignore e os templates são lidos apenas ao iniciar: após "
+        "alterá-los, reinicie o watch.",
+    )
+
+    parser.add_argument(
+        "--dir",
+        type=str,
+        required=True,
+        help="Diretório contendo os arquivos .lnegc",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        required=True,
+        help="Arquivo de saída para os prompts gerados",
+    )
+
+    parser.add_argument(
+        "--language",
+        type=str,
+        default=None,
+        help="Linguagem alvo para geração de código",
+    )
+
+    parser.add_argument(
+        "--polling",
+        action="store_true",
+        help="Compara varreduras periódicas em vez de usar o inotify",
+    )
+
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Intervalo entre varreduras em segundos, com --polling (padrão: 1.0)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Exibe informações detalhadas durante o processamento",
+    )
+
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """Executa o subcomando watch até ser interrompido.
+
+    Args:
+        args: Lista de argumentos após `watch`.
+
+    Returns:
+        0 ao ser interrompido, outro valor em caso de erro.
+    """
+    parsed_args = parse_args(args)
+
+    base_dir = Path(parsed_args.dir).resolve()
+    if not base_dir.is_dir():
+        print(f"Erro: '{base_dir}' não é um diretório.", file=sys.stderr)
+        return 1
+
+    cache = ParseCache.for_project(base_dir, PARSER_VERSION)
+    processor = LNEGCProcessor(base_dir, parsed_args.language, cache=cache)
+    session = WatchSession(processor, Path(parsed_args.output).resolve())
+    watcher = create_watcher(
+        base_dir,
+        parsed_args.polling,
+        parsed_args.interval,
+        processor.ignore,
+        processor.scan_files,
+    )
+
+    try:
+        session.build()
+        if parsed_args.verbose:
+            mode = "varredura periódica" if isinstance(watcher, PollingWatcher) else "inotify"
+            print(f"Observando {base_dir} ({mode}); Ctrl+C para encerrar.")
+
+        while True:
+            changed = watcher.poll()
+            if not changed:
+                continue
+            updated = session.update(changed)
+            if updated and parsed_args.verbose:
+                print(f"{updated} especificações atualizadas em {session.output}")
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
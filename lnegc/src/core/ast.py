@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Árvore sintática abstrata (AST) dos arquivos LNEGC.
+
+A AST é construída pelo parser a partir dos tokens do lexer e representa o documento
+como um cabeçalho seguido de uma lista de seções.
+"""
+
+from typing import Dict, List, Optional
+
+from .lexer import LIST_ITEM, TEXT, Token
+
+
+class Node:
+    """Nó base da AST."""
+
+    __slots__ = ("type", "children")
+
+    def __init__(self, type: str, children: Optional[List] = None):
+        self.type = type
+        self.children = children or []
+
+
+class Header(Node):
+    """Cabeçalho do documento (comentários e campos antes da primeira seção)."""
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name: str = "", fields: Optional[Dict[str, str]] = None):
+        """
+        Inicializa o cabeçalho.
+
+        Args:
+            name: Título do documento (primeira linha '# ...')
+            fields: Campos 'Chave: valor' encontrados no cabeçalho
+        """
+        super().__init__("header")
+        self.name = name
+        self.fields = fields or {}
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.fields.get("Versão")
+
+    @property
+    def author(self) -> Optional[str]:
+        return self.fields.get("Autor")
+
+    @property
+    def date(self) -> Optional[str]:
+        return self.fields.get("Data")
+
+    @property
+    def domain(self) -> Optional[str]:
+        return self.fields.get("Domínio")
+
+    @property
+    def tags(self) -> List[str]:
+        tags = self.fields.get("Tags")
+        if not tags:
+            return []
+        return [tag.strip() for tag in tags.split(",")]
+
+
+class Section(Node):
+    """Seção do documento ('[NOME]' ou '## Nome') com as linhas do seu conteúdo."""
+
+    __slots__ = ("name", "line")
+
+    def __init__(self, name: str, content: Optional[List[Token]] = None, line: int = 0):
+        """
+        Inicializa a seção.
+
+        Args:
+            name: Nome da seção
+            content: Tokens do conteúdo da seção
+            line: Linha do cabeçalho da seção
+        """
+        super().__init__("section", content)
+        self.name = name
+        self.line = line
+
+    @property
+    def text(self) -> str:
+        """Conteúdo textual da seção, sem espaços nas extremidades."""
+        return "\n".join(token.raw for token in self.children).strip()
+
+    @property
+    def items(self) -> List[str]:
+        """Itens de lista ('- item') de primeiro nível da seção."""
+        return [token.value.strip() for token in self.children if token.type == LIST_ITEM]
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """Pares '- **Chave**: valor' da seção."""
+        metadata = {}
+        for token in self.children:
+            if token.type == LIST_ITEM and token.value.startswith("**") and "**:" in token.value:
+                key, value = token.value[2:].split("**:", 1)
+                metadata[key.strip()] = value.strip()
+        return metadata
+
+    @property
+    def fields(self) -> Dict[str, str]:
+        """Pares 'Chave: valor' em linhas de texto da seção."""
+        fields = {}
+        for token in self.children:
+            if token.type == TEXT and ":" in token.value:
+                key, value = token.value.split(":", 1)
+                fields[key.strip()] = value.strip()
+        return fields
+
+
+class Document(Node):
+    """Documento LNEGC completo."""
+
+    __slots__ = ("header", "sections")
+
+    def __init__(self, header: Header, sections: List[Section]):
+        super().__init__("document", [header] + sections)
+        self.header = header
+        self.sections = sections
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Formato de saída em pacote (bundle).
+
+Os blocos de referência repetidos em muitos prompts (as implementações de referência dos
+templates) são gravados uma única vez, e os prompts passam a conter apenas um marcador com
+o identificador do bloco. O pacote é um arquivo JSON Lines:
+
+    {"type": "header", "format": "lnegc-bundle", "version": 1}
+    {"type": "block", "id": "...", "text": "..."}
+    {"type": "prompt", "kind": "...", "source": "...", "prompt": "...@@LNEGC_BLOCK:...@@..."}
+
+Cada bloco aparece antes do primeiro prompt que o referencia, de modo que o pacote pode ser
+gravado e expandido de forma sequencial. expand() reconstrói os prompts completos.
+"""
+
+import hashlib
+import json
+import re
+from typing import IO, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+# Identificação do formato
+BUNDLE_FORMAT = "lnegc-bundle"
+BUNDLE_VERSION = 1
+
+# Marcador que substitui um bloco no texto do prompt
+MARKER = "@@LNEGC_BLOCK:{}@@"
+MARKER_PATTERN = re.compile(r"@@LNEGC_BLOCK:([0-9a-f]+)@@")
+
+
+def block_id(text: str) -> str:
+    """Identificador de um bloco, derivado do seu conteúdo."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class BundleWriter:
+    """Grava prompts no formato de pacote, com os blocos compartilhados uma única vez."""
+
+    def __init__(self, stream: IO[str], blocks: Iterable[str]):
+        """
+        Inicializa o pacote e grava o cabeçalho.
+
+        Args:
+            stream: Arquivo de saída, aberto em modo texto
+            blocks: Textos dos blocos compartilhados
+        """
+        self.stream = stream
+        # Blocos maiores primeiro, para que um bloco contido em outro não o fragmente
+        self.blocks: Dict[str, str] = {
+            block_id(text): text for text in sorted(set(blocks), key=len, reverse=True) if text
+        }
+        self.written: Set[str] = set()
+        self._write({"type": "header", "format": BUNDLE_FORMAT, "version": BUNDLE_VERSION})
+
+    def _write(self, record: Dict) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False))
+        self.stream.write("\n")
+
+    def write(
+        self,
+        kind: str,
+        source: str,
+        prompt: str,
+        root: Optional[str] = None,
+        name: Optional[str] = None,
+        root_index: Optional[int] = None,
+        relative: Optional[str] = None,
+    ) -> None:
+        """
+        Grava um prompt, substituindo os blocos compartilhados por marcadores.
+
+        Args:
+            kind: Tipo da especificação
+            source: Caminho do arquivo de origem
+            prompt: Prompt completo
+            root: Raiz de origem, quando várias raízes são processadas
+            name: Nome da especificação, se conhecido
+            root_index: Posição da raiz em --dir, quando várias raízes são processadas
+            relative: Caminho do arquivo relativo à raiz, com separadores '/'
+        """
+        for identifier, text in self.blocks.items():
+            if text not in prompt:
+                continue
+            prompt = prompt.replace(text, MARKER.format(identifier))
+            if identifier not in self.written:
+                self.written.add(identifier)
+                self._write({"type": "block", "id": identifier, "text": text})
+
+        record = {"type": "prompt", "kind": kind, "source": source, "prompt": prompt}
+        if root is not None:
+            record["root"] = root
+        if root_index is not None:
+            record["root_index"] = root_index
+        if name is not None:
+            record["name"] = name
+        if relative is not None:
+            record["relative"] = relative
+        self._write(record)
+
+    def flush(self) -> None:
+        """Envia a saída gravada até aqui."""
+        self.stream.flush()
+
+
+def expand(lines: Iterable[str]) -> Iterator[Tuple[Dict, str]]:
+    """
+    Reconstrói os prompts completos de um pacote.
+
+    Args:
+        lines: Linhas do arquivo do pacote
+
+    Yields:
+        Tuplas (registro do prompt, prompt completo)
+
+    Raises:
+        ValueError: Se o arquivo não for um pacote válido ou referenciar um bloco
+                    inexistente
+    """
+    blocks: Dict[str, str] = {}
+    header = False
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not header:
+            if record.get("format") != BUNDLE_FORMAT or record.get("version") != BUNDLE_VERSION:
+                raise ValueError("Arquivo não é um pacote LNEGC compatível")
+            header = True
+        elif record["type"] == "block":
+            blocks[record["id"]] = record["text"]
+        elif record["type"] == "prompt":
+
+            def replace(match: "re.Match") -> str:
+                try:
+                    return blocks[match.group(1)]
+                except KeyError:
+                    raise ValueError(f"Linha {number}: bloco {match.group(1)} não definido")
+
+            yield record, MARKER_PATTERN.sub(replace, record["prompt"])
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cache persistente de resultados do parse.
+
+Os resultados são gravados em .lnegc/cache, indexados pelo hash do conteúdo do arquivo e
+pela versão do parser. Um arquivo que não mudou entre duas execuções é carregado do cache
+sem ser processado novamente. Entradas antigas ou excedentes são removidas por evict().
+
+Seções ainda não decodificadas (LazySections) são gravadas como o texto do arquivo e os
+limites de cada seção, e voltam a ser decodificadas sob demanda.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from .files import write_atomic
+from .lazy import LazySections
+from .model import ParseResult
+
+# Diretório do cache, relativo ao diretório do projeto
+CACHE_DIR = Path(".lnegc") / "cache"
+
+# Limites padrão do cache
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+
+class ParseCache:
+    """Cache em disco de resultados do parse, indexado por hash de conteúdo."""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        version: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """
+        Inicializa o cache.
+
+        Args:
+            root: Diretório onde as entradas são gravadas
+            version: Versão do parser; entradas de outras versões nunca são usadas
+            max_size: Tamanho máximo do cache em bytes
+            max_age: Idade máxima de uma entrada em segundos desde o último uso
+        """
+        self.root = Path(root)
+        self.version = version
+        self.max_size = max_size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        # Entradas gravadas desde a última chamada a evict(); None antes da primeira
+        self._written: Optional[int] = None
+
+    @classmethod
+    def for_project(cls, directory: Union[str, Path], version: str, **kwargs) -> "ParseCache":
+        """Cria o cache no diretório .lnegc/cache de um projeto."""
+        return cls(Path(directory) / CACHE_DIR, version, **kwargs)
+
+    def key(self, content_hash: str) -> str:
+        """
+        Calcula a chave de um conteúdo.
+
+        Args:
+            content_hash: Hash SHA-256 hexadecimal do conteúdo do arquivo, o mesmo
+                          registrado no manifesto (veja read_source)
+
+        Returns:
+            Hash hexadecimal da versão do parser e do conteúdo
+        """
+        digest = hashlib.sha256(self.version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(content_hash.encode("ascii"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ParseResult]:
+        """
+        Busca um resultado no cache.
+
+        Args:
+            key: Chave calculada por key()
+
+        Returns:
+            O resultado armazenado, ou None se não houver entrada válida
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if entry.get("version") != self.version:
+            self.misses += 1
+            return None
+
+        # Atualiza o horário de uso para a política de remoção
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        data = entry["result"]
+        if "source" in entry:
+            data = {**data, "sections": LazySections.from_dict(entry["source"])}
+        return ParseResult.from_dict(data)
+
+    def put(self, key: str, result: ParseResult) -> None:
+        """
+        Grava um resultado no cache.
+
+        Args:
+            key: Chave calculada por key()
+            result: Resultado do parse
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(result.sections, LazySections):
+            entry = {
+                "version": self.version,
+                "result": result.to_dict(sections=False),
+                "source": result.sections.to_dict(),
+            }
+        else:
+            entry = {"version": self.version, "result": result.to_dict()}
+
+        # Leitores nunca veem uma entrada incompleta
+        write_atomic(path, json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+        self.mark_written()
+
+    def mark_written(self, count: int = 1) -> None:
+        """
+        Registra entradas gravadas, para que a próxima chamada a evict() percorra o cache.
+
+        Args:
+            count: Número de entradas gravadas, inclusive por cópias deste cache em outros
+                   processos
+        """
+        if self._written is not None:
+            self._written += count
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        if self.root.exists():
+            shutil.rmtree(self.root)
+
+    def evict(self) -> int:
+        """
+        Remove entradas mais antigas que max_age e, se o cache ainda exceder max_size,
+        as entradas usadas há mais tempo.
+
+        Quando o cache é compartilhado por vários projetos, apenas a primeira chamada e as
+        chamadas após novas gravações percorrem o diretório do cache.
+
+        Returns:
+            Número de entradas removidas
+        """
+        if self._written == 0:
+            return 0
+        self._written = 0
+        if not self.root.exists():
+            return 0
+
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        return removed
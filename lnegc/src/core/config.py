@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Configuração de projetos LNEGC.
+
+O arquivo config.lnegc é localizado e interpretado uma única vez por diretório durante a
+execução. As seções [PROJETO], [CONFIGURAÇÕES], [DIRETÓRIOS] e [EXTENSÕES] são convertidas
+em um ProjectConfig; as demais seções são ignoradas.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .parser import LNEGCParser
+from .scanner import DIRECTORY_KINDS
+
+# Nome do arquivo de configuração
+CONFIG_FILE = "config.lnegc"
+
+
+def config_paths(directory: Union[str, Path]) -> List[Path]:
+    """
+    Caminhos onde o arquivo de configuração é procurado, em ordem de prioridade.
+
+    Args:
+        directory: Diretório do projeto
+
+    Returns:
+        Lista de caminhos candidatos
+    """
+    directory = Path(directory)
+    return [
+        directory / CONFIG_FILE,
+        directory / ".lnegc" / CONFIG_FILE,
+        directory.parent / ".lnegc" / CONFIG_FILE,
+        directory.parent / CONFIG_FILE,
+        directory.parent.parent / ".lnegc" / CONFIG_FILE,
+        directory.parent.parent / CONFIG_FILE,
+    ]
+
+
+class ProjectConfig:
+    """Configuração de um projeto LNEGC."""
+
+    __slots__ = ("path", "project", "settings", "directories", "extensions")
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        project: Optional[Dict[str, str]] = None,
+        settings: Optional[Dict[str, str]] = None,
+        directories: Optional[Dict[str, str]] = None,
+        extensions: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Inicializa a configuração.
+
+        Args:
+            path: Arquivo de onde a configuração foi lida
+            project: Campos da seção [PROJETO]
+            settings: Campos da seção [CONFIGURAÇÕES]
+            directories: Tipo de especificação -> diretório, da seção [DIRETÓRIOS]
+            extensions: Extensão -> descrição, da seção [EXTENSÕES]
+        """
+        self.path = path
+        self.project = project or {}
+        self.settings = settings or {}
+        self.directories = directories or {}
+        self.extensions = extensions or {}
+
+    @classmethod
+    def parse(cls, path: Union[str, Path]) -> "ProjectConfig":
+        """
+        Lê um arquivo de configuração.
+
+        Args:
+            path: Caminho do arquivo config.lnegc
+
+        Returns:
+            A configuração do arquivo
+        """
+        document = LNEGCParser(path).parse_document()
+        config = cls(Path(path))
+        for section in document.sections:
+            name = section.name.upper()
+            if name == "PROJETO":
+                config.project.update(section.fields)
+            elif name == "CONFIGURAÇÕES":
+                config.settings.update(section.fields)
+                # Formato antigo: - **Linguagem**: python
+                config.settings.update(section.metadata)
+            elif name == "DIRETÓRIOS":
+                for key, value in section.fields.items():
+                    kind = DIRECTORY_KINDS.get(key.lower())
+                    if kind is not None and value:
+                        config.directories[kind] = value
+            elif name == "EXTENSÕES":
+                for item in section.items:
+                    extension, _, description = item.partition(":")
+                    config.extensions[extension.strip()] = description.strip()
+        return config
+
+    @property
+    def project_dir(self) -> Optional[Path]:
+        """Diretório do projeto ao qual o arquivo de configuração pertence."""
+        if self.path is None:
+            return None
+        parent = self.path.absolute().parent
+        return parent.parent if parent.name == ".lnegc" else parent
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.project.get("Nome")
+
+    @property
+    def language(self) -> Optional[str]:
+        """Linguagem alvo padrão do projeto, em minúsculas."""
+        language = self.settings.get("Linguagem_Padrão") or self.settings.get("Linguagem")
+        return language.lower() if language else None
+
+    def roots(self, directory: Union[str, Path]) -> List[Tuple[Optional[str], Path]]:
+        """
+        Diretórios a percorrer em busca de especificações.
+
+        Args:
+            directory: Diretório do projeto
+
+        Returns:
+            Tuplas (tipo padrão, diretório). Sem [DIRETÓRIOS], o projeto inteiro é
+            percorrido sem tipo padrão.
+        """
+        directory = Path(directory)
+        # [DIRETÓRIOS] é relativo ao projeto do arquivo de configuração; uma configuração
+        # herdada de um diretório pai não restringe a varredura
+        if not self.directories or self.project_dir != directory.absolute():
+            return [(None, directory)]
+        return [(kind, directory / path) for kind, path in self.directories.items()]
+
+
+@lru_cache(maxsize=None)
+def _load(directory: Path) -> Optional[ProjectConfig]:
+    for path in config_paths(directory):
+        if path.exists():
+            return ProjectConfig.parse(path)
+    return None
+
+
+def load_config(directory: Union[str, Path]) -> Optional[ProjectConfig]:
+    """
+    Localiza e lê a configuração de um projeto.
+
+    O resultado é memorizado por diretório: chamadas seguintes não acessam o disco.
+    Use clear_config_cache() se o arquivo de configuração for alterado.
+
+    Args:
+        directory: Diretório do projeto
+
+    Returns:
+        A configuração do projeto, ou None se nenhum arquivo for encontrado
+    """
+    return _load(Path(directory).absolute())
+
+
+def clear_config_cache() -> None:
+    """Descarta as configurações memorizadas."""
+    _load.cache_clear()
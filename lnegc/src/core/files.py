@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gravação atômica de arquivos.
+
+O conteúdo é gravado em um arquivo temporário no mesmo diretório e renomeado sobre o
+destino: leitores concorrentes (outros processos, ferramentas de build) veem o arquivo
+antigo ou o novo, nunca um arquivo incompleto.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+
+def write_atomic(path: Path, data: Union[str, bytes], mode: Optional[int] = None) -> None:
+    """
+    Grava um arquivo via arquivo temporário e renomeação.
+
+    Args:
+        path: Arquivo de destino; o diretório deve existir
+        data: Conteúdo, como texto (gravado em UTF-8) ou bytes
+        mode: Permissões do arquivo. Se None, as do arquivo temporário (0o600)
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Padrões de exclusão da descoberta de arquivos (.lnegcignore).
+
+O arquivo .lnegcignore, na raiz do projeto, usa a sintaxe do .gitignore: um padrão por
+linha, comentários com #, negação com !, / final para diretórios, / inicial ou interno
+para padrões relativos à raiz, e os curingas *, ?, [...] e **. Os padrões são compilados
+uma única vez e aplicados durante a varredura, de modo que diretórios ignorados nunca são
+percorridos.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Pattern, Tuple, Union
+
+# Nome do arquivo de padrões, na raiz do projeto
+IGNORE_FILE = ".lnegcignore"
+
+# Padrões sempre aplicados antes dos do arquivo (que podem negá-los com !)
+DEFAULT_PATTERNS = (
+    ".*/",
+    "node_modules/",
+    "__pycache__/",
+    "build/",
+    "dist/",
+)
+
+
+def _translate(pattern: str) -> str:
+    """Converte um padrão glob (sem / inicial ou final) em expressão regular."""
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        elif char == "\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return "".join(parts)
+
+
+def compile_pattern(line: str) -> Optional[Tuple[Pattern, bool, bool]]:
+    """
+    Compila uma linha de um arquivo .lnegcignore.
+
+    Args:
+        line: Linha do arquivo
+
+    Returns:
+        Tupla (expressão, negação, apenas diretórios), ou None para linhas vazias e
+        comentários
+    """
+    line = line.rstrip("\n\r")
+    if not line.strip() or line.startswith("#"):
+        return None
+    line = line.rstrip(" ")
+
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+
+    directory_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+
+    # Padrões com / (exceto no fim) são relativos à raiz; os demais valem em qualquer nível
+    anchored = "/" in line
+    line = line.lstrip("/")
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(f"^{prefix}{_translate(line)}$", re.DOTALL), negate, directory_only
+
+
+class IgnoreRules:
+    """Padrões de exclusão compilados de um projeto."""
+
+    def __init__(self, root: Union[str, Path], patterns: Iterable[str] = DEFAULT_PATTERNS):
+        """
+        Compila os padrões.
+
+        Args:
+            root: Diretório ao qual os padrões são relativos
+            patterns: Linhas no formato do .gitignore
+        """
+        self.root = Path(root).absolute()
+        self.rules: List[Tuple[Pattern, bool, bool]] = []
+        for line in patterns:
+            rule = compile_pattern(line)
+            if rule is not None:
+                self.rules.append(rule)
+
+        # Sem negações, basta saber se algum padrão corresponde: uma única expressão
+        # para arquivos e outra para diretórios
+        self._combined: Optional[Tuple[Optional[Pattern], Optional[Pattern]]] = None
+        if not any(negate for _, negate, _ in self.rules):
+            self._combined = (
+                self._join(rule for rule, _, directory_only in self.rules if not directory_only),
+                self._join(rule for rule, _, _ in self.rules),
+            )
+
+    @staticmethod
+    def _join(rules: Iterable[Pattern]) -> Optional[Pattern]:
+        sources = [rule.pattern for rule in rules]
+        if not sources:
+            return None
+        return re.compile("|".join(f"(?:{source})" for source in sources), re.DOTALL)
+
+    @classmethod
+    def for_project(cls, directory: Union[str, Path]) -> "IgnoreRules":
+        """
+        Carrega os padrões padrão e os do arquivo .lnegcignore do projeto, se existir.
+
+        Args:
+            directory: Diretório do projeto
+
+        Returns:
+            Os padrões compilados
+        """
+        patterns = list(DEFAULT_PATTERNS)
+        try:
+            with open(Path(directory) / IGNORE_FILE, "r", encoding="utf-8") as f:
+                patterns.extend(f)
+        except FileNotFoundError:
+            pass
+        return cls(directory, patterns)
+
+    def relative(self, path: Union[str, Path]) -> Optional[str]:
+        """Caminho relativo à raiz, no formato POSIX, ou None se estiver fora dela."""
+        try:
+            relative = Path(path).absolute().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return "" if relative == "." else relative
+
+    def match(self, relative: str, is_dir: bool) -> bool:
+        """
+        Indica se um caminho deve ser ignorado.
+
+        Args:
+            relative: Caminho relativo à raiz, no formato POSIX
+            is_dir: Se o caminho é um diretório
+
+        Returns:
+            True se o último padrão correspondente não for uma negação
+        """
+        if self._combined is not None:
+            rule = self._combined[1 if is_dir else 0]
+            return rule is not None and rule.match(relative) is not None
+
+        for rule, negate, directory_only in reversed(self.rules):
+            if directory_only and not is_dir:
+                continue
+            if rule.match(relative):
+                return not negate
+        return False
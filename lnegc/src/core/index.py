@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Índice SQLite das especificações de um projeto.
+
+O índice em .lnegc/index.sqlite guarda, para cada especificação, o tipo, o nome, os
+metadados, os atributos, as validações e os relacionamentos extraídos pelo parser, em
+tabelas com índices para as consultas de `lnegc query`. update() atualiza apenas os
+arquivos criados, alterados ou removidos desde a atualização anterior, identificados pelo
+horário de modificação e pelo tamanho de cada arquivo.
+"""
+
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from .model import ParseResult
+from .parser import PARSER_VERSION
+
+if TYPE_CHECKING:
+    from .processor import LNEGCProcessor
+
+# Arquivo do índice, relativo ao diretório do projeto
+INDEX_FILE = Path(".lnegc") / "index.sqlite"
+
+# Versão do esquema; índices de outras versões são reconstruídos
+INDEX_VERSION = 1
+
+# Seções de onde vêm os itens de cada tabela: a seção de lista do parser ('## Atributos')
+# ou, se ela não existir, as seções de declaração equivalentes ('[ATRIBUTOS]')
+INDEX_SECTIONS = {
+    "attributes": ("ATRIBUTOS",),
+    "validations": ("VALIDAÇÕES", "REGRAS"),
+    "relationships": ("RELACIONAMENTOS",),
+}
+
+# Atributo no formato 'nome: tipo (observações)'
+_ATTRIBUTE = re.compile(r"^[`*]*([\w.]+)[`*]*\s*:\s*([^\s(,;]+)?")
+
+# Palavras iniciadas por maiúscula em um relacionamento, candidatas a nome de especificação
+_TARGET = re.compile(r"\b[A-ZÀ-Ý][\wÀ-ÿ]*")
+
+# Palavras iniciadas por maiúscula que não são nomes de especificações
+_NOT_TARGETS = frozenset(("Um", "Uma", "Uns", "Umas", "O", "A", "Os", "As", "Cada", "N"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS specs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    name TEXT COLLATE NOCASE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    spec_id INTEGER NOT NULL REFERENCES specs(id) ON DELETE CASCADE,
+    key TEXT NOT NULL COLLATE NOCASE,
+    value TEXT COLLATE NOCASE
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    spec_id INTEGER NOT NULL REFERENCES specs(id) ON DELETE CASCADE,
+    name TEXT COLLATE NOCASE,
+    type TEXT COLLATE NOCASE,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS validations (
+    spec_id INTEGER NOT NULL REFERENCES specs(id) ON DELETE CASCADE,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS relationships (
+    spec_id INTEGER NOT NULL REFERENCES specs(id) ON DELETE CASCADE,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS targets (
+    spec_id INTEGER NOT NULL REFERENCES specs(id) ON DELETE CASCADE,
+    target TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS specs_kind ON specs(kind, name);
+CREATE INDEX IF NOT EXISTS specs_name ON specs(name);
+CREATE INDEX IF NOT EXISTS metadata_key ON metadata(key, value);
+CREATE INDEX IF NOT EXISTS metadata_spec ON metadata(spec_id);
+CREATE INDEX IF NOT EXISTS attributes_name ON attributes(name, type);
+CREATE INDEX IF NOT EXISTS attributes_spec ON attributes(spec_id);
+CREATE INDEX IF NOT EXISTS validations_spec ON validations(spec_id);
+CREATE INDEX IF NOT EXISTS relationships_spec ON relationships(spec_id);
+CREATE INDEX IF NOT EXISTS targets_target ON targets(target);
+CREATE INDEX IF NOT EXISTS targets_spec ON targets(spec_id);
+"""
+
+
+def _section_items(text: str) -> List[str]:
+    """Itens de lista de primeiro nível do texto de uma seção."""
+    return [line[2:].strip() for line in text.splitlines() if line.startswith(("- ", "* "))]
+
+
+def index_items(result: ParseResult, attr: str) -> List[str]:
+    """
+    Itens de uma tabela do índice (attributes, validations ou relationships).
+
+    Args:
+        result: Resultado do parse
+        attr: Nome da tabela
+
+    Returns:
+        Os itens da seção de lista do parser ou, se ela estiver vazia, das seções de
+        INDEX_SECTIONS
+    """
+    items = getattr(result, attr)
+    if items:
+        return list(items)
+    items = []
+    for name in INDEX_SECTIONS[attr]:
+        if name in result.sections:
+            items.extend(_section_items(result.sections[name]))
+    return items
+
+
+def relationship_targets(text: str, name: Optional[str] = None) -> List[str]:
+    """
+    Possíveis nomes de especificações citados em um relacionamento.
+
+    Args:
+        text: Texto do relacionamento, como 'Um Cliente pertence a uma Cidade (N:1)'
+        name: Nome da própria especificação, que não é incluído
+
+    Returns:
+        As palavras iniciadas por maiúscula, sem repetições
+    """
+    targets = dict.fromkeys(
+        word for word in _TARGET.findall(text) if word not in _NOT_TARGETS and word != name
+    )
+    return list(targets)
+
+
+class ProjectIndex:
+    """Índice SQLite das especificações de um projeto, atualizado incrementalmente."""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Abre o índice, criando-o se necessário.
+
+        Args:
+            path: Arquivo do banco SQLite
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self._check_version()
+
+    @classmethod
+    def for_project(cls, directory: Union[str, Path]) -> "ProjectIndex":
+        """Abre o índice em .lnegc/index.sqlite de um projeto."""
+        return cls(Path(directory) / INDEX_FILE)
+
+    def _check_version(self) -> None:
+        """Recria o índice se ele foi gerado com outro esquema ou outra versão do parser."""
+        connection = self.connection
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        parser = None
+        if version == INDEX_VERSION:
+            row = connection.execute("SELECT value FROM info WHERE key = 'parser'").fetchone()
+            parser = row[0] if row else None
+        if version == INDEX_VERSION and parser == PARSER_VERSION:
+            return
+        with connection:
+            tables = [row[0] for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )]
+            for table in tables:
+                connection.execute(f'DROP TABLE "{table}"')
+            connection.executescript(_SCHEMA)
+            connection.execute(
+                "INSERT INTO info (key, value) VALUES ('parser', ?)", (PARSER_VERSION,)
+            )
+            connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self.connection.close()
+
+    def __enter__(self) -> "ProjectIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(self, processor: "LNEGCProcessor") -> Tuple[int, int]:
+        """
+        Atualiza o índice com as especificações do projeto.
+
+        Apenas os arquivos novos ou cujo horário de modificação, tamanho ou tipo mudou
+        passam pelo parse (com o cache de parse e os workers do processador).
+
+        Args:
+            processor: Processador do projeto
+
+        Returns:
+            Tupla (especificações indexadas novamente, especificações removidas)
+        """
+        connection = self.connection
+        stored = {
+            path: (spec_id, kind, mtime_ns, size)
+            for spec_id, path, kind, mtime_ns, size in connection.execute(
+                "SELECT id, path, kind, mtime_ns, size FROM specs"
+            )
+        }
+
+        changed: List[Tuple[str, Path]] = []
+        stats: Dict[str, os.stat_result] = {}
+        current = set()
+        for kind, file in processor.scan_files():
+            path = str(file)
+            current.add(path)
+            try:
+                stat = os.stat(file)
+            except FileNotFoundError:
+                continue
+            entry = stored.get(path)
+            if entry is None or entry[1:] != (kind, stat.st_mtime_ns, stat.st_size):
+                changed.append((kind, file))
+                stats[path] = stat
+
+        stale = [
+            (entry[0],)
+            for path, entry in stored.items()
+            if path not in current or path in stats
+        ]
+        with connection:
+            connection.executemany("DELETE FROM specs WHERE id = ?", stale)
+            for (kind, file), result in zip(changed, processor._iter_results(changed)):
+                with result:
+                    self._insert(kind, str(file), stats[str(file)], result, processor)
+        removed = len(stale) - sum(1 for path in stats if path in stored)
+        return len(changed), removed
+
+    def _insert(
+        self,
+        kind: str,
+        path: str,
+        stat: os.stat_result,
+        result: ParseResult,
+        processor: "LNEGCProcessor",
+    ) -> None:
+        """Grava uma especificação e os seus itens."""
+        connection = self.connection
+        name = result.metadata.get("Nome") or processor._dedup_name(kind, result)
+        spec_id = connection.execute(
+            "INSERT INTO specs (path, kind, name, mtime_ns, size) VALUES (?, ?, ?, ?, ?)",
+            (path, kind, name, stat.st_mtime_ns, stat.st_size),
+        ).lastrowid
+
+        connection.executemany(
+            "INSERT INTO metadata (spec_id, key, value) VALUES (?, ?, ?)",
+            [(spec_id, key, value) for key, value in result.metadata.items()],
+        )
+        attributes = []
+        for text in index_items(result, "attributes"):
+            match = _ATTRIBUTE.match(text)
+            attribute, type_ = match.groups() if match else (None, None)
+            attributes.append((spec_id, attribute, type_, text))
+        connection.executemany(
+            "INSERT INTO attributes (spec_id, name, type, text) VALUES (?, ?, ?, ?)",
+            attributes,
+        )
+        connection.executemany(
+            "INSERT INTO validations (spec_id, text) VALUES (?, ?)",
+            [(spec_id, text) for text in index_items(result, "validations")],
+        )
+        relationships = index_items(result, "relationships")
+        connection.executemany(
+            "INSERT INTO relationships (spec_id, text) VALUES (?, ?)",
+            [(spec_id, text) for text in relationships],
+        )
+        connection.executemany(
+            "INSERT INTO targets (spec_id, target) VALUES (?, ?)",
+            [
+                (spec_id, target)
+                for text in relationships
+                for target in relationship_targets(text, name)
+            ],
+        )
+
+    def query(
+        self,
+        kind: Optional[str] = None,
+        name: Optional[str] = None,
+        attribute: Optional[str] = None,
+        attribute_type: Optional[str] = None,
+        relates_to: Optional[str] = None,
+        metadata: Optional[Iterable[Tuple[str, str]]] = None,
+        validation: Optional[str] = None,
+    ) -> List[Tuple[str, str, str]]:
+        """
+        Busca especificações. Os critérios informados são combinados (todos devem valer).
+
+        Args:
+            kind: Tipo da especificação
+            name: Nome da especificação
+            attribute: Nome de um atributo
+            attribute_type: Tipo de um atributo (com attribute, o tipo desse atributo)
+            relates_to: Especificação citada nos relacionamentos (aceita o plural com s
+                        ou es, como em 'vários Pedidos')
+            metadata: Pares (chave, valor) de metadados
+            validation: Trecho do texto de uma validação (sem uso de índice)
+
+        Returns:
+            Tuplas (tipo, nome, caminho), ordenadas pelo caminho
+        """
+        conditions = []
+        params: List[str] = []
+        if kind is not None:
+            conditions.append("kind = ?")
+            params.append(kind)
+        if name is not None:
+            conditions.append("name = ?")
+            params.append(name)
+        if attribute is not None or attribute_type is not None:
+            clauses = []
+            if attribute is not None:
+                clauses.append("name = ?")
+                params.append(attribute)
+            if attribute_type is not None:
+                clauses.append("type = ?")
+                params.append(attribute_type)
+            conditions.append(
+                f"id IN (SELECT spec_id FROM attributes WHERE {' AND '.join(clauses)})"
+            )
+        if relates_to is not None:
+            conditions.append("id IN (SELECT spec_id FROM targets WHERE target IN (?, ?, ?))")
+            params.extend((relates_to, relates_to + "s", relates_to + "es"))
+        for key, value in metadata or ():
+            conditions.append(
+                "id IN (SELECT spec_id FROM metadata WHERE key = ? AND value = ?)"
+            )
+            params.extend((key, value))
+        if validation is not None:
+            conditions.append(
+                "id IN (SELECT spec_id FROM validations WHERE text LIKE ? ESCAPE '\\')"
+            )
+            escaped = re.sub(r"([\\%_])", r"\\\1", validation)
+            params.append(f"%{escaped}%")
+
+        sql = "SELECT kind, name, path FROM specs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY path"
+        return [tuple(row) for row in self.connection.execute(sql, params)]
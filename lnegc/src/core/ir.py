@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Representação intermediária (IR) de um projeto LNEGC.
+
+A IR contém o resultado do parse e da análise de todas as especificações do projeto
+(metadados, seções, atributos, relacionamentos e demais seções de lista), a especificação
+selecionada para cada nome e os problemas encontrados na validação. Ela é gravada em JSON
+ou, com o pacote opcional msgpack (pip install lnegc[msgpack]), em MessagePack, e pode ser
+carregada por outras ferramentas ou pelo próprio processador no lugar do parse.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Union
+
+from .model import ParseResult
+from .parser import PARSER_VERSION, LNEGCParser
+from .session import ParsedFiles
+
+if TYPE_CHECKING:
+    from .processor import LNEGCProcessor
+
+# Identificação e versão do formato; versões diferentes não são carregadas
+IR_FORMAT = "lnegc-ir"
+IR_VERSION = 1
+
+# Formatos de gravação
+IR_ENCODINGS = ("json", "msgpack")
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError:
+        raise ValueError(
+            "O formato msgpack requer o pacote msgpack (pip install lnegc[msgpack])"
+        ) from None
+    return msgpack
+
+
+def build(processor: "LNEGCProcessor") -> Dict[str, Any]:
+    """
+    Monta a IR de um projeto.
+
+    Args:
+        processor: Processador do projeto
+
+    Returns:
+        A IR como dicionário, com caminhos relativos ao diretório do projeto
+    """
+    session = processor.session
+    parsed = session.parse()
+    selected = {
+        path for paths in session.analyze().values() for path in paths.values()
+    }
+    directory = processor.directory
+
+    def relative(path: Union[str, Path]) -> str:
+        return Path(os.path.relpath(path, directory)).as_posix()
+
+    specs = []
+    for kind, file in parsed.files:
+        path = str(file)
+        # Em modo incremental, os arquivos inalterados não passam pelo parse da sessão
+        result = parsed.results.get(path)
+        if result is None:
+            with LNEGCParser(file, cache=processor.cache).parse() as result:
+                data = result.to_dict()
+        else:
+            data = result.to_dict()
+        specs.append(
+            {
+                "kind": kind,
+                "path": relative(path),
+                "name": processor._dedup_name(kind, result),
+                "selected": path in selected,
+                **data,
+            }
+        )
+
+    config = processor.config
+    return {
+        "format": IR_FORMAT,
+        "version": IR_VERSION,
+        "parser": PARSER_VERSION,
+        "project": {
+            "name": config.name if config is not None else None,
+            "language": processor.target_language,
+            "directories": dict(config.directories) if config is not None else {},
+        },
+        "specs": specs,
+        "problems": [
+            {"path": relative(path), "message": message}
+            for path, message in session.validate()
+        ],
+    }
+
+
+def dumps(ir: Dict[str, Any], encoding: str = "json") -> bytes:
+    """
+    Serializa a IR.
+
+    Args:
+        ir: IR montada por build()
+        encoding: json ou msgpack
+
+    Returns:
+        A IR serializada
+
+    Raises:
+        ValueError: Se o formato for desconhecido ou o msgpack não estiver instalado
+    """
+    if encoding == "json":
+        return json.dumps(ir, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if encoding == "msgpack":
+        return _msgpack().packb(ir, use_bin_type=True)
+    raise ValueError(f"Formato de IR desconhecido: {encoding}")
+
+
+def loads(data: bytes) -> Dict[str, Any]:
+    """
+    Lê uma IR serializada em JSON ou msgpack (detectado pelo conteúdo).
+
+    Args:
+        data: IR serializada
+
+    Returns:
+        A IR como dicionário
+
+    Raises:
+        ValueError: Se os dados não forem uma IR desta versão
+    """
+    if data.lstrip()[:1] == b"{":
+        ir = json.loads(data.decode("utf-8"))
+    else:
+        ir = _msgpack().unpackb(data, raw=False)
+    if not isinstance(ir, dict) or ir.get("format") != IR_FORMAT:
+        raise ValueError("Os dados não são uma IR LNEGC")
+    if ir.get("version") != IR_VERSION:
+        raise ValueError(
+            f"Versão da IR não suportada: {ir.get('version')} (esperada: {IR_VERSION})"
+        )
+    return ir
+
+
+def to_parsed(ir: Dict[str, Any], directory: Union[str, Path]) -> ParsedFiles:
+    """
+    Converte a IR no resultado da etapa de parsing de um processador.
+
+    Args:
+        ir: IR lida por loads()
+        directory: Diretório do projeto, ao qual os caminhos da IR são relativos
+
+    Returns:
+        Os arquivos e resultados do parse descritos na IR
+    """
+    directory = Path(directory)
+    files = []
+    results: Dict[str, ParseResult] = {}
+    for spec in ir["specs"]:
+        file = directory / spec["path"]
+        files.append((spec["kind"], file))
+        results[str(file)] = ParseResult.from_dict(spec, str(file))
+    return ParsedFiles(files, {}, results)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Seções materializadas sob demanda.
+
+O parser registra apenas os limites de cada seção ao percorrer o arquivo. O texto de uma
+seção só é montado quando a chave correspondente é lida pela primeira vez, de modo que
+seções nunca usadas pelos templates (como [IMPLEMENTAÇÃO]) quase não têm custo.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .ast import Section
+from .lexer import COMMENT, Lexer
+
+# (nome, linha do cabeçalho, início do conteúdo, fim do conteúdo)
+Span = Tuple[str, int, int, int]
+
+
+def decode(buffer, start: int, end: int) -> str:
+    """Decodifica um trecho de um buffer de bytes sem copiá-lo antes da decodificação."""
+    with memoryview(buffer)[start:end] as view:
+        return str(view, "utf-8").replace("\r\n", "\n")
+
+
+def scan_sections(source) -> List[Span]:
+    """
+    Localiza os cabeçalhos de seção do conteúdo de um arquivo.
+
+    Apenas as linhas de cabeçalho são lidas como texto; blocos de código são ignorados.
+
+    Args:
+        source: Conteúdo do arquivo, como str ou como buffer de bytes (bytes, mmap)
+
+    Returns:
+        Lista de seções no formato (nome, linha, início do conteúdo, fim do conteúdo)
+    """
+    if isinstance(source, str):
+        newline, fence, bracket, hashes = "\n", "```", "[", "## "
+    else:
+        newline, fence, bracket, hashes = b"\n", b"```", b"[", b"## "
+
+    spans: List[Span] = []
+    size = len(source)
+    position = 0
+    line = 1
+    in_fence = False
+
+    while position < size:
+        end = source.find(newline, position)
+        if end == -1:
+            end = size
+        prefix = source[position:min(position + 3, end)]
+        if prefix == fence:
+            in_fence = not in_fence
+        elif not in_fence and (prefix[:1] == bracket or prefix == hashes):
+            if isinstance(source, str):
+                header = source[position:end]
+            else:
+                header = decode(source, position, end)
+            if header.startswith("["):
+                name = header[1:].strip().rstrip("]")
+            else:
+                name = header[3:].strip()
+            if spans:
+                previous = spans[-1]
+                spans[-1] = (previous[0], previous[1], previous[2], position)
+            spans.append((name, line, end + 1, size))
+        position = end + 1
+        line += 1
+
+    return spans
+
+
+class LazySections(Mapping):
+    """Mapeamento nome da seção -> texto, montado no primeiro acesso a cada chave."""
+
+    def __init__(self, source, spans: List[Span] = None):
+        """
+        Inicializa o mapeamento.
+
+        Args:
+            source: Conteúdo do arquivo
+            spans: Seções encontradas por scan_sections. Se None, o conteúdo é percorrido.
+        """
+        self._source = source
+        if spans is None:
+            spans = scan_sections(source)
+        # Seções repetidas: a última ocorrência prevalece
+        self._spans: Dict[str, Tuple[int, int, int]] = {}
+        for name, line, start, end in spans:
+            self._spans[sys.intern(name)] = (line, start, end)
+        self._texts: Dict[str, str] = {}
+
+    def _slice(self, start: int, end: int) -> str:
+        """Retorna o trecho (início, fim) do conteúdo como texto."""
+        return self._source[start:end]
+
+    def section(self, name: str) -> Section:
+        """Constrói o nó da AST de uma seção."""
+        line, start, end = self._spans[name]
+        lexer = Lexer(self._slice(start, end))
+        lexer.line = line + 1
+        return Section(name, [t for t in lexer if t.type != COMMENT], line)
+
+    def span(self, name: str) -> Tuple[int, int]:
+        """Retorna os offsets do conteúdo de uma seção."""
+        _, start, end = self._spans[name]
+        return start, end
+
+    def detach(self) -> "LazySections":
+        """Retorna seções equivalentes que têm o conteúdo como texto (veja MappedSections)."""
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte as seções para o formato gravado pelo cache de parse.
+
+        Apenas o conteúdo do arquivo e os limites das seções são gravados; nenhuma seção
+        é decodificada.
+        """
+        sections = self.detach()
+        return {
+            "text": sections._source,
+            "spans": [[name, *span] for name, span in sections._spans.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LazySections":
+        """Reconstrói as seções a partir do formato de to_dict()."""
+        return cls(data["text"], [tuple(span) for span in data["spans"]])
+
+    def __getitem__(self, name: str) -> str:
+        text = self._texts.get(name)
+        if text is None:
+            if name not in self._spans:
+                raise KeyError(name)
+            text = self._texts[name] = self.section(name).text
+        return text
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._spans
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._spans)!r})"
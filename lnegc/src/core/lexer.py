@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lexer para arquivos LNEGC.
+
+O lexer percorre o texto de um arquivo .lnegc uma única vez, linha a linha, e classifica
+cada linha em um token com sua posição (linha e coluna). O parser consome esses tokens
+para construir a AST do documento sem precisar reprocessar o texto.
+"""
+
+from typing import Iterator, List
+
+# Tipos de token
+SECTION = "SECTION"
+COMMENT = "COMMENT"
+LIST_ITEM = "LIST_ITEM"
+FENCE = "FENCE"
+TEXT = "TEXT"
+EOF = "EOF"
+
+
+class Token:
+    """Token produzido pelo lexer."""
+
+    __slots__ = ("type", "value", "line", "column")
+
+    def __init__(self, type: str, value: str, line: int, column: int):
+        """
+        Inicializa o token.
+
+        Args:
+            type: Tipo do token (SECTION, COMMENT, LIST_ITEM, FENCE, TEXT ou EOF)
+            value: Valor do token, sem o marcador da linha
+            line: Linha onde o token começa (a partir de 1)
+            column: Coluna onde o valor começa (a partir de 1)
+        """
+        self.type = type
+        self.value = value
+        self.line = line
+        self.column = column
+
+    @property
+    def raw(self) -> str:
+        """Reconstrói a linha original do token, incluindo o marcador."""
+        if self.type == LIST_ITEM:
+            return "- " + self.value
+        if self.type == COMMENT:
+            return "# " + self.value
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"Token({self.type}, {self.value!r}, {self.line}:{self.column})"
+
+
+class Lexer:
+    """Lexer de passagem única para arquivos LNEGC."""
+
+    def __init__(self, source: str):
+        """
+        Inicializa o lexer.
+
+        Args:
+            source: Conteúdo do arquivo .lnegc
+        """
+        self.source = source
+        self.position = 0
+        self.line = 1
+        self.column = 1
+        self._in_fence = False
+
+    def next_token(self) -> Token:
+        """
+        Lê a próxima linha do texto e retorna o token correspondente.
+
+        Returns:
+            O próximo token, ou um token EOF ao fim do texto
+        """
+        source = self.source
+        if self.position > len(source):
+            return Token(EOF, "", self.line, 1)
+
+        end = source.find("\n", self.position)
+        if end == -1:
+            end = len(source)
+        line = source[self.position:end]
+        line_number = self.line
+        self.position = end + 1
+        self.line += 1
+
+        # Dentro de blocos de código nada é interpretado, exceto o fechamento do bloco
+        if self._in_fence:
+            if line.startswith("```"):
+                self._in_fence = False
+                return Token(FENCE, line, line_number, 1)
+            return Token(TEXT, line, line_number, 1)
+
+        if line.startswith("```"):
+            self._in_fence = True
+            return Token(FENCE, line, line_number, 1)
+        if line.startswith("["):
+            return Token(SECTION, line[1:].strip().rstrip("]"), line_number, 2)
+        if line.startswith("## "):
+            return Token(SECTION, line[3:].strip(), line_number, 4)
+        if line.startswith("# "):
+            return Token(COMMENT, line[2:], line_number, 3)
+        if line.startswith("- "):
+            return Token(LIST_ITEM, line[2:], line_number, 3)
+        return Token(TEXT, line, line_number, 1)
+
+    def __iter__(self) -> Iterator[Token]:
+        """Itera sobre os tokens do texto, sem incluir o EOF."""
+        while True:
+            token = self.next_token()
+            if token.type == EOF:
+                return
+            yield token
+
+    def tokenize(self) -> List[Token]:
+        """
+        Tokeniza todo o texto.
+
+        Returns:
+            Lista de tokens, terminada por um token EOF
+        """
+        tokens = list(self)
+        tokens.append(Token(EOF, "", self.line, 1))
+        return tokens
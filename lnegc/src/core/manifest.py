@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Manifesto de build incremental.
+
+O manifesto registra, para cada especificação processada, o caminho, o mtime, o tamanho,
+o hash do conteúdo e o hash do prompt gerado. Em uma nova execução, arquivos que não mudaram
+não são lidos nem processados: o prompt gerado anteriormente é reaproveitado.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from .files import write_atomic
+from .model import Stamp
+
+# Diretório do manifesto, relativo ao diretório do projeto
+BUILD_DIR = Path(".lnegc") / "build"
+
+# Versão do formato do manifesto
+MANIFEST_VERSION = 1
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """Calcula o hash do conteúdo de um arquivo."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """Calcula o hash de um texto."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ManifestEntry:
+    """Registro de uma especificação no manifesto."""
+
+    __slots__ = ("kind", "mtime_ns", "size", "hash", "name", "prompt")
+
+    def __init__(
+        self,
+        kind: str,
+        mtime_ns: int,
+        size: int,
+        hash: str,
+        name: str,
+        prompt: Optional[str] = None,
+    ):
+        """
+        Inicializa o registro.
+
+        Args:
+            kind: Tipo da especificação (componentes, entidades, interfaces ou testes)
+            mtime_ns: Horário de modificação do arquivo em nanossegundos
+            size: Tamanho do arquivo em bytes
+            hash: Hash do conteúdo do arquivo
+            name: Nome usado para remover especificações duplicadas
+            prompt: Hash do prompt gerado, ou None se nenhum prompt foi gerado
+        """
+        self.kind = kind
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.hash = hash
+        self.name = name
+        self.prompt = prompt
+
+    def to_dict(self) -> Dict:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class Manifest:
+    """Manifesto dos arquivos processados e dos prompts gerados."""
+
+    def __init__(self, directory: Union[str, Path], render_key: str):
+        """
+        Inicializa o manifesto de um projeto.
+
+        Args:
+            directory: Diretório do projeto
+            render_key: Identifica parser, templates e linguagem alvo. Prompts gerados
+                        com outra chave nunca são reaproveitados.
+        """
+        self.directory = Path(directory)
+        self.root = self.directory / BUILD_DIR
+        self.path = self.root / "manifest.json"
+        self.render_key = render_key
+        self.entries: Dict[str, ManifestEntry] = {}
+        self.reused = 0
+
+    def load(self) -> "Manifest":
+        """Carrega o manifesto da execução anterior, se for compatível."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+
+        if data.get("version") != MANIFEST_VERSION or data.get("render_key") != self.render_key:
+            return self
+
+        self.entries = {
+            path: ManifestEntry(**entry) for path, entry in data.get("files", {}).items()
+        }
+        return self
+
+    def _relative(self, file: Union[str, Path]) -> str:
+        return Path(file).relative_to(self.directory).as_posix()
+
+    def get(self, file: Union[str, Path]) -> Optional[ManifestEntry]:
+        """Retorna o registro de um arquivo, se houver."""
+        return self.entries.get(self._relative(file))
+
+    def unchanged(self, files: Iterable[Tuple[str, Path]]) -> Dict[str, ManifestEntry]:
+        """
+        Identifica os arquivos que não mudaram desde a execução anterior.
+
+        Arquivos com mtime e tamanho iguais aos registrados são considerados inalterados
+        sem leitura. Se apenas o mtime mudou, o hash do conteúdo é comparado.
+
+        Args:
+            files: Tuplas (tipo, caminho) encontradas pelo scanner
+
+        Returns:
+            Mapeamento caminho do arquivo -> registro, para os arquivos inalterados
+        """
+        unchanged: Dict[str, ManifestEntry] = {}
+        for kind, file in files:
+            entry = self.get(file)
+            if entry is None or entry.kind != kind:
+                continue
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            if stat.st_size != entry.size:
+                continue
+            if stat.st_mtime_ns != entry.mtime_ns:
+                if file_hash(file) != entry.hash:
+                    continue
+                entry.mtime_ns = stat.st_mtime_ns
+            unchanged[str(file)] = entry
+
+        self.reused = len(unchanged)
+        return unchanged
+
+    def record(
+        self, kind: str, file: Union[str, Path], name: str, stamp: Stamp
+    ) -> ManifestEntry:
+        """
+        Registra um arquivo processado nesta execução.
+
+        Args:
+            kind: Tipo da especificação
+            file: Caminho do arquivo
+            name: Nome usado para remover especificações duplicadas
+            stamp: Estado do arquivo quando foi lido pelo parser (ParseResult.stamp). O
+                   arquivo não é lido novamente: uma alteração posterior ao parse não é
+                   registrada como processada.
+
+        Returns:
+            O registro criado
+        """
+        mtime_ns, size, content_hash = stamp
+        entry = ManifestEntry(kind, mtime_ns, size, content_hash, name)
+        self.entries[self._relative(file)] = entry
+        return entry
+
+    def _prompt_path(self, prompt_hash: str) -> Path:
+        return self.root / "prompts" / f"{prompt_hash}.txt"
+
+    def prompt(self, entry: ManifestEntry) -> Optional[str]:
+        """Retorna o prompt gerado anteriormente para um registro, se existir."""
+        if entry.prompt is None:
+            return None
+        try:
+            return self._prompt_path(entry.prompt).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def store_prompt(self, entry: ManifestEntry, prompt: str) -> None:
+        """Armazena o prompt gerado para um registro."""
+        entry.prompt = text_hash(prompt)
+        path = self._prompt_path(entry.prompt)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, prompt)
+
+    def save(self, files: Iterable[Tuple[str, Path]]) -> None:
+        """
+        Grava o manifesto com os arquivos desta execução.
+
+        Registros de arquivos removidos e prompts não referenciados são descartados.
+
+        Args:
+            files: Tuplas (tipo, caminho) encontradas pelo scanner
+        """
+        present = {self._relative(file) for _, file in files}
+        self.entries = {path: entry for path, entry in self.entries.items() if path in present}
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MANIFEST_VERSION,
+            "render_key": self.render_key,
+            "files": {path: entry.to_dict() for path, entry in sorted(self.entries.items())},
+        }
+        write_atomic(self.path, json.dumps(data, ensure_ascii=False, indent=1))
+
+        referenced = {entry.prompt for entry in self.entries.values()}
+        prompts_dir = self.root / "prompts"
+        if prompts_dir.exists():
+            for path in prompts_dir.glob("*.txt"):
+                if path.stem not in referenced:
+                    path.unlink(missing_ok=True)
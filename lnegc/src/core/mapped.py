@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Acesso mapeado em memória (mmap) a arquivos LNEGC grandes.
+
+No modo mapeado o parser percorre apenas os bytes do arquivo em busca dos cabeçalhos de
+seção e registra os limites de cada seção como offsets no arquivo. O conteúdo de uma seção
+só é decodificado quando acessado, de modo que blocos grandes como [IMPLEMENTAÇÃO] não
+custam nada se nunca forem lidos.
+"""
+
+import mmap
+from typing import Union
+
+from .lazy import LazySections, decode
+
+Buffer = Union[mmap.mmap, bytes]
+
+# Tamanho a partir do qual o parser usa o modo mapeado automaticamente
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def map_file(file_path) -> Buffer:
+    """
+    Mapeia um arquivo em memória para leitura.
+
+    O mapeamento mantém um descritor de arquivo aberto até ser fechado: resultados do
+    parse no modo mapeado devem ser fechados (ParseResult.close()) quando não forem mais
+    usados.
+
+    Args:
+        file_path: Caminho do arquivo
+
+    Returns:
+        O mapeamento do arquivo, ou bytes vazios para arquivos vazios
+    """
+    with open(file_path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Arquivos vazios não podem ser mapeados
+            return b""
+
+
+def unmap(buffer: Buffer) -> None:
+    """Libera um mapeamento criado por map_file()."""
+    if isinstance(buffer, mmap.mmap):
+        buffer.close()
+
+
+class MappedSections(LazySections):
+    """Seções de um arquivo mapeado, decodificadas sob demanda a partir dos offsets."""
+
+    def _slice(self, start: int, end: int) -> str:
+        return decode(self._source, start, end)
+
+    def detach(self) -> LazySections:
+        """Decodifica o arquivo de uma só vez em seções que não dependem do mapeamento."""
+        sections = LazySections(decode(self._source, 0, len(self._source)))
+        sections._texts.update(self._texts)
+        return sections
+
+    def close(self) -> None:
+        """Libera o mapeamento do arquivo."""
+        unmap(self._source)
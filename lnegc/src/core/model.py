@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Modelo de dados do resultado do parse de arquivos LNEGC.
+
+Os resultados usam __slots__ e internam nomes de seções e chaves de metadados, que se
+repetem em todos os arquivos de um projeto, para manter baixo o uso de memória quando
+o processador mantém o projeto inteiro carregado.
+"""
+
+import sys
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+# Seções de lista extraídas para atributos próprios do resultado
+LIST_SECTIONS = (
+    ("attributes", "Atributos"),
+    ("validations", "Validações"),
+    ("relationships", "Relacionamentos"),
+    ("methods", "Métodos"),
+    ("indexes", "Índices"),
+    ("permissions", "Permissões"),
+    ("auditoria", "Auditoria"),
+)
+
+# Seções de declaração cujos campos 'Chave: valor' são metadados do arquivo
+DECLARATION_SECTIONS = frozenset(
+    ("COMPONENTE", "ENTIDADE", "INTERFACE", "TESTE", "PROJETO")
+)
+
+
+# Estado do arquivo de origem lido pelo parser: (mtime em ns, tamanho, hash do conteúdo)
+Stamp = Tuple[int, int, str]
+
+
+def intern_keys(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Retorna um dicionário com as mesmas entradas e chaves internadas."""
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
+class ParseResult:
+    """Resultado do parse de um arquivo .lnegc."""
+
+    __slots__ = (
+        "path",
+        "stamp",
+        "metadata",
+        "sections",
+        "attributes",
+        "validations",
+        "relationships",
+        "methods",
+        "indexes",
+        "permissions",
+        "auditoria",
+    )
+
+    def __init__(
+        self,
+        metadata: Optional[Dict[str, str]] = None,
+        sections: Optional[Mapping[str, str]] = None,
+        path: Optional[str] = None,
+        **lists: List[str],
+    ):
+        """
+        Inicializa o resultado.
+
+        Args:
+            metadata: Metadados do arquivo
+            sections: Conteúdo textual de cada seção. Mapeamentos que não são dict
+                      (como LazySections) são mantidos sem materialização.
+            path: Caminho do arquivo de origem
+            **lists: Itens das seções de lista (attributes, validations, ...)
+        """
+        self.path = path
+        # Preenchido pelo parser; não faz parte do formato de dicionário
+        self.stamp: Optional[Stamp] = None
+        self.metadata = intern_keys(metadata or {})
+        if sections is None or isinstance(sections, dict):
+            sections = intern_keys(sections or {})
+        self.sections = sections
+        for attr, _ in LIST_SECTIONS:
+            setattr(self, attr, lists.get(attr) or [])
+
+    def __getitem__(self, key: str) -> Any:
+        """Permite o acesso no formato de dicionário usado pelas versões anteriores."""
+        if key in ("path", "stamp") or key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Equivalente a dict.get para compatibilidade."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def close(self) -> None:
+        """
+        Libera o arquivo mapeado em memória das seções, se houver (veja core.mapped).
+
+        Seções ainda não lidas deixam de estar disponíveis. O resultado também pode ser
+        usado como gerenciador de contexto, que o fecha ao final do bloco.
+        """
+        close = getattr(self.sections, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "ParseResult":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def to_dict(self, sections: bool = True) -> Dict[str, Any]:
+        """
+        Converte o resultado para o formato de dicionário.
+
+        Args:
+            sections: Se False, o texto das seções não é incluído
+        """
+        result: Dict[str, Any] = {"metadata": dict(self.metadata)}
+        if sections:
+            result["sections"] = dict(self.sections)
+        for attr, _ in LIST_SECTIONS:
+            result[attr] = list(getattr(self, attr))
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], path: Optional[str] = None) -> "ParseResult":
+        """Reconstrói o resultado a partir do formato de dicionário."""
+        lists = {attr: data.get(attr) or [] for attr, _ in LIST_SECTIONS}
+        return cls(data.get("metadata"), data.get("sections"), path, **lists)
+
+    def __repr__(self) -> str:
+        return f"ParseResult(path={self.path!r}, sections={list(self.sections)!r})"
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gravação dos prompts gerados.
+
+Todos os formatos de saída implementam write(kind, source, prompt, root, name,
+root_index, relative) e flush() e gravam cada prompt assim que ele é recebido, sem manter
+a saída inteira em memória.
+"""
+
+import json
+from typing import IO, List, Optional
+
+from .manifest import text_hash
+
+# Número de registros JSON Lines acumulados antes de cada gravação
+JSONL_CHUNK = 64
+
+
+class TextWriter:
+    """Grava os prompts completos, separados por uma linha em branco."""
+
+    def __init__(self, stream: IO[str]):
+        """
+        Inicializa a saída.
+
+        Args:
+            stream: Arquivo de saída, aberto em modo texto
+        """
+        self.stream = stream
+        self.count = 0
+
+    def write(
+        self,
+        kind: str,
+        source: str,
+        prompt: str,
+        root: Optional[str] = None,
+        name: Optional[str] = None,
+        root_index: Optional[int] = None,
+        relative: Optional[str] = None,
+    ) -> None:
+        """
+        Grava um prompt.
+
+        Args:
+            kind: Tipo da especificação
+            source: Caminho do arquivo de origem
+            prompt: Prompt completo
+            root: Raiz de origem, quando várias raízes são processadas
+            name: Nome da especificação, se conhecido
+            root_index: Posição da raiz em --dir, quando várias raízes são processadas
+            relative: Caminho do arquivo relativo à raiz, com separadores '/'
+        """
+        if self.count:
+            self.stream.write("\n\n")
+        # Com várias raízes, cada prompt indica o projeto de origem
+        if root is not None:
+            self.stream.write(f"# Raiz: {root}\n\n")
+        self.stream.write(prompt)
+        self.count += 1
+
+    def flush(self) -> None:
+        """Envia a saída gravada até aqui."""
+        self.stream.flush()
+
+
+class JsonlWriter:
+    """
+    Grava um objeto JSON por linha, com o tipo, o arquivo de origem, o hash e o prompt
+    (e a raiz e o nome da especificação, se informados).
+
+    As linhas são gravadas em blocos de chunk registros, e a saída é enviada (flush) a
+    cada bloco, para que consumidores lendo de um pipe recebam os prompts à medida que
+    são gerados.
+    """
+
+    def __init__(self, stream: IO[str], chunk: int = JSONL_CHUNK):
+        """
+        Inicializa a saída.
+
+        Args:
+            stream: Arquivo de saída, aberto em modo texto
+            chunk: Número de registros por gravação
+        """
+        self.stream = stream
+        self.chunk = max(chunk, 1)
+        self.count = 0
+        self._pending: List[str] = []
+
+    def write(
+        self,
+        kind: str,
+        source: str,
+        prompt: str,
+        root: Optional[str] = None,
+        name: Optional[str] = None,
+        root_index: Optional[int] = None,
+        relative: Optional[str] = None,
+    ) -> None:
+        """
+        Grava um prompt.
+
+        Args:
+            kind: Tipo da especificação
+            source: Caminho do arquivo de origem
+            prompt: Prompt completo
+            root: Raiz de origem, quando várias raízes são processadas
+            name: Nome da especificação, se conhecido
+            root_index: Posição da raiz em --dir, quando várias raízes são processadas
+            relative: Caminho do arquivo relativo à raiz, com separadores '/'
+        """
+        record = {"kind": kind, "source": source, "hash": text_hash(prompt)}
+        if root is not None:
+            record["root"] = root
+        if root_index is not None:
+            record["root_index"] = root_index
+        if name is not None:
+            record["name"] = name
+        if relative is not None:
+            record["relative"] = relative
+        record["prompt"] = prompt
+        self._pending.append(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+        if len(self._pending) >= self.chunk:
+            self.flush()
+
+    def flush(self) -> None:
+        """Grava os registros pendentes e envia a saída."""
+        if self._pending:
+            self.stream.write("".join(self._pending))
+            self._pending.clear()
+        self.stream.flush()
@@ -9,129 +9,211 @@ O parser é responsável por ler arquivos .lnegc e extrair suas informações em
 que pode ser usado para gerar código através de sistemas de IA.
 """
 
-import re
+import hashlib
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Collection, Dict, List, Mapping, Optional, Tuple
+
+from .ast import Document, Header, Section
+from .cache import ParseCache
+from .lexer import COMMENT, SECTION, Lexer, Token
+from .lazy import LazySections, decode
+from .mapped import MMAP_THRESHOLD, Buffer, MappedSections, map_file, unmap
+from .model import DECLARATION_SECTIONS, LIST_SECTIONS, ParseResult, Stamp
+
+# Versão do formato de resultado do parser. Deve ser incrementada sempre que o
+# resultado de parse() mudar, para invalidar o cache persistente.
+PARSER_VERSION = "1"
+
+
+def read_source(file_path: Path) -> Tuple[str, Stamp]:
+    """
+    Lê um arquivo .lnegc.
+
+    O stat é obtido antes da leitura: uma alteração feita durante o processamento muda o
+    mtime e é detectada na execução seguinte (veja Manifest.unchanged).
+
+    Args:
+        file_path: Caminho do arquivo
+
+    Returns:
+        O conteúdo do arquivo e o seu estado (mtime, tamanho e hash dos bytes lidos)
+    """
+    with open(file_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+    # Mesma conversão de fins de linha da leitura em modo texto
+    content = data.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, (stat.st_mtime_ns, stat.st_size, hashlib.sha256(data).hexdigest())
 
 
 class LNEGCParser:
     """Parser para arquivos LNEGC."""
 
-    def __init__(self, file_path: Path):
+    def __init__(
+        self,
+        file_path: Path,
+        mmap_mode: Optional[bool] = None,
+        cache: Optional[ParseCache] = None,
+        content: Optional[str] = None,
+        stamp: Optional[Stamp] = None,
+    ):
         """
         Inicializa o parser LNEGC.
 
         Args:
             file_path: Caminho para o arquivo .lnegc a ser processado
+            mmap_mode: Se True, mapeia o arquivo em memória e decodifica as seções
+                       apenas quando acessadas. Se None, usa o modo mapeado para
+                       arquivos a partir de MMAP_THRESHOLD bytes.
+            cache: Cache de resultados consultado antes do parse
+            content: Conteúdo do arquivo, se já tiver sido lido. Nesse caso o arquivo
+                     não é lido novamente e o modo mapeado não é usado.
+            stamp: Estado do arquivo quando content foi lido (veja read_source)
         """
         self.file_path = file_path
-        self.content = self._read_file()
-
-    def _read_file(self) -> str:
-        """Lê o conteúdo do arquivo."""
-        with open(self.file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-
-    def parse(self) -> dict:
-        """Parse o arquivo .lnegc e retorna um dicionário com as informações."""
-        sections = self._parse_sections()
-        metadata = self._parse_metadata(sections.get('Metadados', ''))
-        
-        return {
-            'metadata': metadata,
-            'attributes': self._parse_list_items(sections.get('Atributos', '')),
-            'validations': self._parse_list_items(sections.get('Validações', '')),
-            'relationships': self._parse_list_items(sections.get('Relacionamentos', '')),
-            'methods': self._parse_list_items(sections.get('Métodos', '')),
-            'indexes': self._parse_list_items(sections.get('Índices', '')),
-            'permissions': self._parse_list_items(sections.get('Permissões', '')),
-            'auditoria': self._parse_list_items(sections.get('Auditoria', ''))
-        }
-
-    def _parse_sections(self) -> dict:
-        """Parse as seções do arquivo."""
-        sections = {}
-        current_section = None
-        current_content = []
-
-        for line in self.content.split('\n'):
-            if line.startswith('## '):
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content)
-                current_section = line[3:].strip()
-                current_content = []
-            elif current_section:
-                current_content.append(line)
+        self.cache = cache
+        # Estado do arquivo lido, registrado nos resultados (veja ParseResult.stamp)
+        self.stamp = stamp
+        self._buffer: Optional[Buffer] = None
+        if content is not None:
+            mmap_mode = False
+        elif mmap_mode is None:
+            mmap_mode = os.path.getsize(file_path) >= MMAP_THRESHOLD
+        if mmap_mode:
+            stat = os.stat(file_path)
+            self._buffer = map_file(file_path)
+            self.content: Optional[str] = None
+            digest = hashlib.sha256(self._buffer).hexdigest()
+            self.stamp = (stat.st_mtime_ns, stat.st_size, digest)
+        elif content is None:
+            self.content, self.stamp = read_source(file_path)
+        else:
+            self.content = content
+
+        self.cache_key: Optional[str] = None
+        if cache is not None:
+            if self.stamp is not None:
+                digest = self.stamp[2]
+            else:
+                digest = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+            self.cache_key = cache.key(digest)
+
+    def parse(self) -> ParseResult:
+        """
+        Parse o arquivo .lnegc e retorna o resultado estruturado.
 
-        if current_section:
-            sections[current_section] = '\n'.join(current_content)
+        Apenas os limites das seções são registrados de imediato: o texto de cada seção
+        é montado no primeiro acesso a result.sections[nome]. As seções de declaração,
+        de metadados e de listas são lidas para preencher os demais campos.
 
-        return sections
+        Com cache, um arquivo de conteúdo já conhecido é carregado do cache, e um
+        resultado novo é gravado nele; no modo mapeado o arquivo é então decodificado de uma
+        só vez e o mapeamento liberado. Sem cache, um resultado do modo mapeado mantém o
+        arquivo mapeado até ser fechado (veja ParseResult.close()).
+        """
+        cached = self.from_cache()
+        if cached is not None:
+            return cached
+
+        if self._buffer is not None:
+            sections: LazySections = MappedSections(self._buffer)
+        else:
+            sections = LazySections(self.content)
+        result = self._build_result(sections, sections.section, sections)
+        result.stamp = self.stamp
+
+        if self.cache is not None:
+            detached = sections.detach()
+            result.close()
+            result.sections = detached
+            self.cache.put(self.cache_key, result)
+        return result
+
+    def from_cache(self) -> Optional[ParseResult]:
+        """
+        Busca o resultado deste arquivo no cache, sem fazer o parse.
 
-    def _parse_metadata(self, content: str = None) -> dict:
+        Returns:
+            O resultado armazenado, ou None se não houver cache ou entrada válida
+        """
+        if self.cache is None:
+            return None
+        cached = self.cache.get(self.cache_key)
+        if cached is not None:
+            cached.path = str(self.file_path)
+            cached.stamp = self.stamp
+            # O resultado do cache não usa o arquivo mapeado
+            if self._buffer is not None:
+                unmap(self._buffer)
+                self._buffer = None
+        return cached
+
+    def _build_result(
+        self,
+        names: Collection[str],
+        section: Callable[[str], Section],
+        texts: Mapping[str, str],
+    ) -> ParseResult:
         """
-        Parse os metadados da entidade.
-        
+        Monta o resultado a partir das seções do documento.
+
         Args:
-            content: Conteúdo da seção de metadados. Se None, usa o conteúdo do arquivo.
+            names: Nomes das seções presentes no documento
+            section: Função que retorna o nó da AST de uma seção
+            texts: Mapeamento nome da seção -> texto
         """
-        metadata = {}
-        text = content if content is not None else self.content
-        
-        for line in text.split('\n'):
-            if line.startswith('- **'):
-                key, value = line[4:].split('**:', 1)
-                metadata[key.strip()] = value.strip()
-        return metadata
-
-    def _parse_list_items(self, content: str) -> List[str]:
-        """Parse itens de lista do conteúdo."""
-        items = []
-        for line in content.split('\n'):
-            if line.startswith('- '):
-                items.append(line[2:].strip())
-        return items
-
-    def _parse_sections(self) -> Dict[str, str]:
+        metadata: Dict[str, str] = {}
+        for name in names:
+            if name in DECLARATION_SECTIONS:
+                metadata.update(section(name).fields)
+        if 'Metadados' in names:
+            metadata.update(section('Metadados').metadata)
+
+        lists = {
+            attr: section(name).items if name in names else []
+            for attr, name in LIST_SECTIONS
+        }
+
+        return ParseResult(metadata, texts, str(self.file_path), **lists)
+
+    def parse_document(self) -> Document:
         """
-        Extrai as seções do arquivo LNEGC.
+        Constrói a AST do arquivo em uma única passagem pelos tokens do lexer.
 
         Returns:
-            Dict contendo as seções do arquivo
+            Documento com o cabeçalho e as seções do arquivo
         """
-        sections = {}
-        current_section = None
-        current_content = []
-        in_section = False
-
-        if not self.content:
-            return sections
-
-        for line in self.content.split('\n'):
-            if line.startswith("["):
-                # Se já estávamos em uma seção, salvamos seu conteúdo
-                if current_section:
-                    sections[current_section] = "\n".join(current_content).strip()
-                    current_content = []
-                
-                # Inicia nova seção
-                current_section = line[1:].strip().rstrip("]")
-                in_section = True
-            elif line.startswith("## "):
-                # Se já estávamos em uma seção, salvamos seu conteúdo
-                if current_section:
-                    sections[current_section] = "\n".join(current_content).strip()
-                    current_content = []
-                
-                # Inicia nova seção
-                current_section = line[3:].strip()
-                in_section = True
-            elif in_section and not line.startswith("# "):
-                # Adiciona linha ao conteúdo da seção atual
-                current_content.append(line)
-
-        # Salva a última seção
-        if current_section:
-            sections[current_section] = "\n".join(current_content).strip()
-
-        return sections 
\ No newline at end of file
+        header = Header()
+        document_sections: List[Section] = []
+        current: Optional[Section] = None
+
+        source = self.content
+        if source is None:
+            source = decode(self._buffer, 0, len(self._buffer))
+
+        for token in Lexer(source):
+            if token.type == SECTION:
+                current = Section(token.value, line=token.line)
+                document_sections.append(current)
+            elif current is not None:
+                # Comentários fora de blocos de código não fazem parte do conteúdo
+                if token.type != COMMENT:
+                    current.children.append(token)
+            else:
+                self._parse_header_line(header, token)
+
+        return Document(header, document_sections)
+
+    def _parse_header_line(self, header: Header, token: Token) -> None:
+        """Registra uma linha anterior à primeira seção no cabeçalho."""
+        text = token.value.strip()
+        if not text:
+            return
+        if ':' in text:
+            key, value = text.split(':', 1)
+            header.fields[key.strip()] = value.strip()
+        elif token.type == COMMENT and not header.name:
+            header.name = text
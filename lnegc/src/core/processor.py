@@ -10,16 +10,138 @@ enviados para sistemas de IA para geração de código.
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import ir
+from .cache import ParseCache
+from .config import ProjectConfig, load_config
+from .ignore import IgnoreRules
+from .lazy import LazySections
+from .manifest import Manifest, ManifestEntry
+from .model import ParseResult
+from .parser import PARSER_VERSION, LNEGCParser, read_source
+from .scanner import kind_of, scan
+from .session import ProcessingSession
+from .shard import relative_path, shard_of
+from .templates import LAYOUTS, TemplateEngine
+from .tokens import DEFAULT_TOKENIZER, get_tokenizer, split
+
+# Versão dos templates de prompt. Deve ser incrementada sempre que o texto gerado
+# mudar, para que builds incrementais não reaproveitem prompts antigos.
+PROMPTS_VERSION = "1"
+
+# Nome usado quando a especificação não define 'nome' nos metadados
+DEFAULT_NAMES = {
+    "componentes": "Componente",
+    "entidades": "Entidade",
+    "interfaces": "Interface",
+    "testes": "Teste",
+}
+
+# Separa as partes de uma especificação dividida no prompt armazenado no manifesto
+PART_SEPARATOR = "\x1e"
+
+
+def select_unique(specs: Iterable[Tuple[str, str, str]]) -> Dict[str, Dict[str, str]]:
+    """
+    Seleciona uma especificação por nome em cada tipo: a última, na posição dela.
+
+    A especificação selecionada ocupa a sua própria posição na ordem de specs, e não a
+    da primeira de mesmo nome, o que permite combinar as saídas de shards (veja
+    shard.merge).
+
+    Args:
+        specs: Tuplas (tipo, nome, valor), na ordem da varredura
+
+    Returns:
+        Mapeamento tipo -> nome -> valor
+    """
+    unique: Dict[str, Dict[str, str]] = {kind: {} for kind in DEFAULT_NAMES}
+    for kind, name, value in specs:
+        unique[kind].pop(name, None)
+        unique[kind][name] = value
+    return unique
+
 
-from .parser import LNEGCParser
+def _parse_content(
+    item: Tuple[Path, str, Optional[ParseCache], Optional[str]]
+) -> Tuple[Dict[str, Any], List[list]]:
+    """
+    Faz o parse de um arquivo já lido e grava o resultado no cache (executado no pool de
+    processos).
+
+    O texto do arquivo não volta ao processo principal, que já o tem: o resultado é
+    devolvido sem as seções, apenas com os limites de cada uma.
+
+    Returns:
+        O resultado sem as seções (veja ParseResult.to_dict) e os limites das seções
+    """
+    file, content, cache, key = item
+    result = LNEGCParser(file, content=content).parse()
+    if cache is not None:
+        cache.put(key, result)
+    return result.to_dict(sections=False), result.sections.to_dict()["spans"]
+
+
+class WorkerPools:
+    """Pools de threads (leitura) e de processos (parse), criados sob demanda."""
+
+    def __init__(self, jobs: int):
+        """
+        Inicializa os pools.
+
+        Args:
+            jobs: Número de workers de cada pool
+        """
+        self.jobs = jobs
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def threads(self) -> ThreadPoolExecutor:
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.jobs)
+        return self._threads
+
+    @property
+    def processes(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(max_workers=self.jobs)
+        return self._processes
+
+    def close(self) -> None:
+        """Encerra os pools criados."""
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown()
+        self._threads = self._processes = None
+
+    def __enter__(self) -> "WorkerPools":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class LNEGCProcessor:
     """Processador para arquivos LNEGC."""
 
-    def __init__(self, directory: Union[str, Path], target_language: str = None):
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        target_language: str = None,
+        cache: Optional[ParseCache] = None,
+        jobs: int = 1,
+        incremental: bool = False,
+        pools: Optional[WorkerPools] = None,
+        templates: Optional[TemplateEngine] = None,
+        layout: str = "padrao",
+        budget: Optional[int] = None,
+        tokenizer: str = DEFAULT_TOKENIZER,
+        shard: Optional[Tuple[int, int]] = None,
+    ):
         """
         Inicializa o processador LNEGC.
 
@@ -27,630 +149,513 @@ class LNEGCProcessor:
             directory: Diretório contendo os arquivos .lnegc
             target_language: Linguagem alvo para geração de código.
                            Se None, usa a linguagem definida no arquivo de configuração.
+            cache: Cache persistente de resultados do parse. Se None, todos os arquivos
+                   são processados a cada execução.
+            jobs: Número de processos usados para carregar os arquivos. Valores menores
+                  que 1 usam o número de CPUs disponíveis.
+            incremental: Se True, mantém um manifesto em .lnegc/build e reaproveita os
+                         prompts de arquivos que não mudaram desde a execução anterior.
+            pools: Pools de workers compartilhados entre processadores. Se None, pools
+                   temporários são criados a cada carregamento paralelo.
+            templates: Templates dos prompts. Se None, usa os templates do pacote e os
+                       de .lnegc/templates do projeto.
+            layout: Layout dos prompts. "prefixo" coloca as instruções fixas e os blocos
+                    de referência antes do conteúdo da especificação.
+            budget: Limite de tokens por prompt. Especificações cujo prompt excede o
+                    limite são divididas em várias partes. Se None, não há limite.
+            tokenizer: Nome do tokenizador usado para contar os tokens (veja tokens.py)
+            shard: Tupla (i, N): processa apenas as especificações do i-ésimo de N shards,
+                   escolhidas por um hash estável do caminho relativo. Se None, processa
+                   todas.
+
+        Raises:
+            ValueError: Se o layout, o tokenizador ou o shard forem inválidos
         """
+        if layout not in LAYOUTS:
+            raise ValueError(f"Layout desconhecido: {layout}")
+        if shard is not None and not 1 <= shard[0] <= shard[1]:
+            raise ValueError(f"Shard inválido: {shard[0]}/{shard[1]}")
         self.directory = Path(directory)
-        self._config: Optional[Dict] = None
-        self._components: List[Dict] = []
-        self._entities: List[Dict] = []
-        self._interfaces: List[Dict] = []
-        self._tests: List[Dict] = []
-        self.target_language = target_language or 'python'  # Define python como padrão inicial
-        
-        # Carrega a configuração automaticamente se o diretório existir
-        if self.directory.exists():
-            try:
-                self._load_config()
-            except FileNotFoundError:
-                # Se não encontrar o arquivo de configuração, mantém as configurações padrão
-                pass
-
-    def _load_config(self) -> None:
-        """Carrega o arquivo de configuração do projeto."""
-        config_paths = [
-            self.directory / "config.lnegc",
-            self.directory / ".lnegc" / "config.lnegc",
-            Path(self.directory).parent / ".lnegc" / "config.lnegc",
-            Path(self.directory).parent / "config.lnegc",
-            Path(self.directory).parent.parent / ".lnegc" / "config.lnegc",
-            Path(self.directory).parent.parent / "config.lnegc"
-        ]
-
-        config_file = None
-        for path in config_paths:
-            if path.exists():
-                print(f"Carregando configuração de: {path}")
-                config_file = path
-                break
-
-        if not config_file:
-            paths_str = "\n".join(str(p) for p in config_paths)
-            raise FileNotFoundError(
-                f"Arquivo de configuração não encontrado. Tentei os seguintes caminhos:\n{paths_str}"
-            )
+        self.cache = cache
+        self.jobs = jobs if jobs >= 1 else (os.cpu_count() or 1)
+        self.incremental = incremental
+        self.pools = pools
+        self.manifest: Optional[Manifest] = None
+        self._components: List[ParseResult] = []
+        self._entities: List[ParseResult] = []
+        self._interfaces: List[ParseResult] = []
+        self._tests: List[ParseResult] = []
+
+        # A configuração é lida uma única vez por diretório; a linguagem informada
+        # explicitamente tem precedência sobre a do arquivo de configuração
+        self.config: Optional[ProjectConfig] = self._load_config()
+        config_language = self.config.language if self.config is not None else None
+        self.target_language = target_language or config_language or 'python'
+
+        # Padrões de exclusão compilados uma única vez e aplicados durante a varredura
+        self.ignore = IgnoreRules.for_project(self.directory)
+
+        # Templates compilados uma única vez e compartilhados por todos os prompts
+        self.templates = templates or TemplateEngine.for_project(self.directory)
+        self.layout = layout
+
+        # Orçamento de tokens verificado localmente, antes de qualquer envio ao modelo
+        self.budget = budget
+        self.tokenizer = tokenizer
+        self.count_tokens = get_tokenizer(tokenizer)
+        self.shard = shard
+
+        # Resultados memorizados das etapas de processamento
+        self.session = ProcessingSession(self)
+
+    def _load_config(self) -> Optional[ProjectConfig]:
+        """Carrega a configuração do projeto, se houver (memorizada por diretório)."""
+        if not self.directory.exists():
+            return None
+        return load_config(self.directory)
+
+    def scan_files(self) -> List[Tuple[str, Path]]:
+        """
+        Encontra as especificações do projeto.
 
-        # Lê o arquivo de configuração
-        with open(config_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Procura a linguagem nas configurações
-        for line in content.split('\n'):
-            if '**Linguagem**:' in line:
-                self.target_language = line.split(':')[1].strip().lower()
-                break
-
-    def _load_files(self) -> None:
-        """Carrega todos os arquivos .lnegc do projeto."""
-        # Carrega componentes
-        components_dir = self.directory
-        if components_dir.exists():
-            for file in components_dir.glob("**/*.lnegc"):
-                if "componentes" in str(file) or "components" in str(file):
-                    parser = LNEGCParser(file)
-                    self._components.append(parser.parse())
-
-        # Carrega entidades
-        entities_dir = self.directory
-        if entities_dir.exists():
-            for file in entities_dir.glob("**/*.lnegc"):
-                if "entidades" in str(file) or "entities" in str(file):
-                    parser = LNEGCParser(file)
-                    self._entities.append(parser.parse())
-
-        # Carrega interfaces
-        interfaces_dir = self.directory
-        if interfaces_dir.exists():
-            for file in interfaces_dir.glob("**/*.lnegc"):
-                if "interfaces" in str(file):
-                    parser = LNEGCParser(file)
-                    self._interfaces.append(parser.parse())
-
-        # Carrega testes
-        tests_dir = self.directory
-        if tests_dir.exists():
-            for file in tests_dir.glob("**/*.lnegc"):
-                if "testes" in str(file) or "tests" in str(file):
-                    parser = LNEGCParser(file)
-                    self._tests.append(parser.parse())
-
-    def _generate_component_prompt(self, component: Dict) -> str:
+        Se a configuração tiver uma seção [DIRETÓRIOS], apenas esses diretórios são
+        percorridos; caso contrário, todo o diretório do projeto. Caminhos excluídos pelo
+        .lnegcignore não são percorridos. Com shard, apenas os arquivos do shard são
+        retornados.
+
+        Returns:
+            Tuplas (tipo, caminho) sem arquivos repetidos, ordenadas pelo caminho para que
+            a saída não dependa da ordem em que o sistema de arquivos lista os diretórios
         """
-        Gera o prompt para um componente.
+        files = []
+        seen = set()
+        for kind, root in self._roots():
+            for file_kind, file in scan(root, kind, self.ignore):
+                if file not in seen and self._in_shard(file):
+                    seen.add(file)
+                    files.append((file_kind, file))
+        files.sort(key=lambda item: relative_path(item[1], self.directory))
+        return files
+
+    def _in_shard(self, file: Path) -> bool:
+        """Indica se um arquivo pertence ao shard processado."""
+        if self.shard is None:
+            return True
+        return shard_of(relative_path(file, self.directory), self.shard[1]) == self.shard[0]
+
+    def kind_of(self, file: Union[str, Path]) -> Optional[str]:
+        """
+        Classifica um arquivo como scan_files() faria.
 
         Args:
-            component: Dicionário com os dados do componente
+            file: Caminho do arquivo
 
         Returns:
-            String contendo o prompt para o componente
+            O tipo do arquivo, ou None se ele não faz parte do projeto
         """
-        prompt = f"""Por favor, gere um componente em {self.target_language} com as seguintes especificações:
-
-Nome: {component['metadata'].get('nome', 'Componente')}
-Versão: {component['metadata'].get('versao', '1.0.0')}
-Autor: {component['metadata'].get('autor', 'Equipe LNEGC')}
-Tipo: {component['metadata'].get('tipo', 'Utilitário')}
+        for kind, root in self._roots():
+            file_kind = kind_of(root, file, kind, self.ignore)
+            if file_kind is not None:
+                return file_kind if self._in_shard(Path(file)) else None
+        return None
+
+    def _roots(self) -> List[Tuple[Optional[str], Path]]:
+        if self.config is None:
+            return [(None, self.directory)]
+        return self.config.roots(self.directory)
+
+    def _load_files(self, files: Optional[List[Tuple[str, Path]]] = None) -> None:
+        """
+        Carrega os arquivos .lnegc do projeto.
 
-Descrição:
-{component['sections'].get('Descrição', component['sections'].get('DESCRIÇÃO', 'Sem descrição disponível.'))}
+        Args:
+            files: Tuplas (tipo, caminho) a carregar. Se None, o projeto é varrido.
+        """
+        targets = self._targets()
+        if files is None:
+            files = self.scan_files()
+        if self.jobs > 1 and len(files) > 1:
+            results = self._parse_parallel([file for _, file in files])
+        else:
+            results = [LNEGCParser(file, cache=self.cache).parse() for _, file in files]
+
+        for (kind, _), result in zip(files, results):
+            targets[kind].append(result)
+
+    def _targets(self) -> Dict[str, List[ParseResult]]:
+        """Retorna as listas de resultados de cada tipo de especificação."""
+        return {
+            "componentes": self._components,
+            "entidades": self._entities,
+            "interfaces": self._interfaces,
+            "testes": self._tests,
+        }
 
-Algoritmo:
-{component['sections'].get('Algoritmo', component['sections'].get('ALGORITMO', 'Sem algoritmo definido.'))}
+    def _parse_parallel(self, files: List[Path]) -> List[ParseResult]:
+        """
+        Lê os arquivos em um pool de threads e faz o parse em um pool de processos.
 
-Regras:
-{component['sections'].get('Regras', component['sections'].get('REGRAS', 'Sem regras definidas.'))}
+        Os resultados são retornados na mesma ordem dos arquivos, de modo que a saída é
+        idêntica à do carregamento sequencial.
 
-Interface:
-{component['sections'].get('Interface', component['sections'].get('INTERFACE', 'Sem interface definida.'))}
+        Args:
+            files: Arquivos a carregar
 
-Observações:
-- Toda a documentação deve estar em português do Brasil
-- Comentários devem estar em português do Brasil
-- Nomes de variáveis e funções devem seguir o padrão camelCase em português
-"""
-        if "Exemplos" in component["sections"] or "EXEMPLOS" in component["sections"]:
-            prompt += f"\nExemplos:\n{component['sections'].get('Exemplos', component['sections'].get('EXEMPLOS', ''))}"
+        Returns:
+            Resultados do parse, na ordem dos arquivos
+        """
+        if self.pools is None:
+            with WorkerPools(self.jobs) as pools:
+                return self._parse_in(pools, files)
+        return self._parse_in(self.pools, files)
+
+    def _parse_in(self, pools: WorkerPools, files: List[Path]) -> List[ParseResult]:
+        sources = list(pools.threads.map(read_source, files))
+        contents = [content for content, _ in sources]
+
+        results: List[Optional[ParseResult]] = [None] * len(files)
+        pending = []
+        for index, (file, (content, stamp)) in enumerate(zip(files, sources)):
+            parser = LNEGCParser(file, cache=self.cache, content=content, stamp=stamp)
+            results[index] = parser.from_cache()
+            if results[index] is None:
+                pending.append((index, parser.cache_key))
+
+        if pending:
+            # Blocos de arquivos por tarefa amortizam o custo de comunicação entre processos
+            chunksize = max(1, len(pending) // (pools.jobs * 4))
+            items = [(files[index], contents[index], self.cache, key) for index, key in pending]
+            parsed = pools.processes.map(_parse_content, items, chunksize=chunksize)
+            for (index, _), (data, spans) in zip(pending, parsed):
+                sections = LazySections(contents[index], [tuple(span) for span in spans])
+                results[index] = ParseResult.from_dict(
+                    {**data, "sections": sections}, str(files[index])
+                )
+                results[index].stamp = sources[index][1]
+            if self.cache is not None:
+                # As entradas foram gravadas pelos processos do pool
+                self.cache.mark_written(len(pending))
+
+        return results
+
+    def _generate_component_prompt(self, component: ParseResult) -> str:
+        """
+        Gera o prompt para um componente.
 
-        # Sempre inclui a implementação padrão
-        prompt += f"\nImplementação de Referência:\n{self.implementacao_padrao}"
+        Args:
+            component: Resultado do parse do componente
 
-        return prompt
+        Returns:
+            String contendo o prompt para o componente
+        """
+        return self.templates.render(
+            "componentes", component, self.target_language, self.layout
+        )
 
-    def _generate_entity_prompt(self, entity: dict) -> str:
+    def _generate_entity_prompt(self, entity: ParseResult) -> str:
         """Gera o prompt para uma entidade."""
-        metadata = entity.get('metadata', {})
-        attributes = entity.get('attributes', [])
-        validations = entity.get('validations', [])
-        relationships = entity.get('relationships', [])
-        methods = entity.get('methods', [])
-        indexes = entity.get('indexes', [])
-        permissions = entity.get('permissions', [])
-        audit = entity.get('auditoria', [])
-
-        prompt = f"""Por favor, gere uma entidade em {self.target_language} com as seguintes especificações:
-
-# Metadados
-- Nome: {metadata.get('Nome', 'Não definido')}
-- Tipo: {metadata.get('Tipo', 'Não definido')}
-- Descrição: {metadata.get('Descrição', 'Não definido')}
-- Autor: {metadata.get('Autor', 'Não definido')}
-- Versão: {metadata.get('Versão', 'Não definido')}
-
-# Atributos
-{self._format_attributes(attributes)}
-
-# Validações de Negócio
-{self._format_validations(validations)}
-
-# Relacionamentos
-{self._format_relationships(relationships)}
-
-# Métodos de Domínio
-{self._format_methods(methods)}
-
-# Índices do Banco de Dados
-{self._format_indexes(indexes)}
-
-# Regras de Permissão
-{self._format_permissions(permissions)}
-
-# Requisitos de Auditoria
-{self._format_audit(audit)}
-
-# Requisitos Técnicos
-1. Use TypeScript com decorators para validação
-2. Implemente validações usando Zod
-3. Use classes de domínio com encapsulamento
-4. Implemente todos os métodos de domínio
-5. Adicione validações de negócio
-6. Use tipos fortes e interfaces
-7. Implemente tratamento de erros
-8. Adicione documentação JSDoc
-9. Siga os princípios SOLID
-10. Implemente testes unitários
-
-# Exemplo de Implementação
-```typescript
-import {{ z }} from 'zod';
-import {{ Entity, Column, PrimaryGeneratedColumn, CreateDateColumn, UpdateDateColumn }} from 'typeorm';
-
-/* Schema de validação */
-export const entitySchema = z.object({{
-    /* ... schema definition */
-}});
-
-/* Interface da entidade */
-export interface IEntity {{
-    /* ... interface definition */
-}}
-
-/* Classe de domínio */
-export class EntityDomain {{
-    constructor(private data: IEntity) {{
-        this.validate();
-    }}
-
-    private validate(): void {{
-        /* Validações de negócio */
-    }}
-
-    /* Métodos de domínio */
-}}
-
-/* Entidade do banco de dados */
-@Entity()
-export class EntityModel {{
-    /* ... entity definition */
-}}
-```
-
-Por favor, gere uma implementação completa seguindo estas especificações e requisitos técnicos."""
-        return prompt
-
-    def _generate_interface_prompt(self, interface: Dict) -> str:
+        return self.templates.render(
+            "entidades", entity, self.target_language, self.layout
+        )
+
+    def _generate_interface_prompt(self, interface: ParseResult) -> str:
         """
         Gera o prompt para uma interface.
 
         Args:
-            interface: Dicionário com os dados da interface
+            interface: Resultado do parse da interface
 
         Returns:
             String contendo o prompt para a interface
         """
-        prompt = f"""Por favor, gere uma interface em {self.target_language} com as seguintes especificações:
-
-Nome: {interface['metadata'].get('nome', 'Interface')}
-Versão: {interface['metadata'].get('versao', '1.0.0')}
-Autor: {interface['metadata'].get('autor', 'Equipe LNEGC')}
-Tipo: {interface['metadata'].get('tipo', 'Interface')}
+        return self.templates.render(
+            "interfaces", interface, self.target_language, self.layout
+        )
 
-Descrição:
-{interface['sections'].get('Descrição', interface['sections'].get('DESCRIÇÃO', 'Sem descrição disponível.'))}
+    def _generate_test_prompt(self, test: ParseResult) -> str:
+        """
+        Gera o prompt para um teste.
 
-Métodos:
-{interface['sections'].get('Métodos', interface['sections'].get('MÉTODOS', 'Sem métodos definidos.'))}
+        Args:
+            test: Resultado do parse do teste
 
-Propriedades:
-{interface['sections'].get('Propriedades', interface['sections'].get('PROPRIEDADES', 'Sem propriedades definidas.'))}
+        Returns:
+            String contendo o prompt para o teste
+        """
+        return self.templates.render(
+            "testes", test, self.target_language, self.layout
+        )
 
-Regras:
-{interface['sections'].get('Regras', interface['sections'].get('REGRAS', 'Sem regras definidas.'))}
+    def process(self) -> Dict[str, List[str]]:
+        """
+        Processa todos os arquivos do projeto e gera os prompts.
 
-"""
-        # Sempre inclui a implementação padrão
-        prompt += f"\nImplementação de Referência:\n{self.implementacao_padrao_interface}"
+        O resultado é memorizado na sessão do processador: chamadas seguintes não
+        processam o projeto novamente até que invalidate() seja chamado.
 
-        return prompt
+        Returns:
+            Dicionário com os prompts gerados para cada tipo de arquivo
+        """
+        return self.session.generate()
 
-    def _generate_test_prompt(self, test: Dict) -> str:
+    def invalidate(self, stage: str = "parse") -> None:
         """
-        Gera o prompt para um teste.
+        Descarta resultados memorizados, por exemplo após alterações nos arquivos.
 
         Args:
-            test: Dicionário com os dados do teste
+            stage: Primeira etapa a ser executada novamente (parse, validate, analyze ou
+                   generate)
+        """
+        self.session.invalidate(stage)
+
+    def parse_all(self) -> int:
+        """
+        Faz o parse de todos os arquivos do projeto, gravando os resultados no cache, se
+        houver.
+
+        Os resultados são fechados à medida que são gerados, sem ficar em memória.
 
         Returns:
-            String contendo o prompt para o teste
+            Número de arquivos processados
         """
-        prompt = f"""Por favor, gere testes em {self.target_language} com as seguintes especificações:
-
-Nome: {test['metadata'].get('nome', 'Teste')}
-Versão: {test['metadata'].get('versao', '1.0.0')}
-Autor: {test['metadata'].get('autor', 'Equipe LNEGC')}
-Tipo: {test['metadata'].get('tipo', 'Teste Unitário')}
-
-Descrição:
-{test['sections'].get('Descrição', test['sections'].get('DESCRIÇÃO', 'Sem descrição disponível.'))}
-
-Cenários:
-{test['sections'].get('Cenários', test['sections'].get('CENÁRIOS', '''
-1. CPF Válido
-   Entrada: "529.982.247-25"
-   Esperado: true
-   Descrição: Deve retornar true para um CPF válido
-
-2. CPF Inválido
-   Entrada: "529.982.247-26"
-   Esperado: false
-   Descrição: Deve retornar false para um CPF inválido
-
-3. CPF com Dígitos Iguais
-   Entrada: "111.111.111-11"
-   Esperado: false
-   Descrição: Deve retornar false para CPF com todos dígitos iguais
-
-4. CPF com Formato Inválido
-   Entrada: "123.456.789"
-   Esperado: Error
-   Descrição: Deve lançar erro para CPF com formato inválido'''))}
-
-Mocks:
-{test['sections'].get('Mocks', test['sections'].get('MOCKS', '''
-- Não são necessários mocks para estes testes
-'''))}
-
-Fixtures:
-{test['sections'].get('Fixtures', test['sections'].get('FIXTURES', '''
-- cpfsValidos: Array de CPFs válidos para teste
-- cpfsInvalidos: Array de CPFs inválidos para teste
-'''))}
-"""
-        # Sempre inclui a implementação padrão
-        prompt += f"\nImplementação de Referência:\n{self.implementacao_padrao_teste}"
+        count = 0
+        for result in self._iter_results(self.scan_files()):
+            result.close()
+            count += 1
+        return count
 
-        return prompt
+    def export_ir(self, path: Union[str, Path], encoding: str = "json") -> None:
+        """
+        Grava a representação intermediária (IR) do projeto (veja core.ir).
 
-    @property
-    def implementacao_padrao(self) -> str:
-        return '''```typescript
-import { useState, useEffect } from 'react';
+        Args:
+            path: Arquivo de destino
+            encoding: json ou msgpack
 
-interface ValidadorCPFProps {
-    cpf: string;
-    onValidate?: (isValid: boolean) => void;
-}
+        Raises:
+            ValueError: Se o formato for desconhecido ou o msgpack não estiver instalado
+        """
+        data = ir.dumps(ir.build(self), encoding)
+        Path(path).write_bytes(data)
 
-export const ValidadorCPF: React.FC<ValidadorCPFProps> = ({ cpf, onValidate }) => {
-    // Estado para controlar a validação
-    const [isValid, setIsValid] = useState<boolean>(false);
-    const [error, setError] = useState<string | null>(null);
-
-    // Função de validação do CPF
-    const validarCPF = (cpf: string): boolean => {
-        // Remove caracteres não numéricos
-        const cpfLimpo = cpf.replace(/\D/g, '');
-        
-        // Verifica se tem 11 dígitos
-        if (cpfLimpo.length !== 11) {
-            throw new Error("CPF deve ter 11 dígitos");
-        }
-        
-        // Verifica se todos os dígitos são iguais
-        if (new Set(cpfLimpo).size === 1) {
-            return false;
-        }
-        
-        // Calcula primeiro dígito verificador
-        let soma = 0;
-        for (let i = 0; i < 9; i++) {
-            soma += parseInt(cpfLimpo[i]) * (10 - i);
-        }
-        let digito1 = (soma * 10) % 11;
-        if (digito1 === 10) digito1 = 0;
-        
-        // Calcula segundo dígito verificador
-        soma = 0;
-        for (let i = 0; i < 10; i++) {
-            soma += parseInt(cpfLimpo[i]) * (11 - i);
-        }
-        let digito2 = (soma * 10) % 11;
-        if (digito2 === 10) digito2 = 0;
-        
-        // Verifica os dígitos
-        return cpfLimpo.slice(-2) === `${digito1}${digito2}`;
-    };
-
-    // Efeito para validar o CPF quando mudar
-    useEffect(() => {
-        try {
-            const resultado = validarCPF(cpf);
-            setIsValid(resultado);
-            setError(null);
-            onValidate?.(resultado);
-        } catch (erro) {
-            setIsValid(false);
-            setError(erro.message);
-            onValidate?.(false);
-        }
-    }, [cpf, onValidate]);
-
-    return (
-        <div className="validador-cpf">
-            <div className={`status ${isValid ? 'valido' : 'invalido'}`}>
-                {isValid ? '✓ CPF Válido' : '✗ CPF Inválido'}
-            </div>
-            {error && <div className="erro">{error}</div>}
-        </div>
-    );
-};
-```'''
+    def load_ir(self, path: Union[str, Path]) -> None:
+        """
+        Carrega a IR do projeto, que passa a ser usada no lugar do parse dos arquivos.
 
-    @property
-    def implementacao_padrao_entidade(self) -> str:
-        return '''```typescript
-import { z } from 'zod';
-
-// Definição do schema de validação
-export const clienteSchema = z.object({
-    id: z.number(),
-    nome: z.string().min(3).max(100),
-    email: z.string().email(),
-    cpf: z.string(),
-    telefone: z.string().regex(/^\(\d{2}\) \d{5}-\d{4}$/).optional(),
-    dataNascimento: z.date().max(new Date()).optional(),
-    ativo: z.boolean().default(true)
-});
-
-// Tipo gerado a partir do schema
-export type Cliente = z.infer<typeof clienteSchema>;
-
-// Classe de domínio
-export class ClienteDomain {
-    constructor(private data: Cliente) {
-        this.validar();
-    }
-
-    private validar(): void {
-        // Valida usando o schema
-        const resultado = clienteSchema.safeParse(this.data);
-        
-        if (!resultado.success) {
-            throw new Error(resultado.error.message);
-        }
-        
-        // Validações adicionais
-        if (!validarCPF(this.data.cpf)) {
-            throw new Error("CPF inválido");
-        }
-    }
-
-    // Getters
-    get id(): number { return this.data.id; }
-    get nome(): string { return this.data.nome; }
-    get email(): string { return this.data.email; }
-    get cpf(): string { return this.data.cpf; }
-    get telefone(): string | undefined { return this.data.telefone; }
-    get dataNascimento(): Date | undefined { return this.data.dataNascimento; }
-    get ativo(): boolean { return this.data.ativo; }
-
-    // Métodos de domínio
-    desativar(): void {
-        this.data.ativo = false;
-    }
-
-    ativar(): void {
-        this.data.ativo = true;
-    }
-
-    atualizarTelefone(novoTelefone?: string): void {
-        if (novoTelefone && !/^\(\d{2}\) \d{5}-\d{4}$/.test(novoTelefone)) {
-            throw new Error("Telefone deve seguir formato (XX) XXXXX-XXXX");
-        }
-        this.data.telefone = novoTelefone;
-    }
-}
-```'''
+        Os caminhos da IR são relativos ao diretório do processador. Os arquivos .lnegc
+        não são lidos: process() e iter_specs() geram os prompts a partir da IR até que
+        invalidate("parse") seja chamado.
 
-    @property
-    def implementacao_padrao_interface(self) -> str:
-        return '''```typescript
-import { z } from 'zod';
-
-// Interface genérica para o repositório
-export interface IRepositorio<T> {
-    criar(entidade: T): Promise<T>;
-    ler(id: number): Promise<T>;
-    atualizar(entidade: T): Promise<T>;
-    deletar(id: number): Promise<boolean>;
-    listar(): Promise<T[]>;
-    buscar(filtro: Record<string, unknown>): Promise<T[]>;
-}
+        Args:
+            path: Arquivo gravado por export_ir()
 
-// Implementação base abstrata
-export abstract class RepositorioBase<T extends { id: number }> implements IRepositorio<T> {
-    protected cache: Map<number, T> = new Map();
-    protected logger: Logger;
-
-    constructor(logger: Logger) {
-        this.logger = logger;
-    }
-
-    // Método para invalidar o cache
-    protected invalidarCache(): void {
-        this.cache.clear();
-        this.logger.info('Cache invalidado');
-    }
-
-    // Implementação dos métodos abstratos
-    abstract criar(entidade: T): Promise<T>;
-    abstract ler(id: number): Promise<T>;
-    abstract atualizar(entidade: T): Promise<T>;
-    abstract deletar(id: number): Promise<boolean>;
-    abstract listar(): Promise<T[]>;
-    abstract buscar(filtro: Record<string, unknown>): Promise<T[]>;
-}
+        Raises:
+            ValueError: Se o arquivo não for uma IR desta versão
+        """
+        parsed = ir.to_parsed(ir.loads(Path(path).read_bytes()), self.directory)
+        targets = self._targets()
+        for results in targets.values():
+            results.clear()
+        for kind, file in parsed.files:
+            targets[kind].append(parsed.results[str(file)])
+        self.session.load(parsed)
+
+    def iter_prompts(self) -> Iterator[Tuple[str, Path, str]]:
+        """
+        Gera os prompts do projeto um a um, na mesma ordem de process() (veja iter_specs()).
 
-// Exemplo de implementação concreta
-export class ClienteRepositorio extends RepositorioBase<Cliente> {
-    async criar(cliente: Cliente): Promise<Cliente> {
-        try {
-            // Implementação específica para persistir o cliente
-            const resultado = await db.clientes.create(cliente);
-            
-            // Invalida o cache após a escrita
-            this.invalidarCache();
-            
-            return resultado;
-        } catch (erro) {
-            this.logger.error('Erro ao criar cliente:', erro);
-            throw erro;
-        }
-    }
+        Yields:
+            Tuplas (tipo, caminho do arquivo, prompt)
+        """
+        for kind, _, path, prompt in self.iter_specs():
+            yield kind, path, prompt
 
-    // ... implementação dos outros métodos
-}
-```'''
+    def iter_specs(self) -> Iterator[Tuple[str, str, Path, str]]:
+        """
+        Gera os prompts do projeto um a um, com o nome de cada especificação.
 
-    @property
-    def implementacao_padrao_teste(self) -> str:
-        return '''```typescript
-import { describe, it, expect } from 'vitest';
-import { validarCPF } from '../components/ValidadorCPF';
-
-describe('ValidadorCPF', () => {
-    // Fixtures
-    const cpfsValidos = [
-        '529.982.247-25',
-        '123.456.789-09',
-        '111.444.777-35'
-    ];
-
-    const cpfsInvalidos = [
-        '529.982.247-26',
-        '123.456.789-10',
-        '111.111.111-11'
-    ];
-
-    // Testes para CPFs válidos
-    it('deve retornar true para CPFs válidos', () => {
-        cpfsValidos.forEach(cpf => {
-            expect(validarCPF(cpf)).toBe(true);
-        });
-    });
-
-    // Testes para CPFs inválidos
-    it('deve retornar false para CPFs inválidos', () => {
-        cpfsInvalidos.forEach(cpf => {
-            expect(validarCPF(cpf)).toBe(false);
-        });
-    });
-
-    // Teste para CPF com dígitos iguais
-    it('deve retornar false para CPF com todos os dígitos iguais', () => {
-        expect(validarCPF('111.111.111-11')).toBe(false);
-        expect(validarCPF('000.000.000-00')).toBe(false);
-    });
-
-    // Teste para CPF com formato inválido
-    it('deve lançar erro para CPF com formato inválido', () => {
-        expect(() => validarCPF('123.456.789')).toThrow('CPF deve ter 11 dígitos');
-        expect(() => validarCPF('')).toThrow('CPF deve ter 11 dígitos');
-    });
-});
-```'''
+        Cada arquivo passa pelo parse uma única vez. Uma primeira passagem registra o nome
+        de cada especificação (para remover duplicadas); os prompts são então gerados a
+        partir do cache de parse, preenchido nessa passagem, ou, sem cache, dos resultados
+        das especificações selecionadas, mantidos até a geração do seu prompt. Com cache,
+        o consumo de memória é limitado pela maior especificação do projeto, não pelo
+        tamanho do projeto.
 
-    def process(self) -> Dict[str, List[str]]:
+        Yields:
+            Tuplas (tipo, nome da especificação, caminho do arquivo, prompt)
         """
-        Processa todos os arquivos do projeto e gera os prompts.
+        if self.session.loaded:
+            # Os resultados da IR já estão em memória
+            parsed = self.session.parse()
+            for kind, paths in self.session.analyze().items():
+                for name, path in paths.items():
+                    for prompt in self._render(kind, path, parsed.results):
+                        yield kind, name, Path(path), prompt
+            return
+
+        files = self.scan_files()
+        unchanged = self._unchanged(files)
+        changed = [(kind, file) for kind, file in files if str(file) not in unchanged]
+        names: Dict[str, str] = {}
+        # Resultados mantidos sem cache de parse; o de uma especificação substituída por
+        # outra de mesmo nome é descartado assim que a substituta é encontrada
+        kept: Dict[str, ParseResult] = {}
+        owners: Dict[Tuple[str, str], str] = {}
+        for (kind, file), result in zip(changed, self._iter_results(changed)):
+            path = str(file)
+            name = names[path] = self._record(kind, file, result)
+            if self.cache is None:
+                replaced = kept.pop(owners.get((kind, name)), None)
+                if replaced is not None:
+                    replaced.close()
+                owners[(kind, name)] = path
+                kept[path] = result
+        unique = self._select(files, unchanged, names)
+
+        for kind, paths in unique.items():
+            for name, path in paths.items():
+                for prompt in self._render(kind, path, kept):
+                    yield kind, name, Path(path), prompt
+                result = kept.pop(path, None)
+                if result is not None:
+                    result.close()
+
+        if self.cache is not None:
+            self.cache.evict()
+        if self.manifest is not None:
+            self.manifest.save(files)
+
+    def _iter_results(self, files: List[Tuple[str, Path]]) -> Iterator[ParseResult]:
+        """Faz o parse dos arquivos em blocos, sem manter todos os resultados em memória."""
+        if self.jobs > 1 and len(files) > 1:
+            batch = self.jobs * 16
+            for start in range(0, len(files), batch):
+                yield from self._parse_parallel([file for _, file in files[start:start + batch]])
+        else:
+            for _, file in files:
+                yield LNEGCParser(file, cache=self.cache).parse()
+
+    def _unchanged(self, files: List[Tuple[str, Path]]) -> Dict[str, ManifestEntry]:
+        """Carrega o manifesto, em modo incremental, e retorna os arquivos inalterados."""
+        if not self.incremental:
+            return {}
+        self.manifest = Manifest(self.directory, self._render_key()).load()
+        return self.manifest.unchanged(files)
+
+    def _select(
+        self,
+        files: List[Tuple[str, Path]],
+        unchanged: Dict[str, ManifestEntry],
+        names: Dict[str, str],
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Seleciona uma especificação por nome em cada tipo (a última, na posição dela).
+
+        Args:
+            files: Tuplas (tipo, caminho) encontradas pelo scanner
+            unchanged: Registros do manifesto dos arquivos inalterados
+            names: Nome de cada arquivo processado nesta execução, por caminho (veja
+                   _record())
 
         Returns:
-            Dicionário com os prompts gerados para cada tipo de arquivo
+            Mapeamento tipo -> nome -> caminho do arquivo
+        """
+        # Arquivos inalterados são identificados pelo nome registrado no manifesto.
+        specs = []
+        for kind, file in files:
+            path = str(file)
+            entry = unchanged.get(path)
+            name = entry.name if entry is not None else names[path]
+            specs.append((kind, name, path))
+        return select_unique(specs)
+
+    def _record(self, kind: str, file: Path, result: ParseResult) -> str:
+        """
+        Registra no manifesto, em modo incremental, um arquivo processado nesta execução.
+
+        Returns:
+            O nome da especificação (veja _dedup_name())
         """
-        self._load_config()  # Carrega configuração apenas quando necessário
-        self._load_files()
-
-        # Usa dicionários para garantir unicidade baseada no nome do arquivo
-        unique_components = {}
-        unique_entities = {}
-        unique_interfaces = {}
-        unique_tests = {}
-
-        # Processa componentes
-        for c in self._components:
-            file_name = c.get('metadata', {}).get('nome', 'Componente')
-            c = c.copy()  # Cria uma cópia para não modificar o original
-            if 'sections' in c:
-                c['sections'] = c['sections'].copy()
-                c['sections'].pop('Implementação', None)
-                c['sections'].pop('IMPLEMENTAÇÃO', None)
-            unique_components[file_name] = c
-
-        # Processa entidades
-        for e in self._entities:
-            file_name = e.get('metadata', {}).get('nome', 'Entidade')
-            e = e.copy()  # Cria uma cópia para não modificar o original
-            if 'sections' in e:
-                e['sections'] = e['sections'].copy()
-                e['sections'].pop('Implementação', None)
-                e['sections'].pop('IMPLEMENTAÇÃO', None)
-            unique_entities[file_name] = e
-
-        # Processa interfaces
-        for i in self._interfaces:
-            file_name = i.get('metadata', {}).get('nome', 'Interface')
-            i = i.copy()  # Cria uma cópia para não modificar o original
-            if 'sections' in i:
-                i['sections'] = i['sections'].copy()
-                i['sections'].pop('Implementação', None)
-                i['sections'].pop('IMPLEMENTAÇÃO', None)
-            unique_interfaces[file_name] = i
-
-        # Processa testes
-        for t in self._tests:
-            file_name = t.get('metadata', {}).get('nome', 'Teste')
-            t = t.copy()  # Cria uma cópia para não modificar o original
-            if 'sections' in t:
-                t['sections'] = t['sections'].copy()
-                t['sections'].pop('Implementação', None)
-                t['sections'].pop('IMPLEMENTAÇÃO', None)
-            unique_tests[file_name] = t
-
-        # Gera os prompts com as implementações padrão
-        prompts = {
-            "componentes": [self._generate_component_prompt(c) for c in unique_components.values()],
-            "entidades": [self._generate_entity_prompt(e) for e in unique_entities.values()],
-            "interfaces": [self._generate_interface_prompt(i) for i in unique_interfaces.values()],
-            "testes": [self._generate_test_prompt(t) for t in unique_tests.values()]
+        name = self._dedup_name(kind, result)
+        if self.manifest is not None:
+            self.manifest.record(kind, file, name, result.stamp)
+        return name
+
+    def _dedup_name(self, kind: str, result: ParseResult) -> str:
+        """Nome usado para garantir unicidade das especificações de um tipo."""
+        return result.metadata.get('nome', DEFAULT_NAMES[kind])
+
+    def _generate_prompt(self, kind: str, result: ParseResult) -> str:
+        """Gera o prompt de uma especificação de acordo com o seu tipo."""
+        generators = {
+            "componentes": self._generate_component_prompt,
+            "entidades": self._generate_entity_prompt,
+            "interfaces": self._generate_interface_prompt,
+            "testes": self._generate_test_prompt,
         }
+        return generators[kind](result)
+
+    def _generate_prompts(self, kind: str, result: ParseResult) -> List[str]:
+        """
+        Gera os prompts de uma especificação, dividindo-a se exceder o orçamento de tokens.
 
+        Args:
+            kind: Tipo da especificação
+            result: Resultado do parse
+
+        Returns:
+            Os prompts da especificação (apenas um, se não houver orçamento)
+
+        Raises:
+            PromptTooLargeError: Se a especificação não puder ser dividida em prompts
+                                 dentro do orçamento
+        """
+        if self.budget is None:
+            return [self._generate_prompt(kind, result)]
+
+        def render(spec: ParseResult, part: Optional[str]) -> str:
+            return self.templates.render(
+                kind, spec, self.target_language, self.layout, part
+            )
+
+        return split(kind, result, render, self.count_tokens, self.budget)
+
+    def _render_key(self) -> str:
+        """Identifica tudo o que, além do arquivo, influencia o prompt gerado."""
+        return (
+            f"{PARSER_VERSION}:{PROMPTS_VERSION}:{self.target_language}:{self.layout}:"
+            f"{self.budget}:{self.tokenizer}:{self.templates.fingerprint}"
+        )
+
+    def _render(self, kind: str, path: str, results: Dict[str, ParseResult]) -> List[str]:
+        """
+        Gera os prompts de um arquivo, reaproveitando os do manifesto se possível.
+
+        Args:
+            kind: Tipo da especificação
+            path: Caminho do arquivo
+            results: Resultados do parse desta execução, por caminho
+
+        Returns:
+            Os prompts do arquivo: mais de um se ele foi dividido pelo orçamento de tokens
+        """
+        entry = None
+        if self.manifest is not None:
+            entry = self.manifest.get(path)
+            if path not in results and entry is not None:
+                prompt = self.manifest.prompt(entry)
+                if prompt is not None:
+                    return prompt.split(PART_SEPARATOR)
+
+        result = results.get(path)
+        if result is not None:
+            prompts = self._generate_prompts(kind, result)
+        else:
+            parser = LNEGCParser(Path(path), cache=self.cache)
+            with parser.from_cache() or parser.parse() as result:
+                prompts = self._generate_prompts(kind, result)
+        if entry is not None:
+            self.manifest.store_prompt(entry, PART_SEPARATOR.join(prompts))
         return prompts
 
     def process_all(self) -> List[str]:
@@ -660,50 +665,4 @@ describe('ValidadorCPF', () => {
         Returns:
             Lista com todos os prompts gerados
         """
-        result = self.process()
-        all_prompts = []
-        for prompts in result.values():
-            all_prompts.extend(prompts)
-        return all_prompts
-
-    def _format_attributes(self, attributes: List[str]) -> str:
-        """Formata a lista de atributos para o prompt."""
-        if not attributes:
-            return "Sem atributos definidos."
-        return "\n".join(f"- {attr}" for attr in attributes)
-
-    def _format_validations(self, validations: List[str]) -> str:
-        """Formata a lista de validações para o prompt."""
-        if not validations:
-            return "Sem validações definidas."
-        return "\n".join(f"- {val}" for val in validations)
-
-    def _format_relationships(self, relationships: List[str]) -> str:
-        """Formata a lista de relacionamentos para o prompt."""
-        if not relationships:
-            return "Sem relacionamentos definidos."
-        return "\n".join(f"- {rel}" for rel in relationships)
-
-    def _format_methods(self, methods: List[str]) -> str:
-        """Formata a lista de métodos para o prompt."""
-        if not methods:
-            return "Sem métodos definidos."
-        return "\n".join(f"- {method}" for method in methods)
-
-    def _format_indexes(self, indexes: List[str]) -> str:
-        """Formata a lista de índices para o prompt."""
-        if not indexes:
-            return "Sem índices definidos."
-        return "\n".join(f"- {idx}" for idx in indexes)
-
-    def _format_permissions(self, permissions: List[str]) -> str:
-        """Formata a lista de permissões para o prompt."""
-        if not permissions:
-            return "Sem permissões definidas."
-        return "\n".join(f"- {perm}" for perm in permissions)
-
-    def _format_audit(self, audit: List[str]) -> str:
-        """Formata a lista de requisitos de auditoria para o prompt."""
-        if not audit:
-            return "Sem requisitos de auditoria definidos."
-        return "\n".join(f"- {req}" for req in audit) 
\ No newline at end of file
+        return self.session.prompts()
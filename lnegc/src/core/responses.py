@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cache persistente das respostas do modelo.
+
+As respostas são gravadas em .lnegc/responses, indexadas pelo hash do prompt, da linguagem
+alvo e das configurações do modelo (URL, modelo e temperatura). Um prompt que não mudou
+desde a execução anterior não é enviado novamente. Quando o cache excede o tamanho máximo,
+as entradas usadas há mais tempo são removidas, exceto as fixadas com pin().
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from .files import write_atomic
+
+# Diretório do cache, relativo ao diretório do projeto
+RESPONSES_DIR = Path(".lnegc") / "responses"
+
+# Tamanho máximo padrão do cache
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# Versão do formato das entradas
+RESPONSES_VERSION = 1
+
+
+class ResponseCache:
+    """Cache em disco de respostas do modelo, com remoção LRU e entradas fixadas."""
+
+    def __init__(self, root: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE):
+        """
+        Inicializa o cache.
+
+        Args:
+            root: Diretório onde as entradas são gravadas
+            max_size: Tamanho máximo do cache em bytes, sem contar as entradas fixadas
+        """
+        self.root = Path(root)
+        self.max_size = max_size
+        self.pins_path = self.root / "pins.json"
+        self.hits = 0
+        self.misses = 0
+        self._pins: Optional[Set[str]] = None
+
+    @classmethod
+    def for_project(cls, directory: Union[str, Path], **kwargs) -> "ResponseCache":
+        """Cria o cache no diretório .lnegc/responses de um projeto."""
+        return cls(Path(directory) / RESPONSES_DIR, **kwargs)
+
+    @staticmethod
+    def key(prompt: str, language: str, settings: Dict[str, Any]) -> str:
+        """
+        Calcula a chave de uma requisição.
+
+        Args:
+            prompt: Texto do prompt
+            language: Linguagem alvo
+            settings: Configurações do modelo que influenciam a resposta
+
+        Returns:
+            Hash hexadecimal do prompt, da linguagem e das configurações
+        """
+        digest = hashlib.sha256(
+            json.dumps(
+                [RESPONSES_VERSION, language, settings], sort_keys=True, ensure_ascii=False
+            ).encode("utf-8")
+        )
+        digest.update(b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca uma resposta no cache.
+
+        Args:
+            key: Chave calculada por key()
+
+        Returns:
+            A resposta armazenada (response, model e usage), ou None se não houver
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        # Atualiza o horário de uso para a remoção LRU
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Grava uma resposta no cache.
+
+        Args:
+            key: Chave calculada por key()
+            response: Resposta do modelo (response, model e usage)
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, json.dumps(response, ensure_ascii=False, separators=(",", ":")))
+
+    @property
+    def pins(self) -> Set[str]:
+        """Chaves das entradas fixadas, que nunca são removidas por evict()."""
+        if self._pins is None:
+            try:
+                with open(self.pins_path, "r", encoding="utf-8") as f:
+                    self._pins = set(json.load(f))
+            except (OSError, ValueError):
+                self._pins = set()
+        return self._pins
+
+    def _save_pins(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.pins_path, json.dumps(sorted(self.pins), indent=1))
+
+    def pin(self, keys: Iterable[str]) -> List[str]:
+        """
+        Fixa entradas no cache.
+
+        Args:
+            keys: Chaves das entradas
+
+        Returns:
+            As chaves que não têm entrada no cache e não foram fixadas
+        """
+        missing = []
+        for key in keys:
+            if self._path(key).exists():
+                self.pins.add(key)
+            else:
+                missing.append(key)
+        self._save_pins()
+        return missing
+
+    def unpin(self, keys: Iterable[str]) -> None:
+        """Libera entradas fixadas, que voltam a ser removidas pela política LRU."""
+        self.pins.difference_update(keys)
+        self._save_pins()
+
+    def entries(self) -> List[os.DirEntry]:
+        """Arquivos das entradas do cache."""
+        entries: List[os.DirEntry] = []
+        try:
+            with os.scandir(self.root) as it:
+                directories = list(it)
+        except FileNotFoundError:
+            return entries
+        for directory in directories:
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory.path) as files:
+                entries.extend(f for f in files if f.name.endswith(".json"))
+        return entries
+
+    def evict(self) -> int:
+        """
+        Remove as entradas usadas há mais tempo até que o cache caiba em max_size.
+
+        Returns:
+            Número de entradas removidas
+        """
+        pins = self.pins
+        entries = []
+        for entry in self.entries():
+            if entry.name[:-5] in pins:
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self, pinned: bool = False) -> None:
+        """
+        Remove as entradas do cache.
+
+        Args:
+            pinned: Se True, remove também as entradas fixadas
+        """
+        if pinned:
+            if self.root.exists():
+                shutil.rmtree(self.root)
+            self._pins = None
+            return
+        pins = self.pins
+        for entry in self.entries():
+            if entry.name[:-5] not in pins:
+                Path(entry.path).unlink(missing_ok=True)
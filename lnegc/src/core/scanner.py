@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Descoberta de arquivos LNEGC.
+
+O scanner percorre a árvore do projeto uma única vez com os.scandir, classifica cada
+arquivo .lnegc pelo diretório em que ele está (componentes, entidades, interfaces ou
+testes) e não entra em diretórios que não podem conter especificações.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+from .ignore import IgnoreRules
+
+# Extensão dos arquivos LNEGC e dos arquivos de teste
+EXTENSION = ".lnegc"
+TEST_EXTENSION = ".test.lnegc"
+
+# Nome do diretório (em minúsculas) -> tipo dos arquivos que ele contém
+DIRECTORY_KINDS = {
+    "componentes": "componentes",
+    "components": "componentes",
+    "entidades": "entidades",
+    "entities": "entidades",
+    "interfaces": "interfaces",
+    "testes": "testes",
+    "tests": "testes",
+}
+
+# Diretórios que nunca contêm especificações
+PRUNED_DIRECTORIES = frozenset(("node_modules", "__pycache__"))
+
+
+def is_pruned(name: str) -> bool:
+    """Indica se um diretório deve ser ignorado pelo scanner."""
+    return name.startswith(".") or name in PRUNED_DIRECTORIES
+
+
+def classify(name: str, kind: Optional[str]) -> Optional[str]:
+    """
+    Classifica um arquivo pelo nome e pelo tipo do diretório em que está.
+
+    Args:
+        name: Nome do arquivo
+        kind: Tipo do diretório mais próximo que define um tipo, se houver
+
+    Returns:
+        O tipo do arquivo, ou None se ele não for uma especificação reconhecida
+    """
+    if not name.endswith(EXTENSION):
+        return None
+    if name.endswith(TEST_EXTENSION):
+        return "testes"
+    return kind
+
+
+def scan(
+    directory: Union[str, Path],
+    kind: Optional[str] = None,
+    ignore: Optional[IgnoreRules] = None,
+) -> Iterator[Tuple[str, Path]]:
+    """
+    Percorre o projeto e retorna os arquivos .lnegc classificados.
+
+    Cada arquivo é retornado uma única vez, com o tipo do diretório classificador mais
+    próximo dele (por exemplo, componentes/testes/x.lnegc é um teste).
+
+    Args:
+        directory: Diretório raiz do projeto
+        kind: Tipo dos arquivos fora de diretórios classificadores
+        ignore: Padrões de exclusão. Se None, apenas os diretórios de is_pruned() são
+                ignorados.
+
+    Yields:
+        Tuplas (tipo, caminho do arquivo)
+    """
+    prefix = ""
+    if ignore is not None:
+        prefix = ignore.relative(directory)
+        if prefix is None:
+            ignore = None
+            prefix = ""
+        elif prefix:
+            prefix += "/"
+
+    stack = [(os.fspath(directory), prefix, kind)]
+    while stack:
+        path, relative, kind = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if ignore is None:
+                        if is_pruned(entry.name):
+                            continue
+                    elif ignore.match(relative + entry.name, True):
+                        continue
+                    stack.append(
+                        (
+                            entry.path,
+                            relative + entry.name + "/",
+                            DIRECTORY_KINDS.get(entry.name.lower(), kind),
+                        )
+                    )
+                    continue
+                file_kind = classify(entry.name, kind)
+                if file_kind is None:
+                    continue
+                if ignore is not None and ignore.match(relative + entry.name, False):
+                    continue
+                yield file_kind, Path(entry.path)
+
+
+def kind_of(
+    directory: Union[str, Path],
+    file: Union[str, Path],
+    kind: Optional[str] = None,
+    ignore: Optional[IgnoreRules] = None,
+) -> Optional[str]:
+    """
+    Classifica um único arquivo como o scanner faria ao percorrer o projeto.
+
+    Args:
+        directory: Diretório raiz do projeto
+        file: Caminho do arquivo
+        kind: Tipo dos arquivos fora de diretórios classificadores
+        ignore: Padrões de exclusão, como em scan()
+
+    Returns:
+        O tipo do arquivo, ou None se ele não seria retornado por scan()
+    """
+    try:
+        parts = Path(file).relative_to(directory).parts
+    except ValueError:
+        return None
+    if not parts:
+        return None
+
+    for name in parts[:-1]:
+        if ignore is None and is_pruned(name):
+            return None
+        kind = DIRECTORY_KINDS.get(name.lower(), kind)
+
+    if ignore is not None:
+        relative = ignore.relative(file)
+        if relative is not None:
+            # Um arquivo é ignorado se ele ou qualquer diretório acima dele for ignorado
+            parents = relative.split("/")[:-1]
+            for depth in range(len(parents)):
+                if ignore.match("/".join(parents[:depth + 1]), True):
+                    return None
+            if ignore.match(relative, False):
+                return None
+    return classify(parts[-1], kind)
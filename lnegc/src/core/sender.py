@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Envio de prompts para um endpoint compatível com a API de chat da OpenAI.
+
+O cliente usa apenas a biblioteca padrão (asyncio): as conexões HTTP/1.1 são mantidas
+abertas e reaproveitadas entre requisições, o número de requisições simultâneas é
+limitado, o ritmo de envio é controlado por token buckets (requisições e tokens por
+minuto) e falhas temporárias (erros de conexão, 429 e 5xx) são repetidas com espera
+exponencial. Com streaming, a resposta é montada à medida que os eventos chegam.
+"""
+
+import asyncio
+import json
+import random
+import ssl
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+T = TypeVar("T")
+
+# Status HTTP que indicam falhas temporárias
+RETRY_STATUS = frozenset((408, 409, 429, 500, 502, 503, 504))
+
+# Tamanho dos blocos lidos de respostas com Content-Length
+READ_SIZE = 64 * 1024
+
+
+class SendError(Exception):
+    """Falha no envio de um prompt."""
+
+    def __init__(
+        self, message: str, status: Optional[int] = None, retry_after: float = 0.0
+    ):
+        """
+        Inicializa o erro.
+
+        Args:
+            message: Descrição do erro
+            status: Status HTTP da resposta, se houver
+            retry_after: Espera sugerida pelo servidor (Retry-After), em segundos
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.attempts = 1
+
+    @property
+    def retryable(self) -> bool:
+        """Indica se a requisição pode ser repetida."""
+        return self.status is None or self.status in RETRY_STATUS
+
+
+class TokenBucket:
+    """Limita o ritmo de consumo: a capacidade é reposta continuamente à taxa informada."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Inicializa o bucket, cheio.
+
+        Args:
+            rate: Unidades repostas por segundo
+            capacity: Máximo acumulado. Se None, um segundo de consumo (no mínimo 1).
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        Aguarda até que a quantidade esteja disponível e a consome.
+
+        Args:
+            amount: Quantidade consumida. Valores acima da capacidade consomem o bucket
+                    inteiro.
+        """
+        amount = min(amount, self.capacity)
+        loop = asyncio.get_running_loop()
+        # A fila do lock mantém a ordem de chegada dos pedidos
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+
+
+class Connection:
+    """Conexão HTTP aberta, que pode ser reaproveitada."""
+
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def closed(self) -> bool:
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Conexões keep-alive com um servidor, limitadas a um número máximo."""
+
+    def __init__(self, url: str, size: int, timeout: float = 30.0):
+        """
+        Inicializa o pool. As conexões são abertas sob demanda.
+
+        Args:
+            url: URL do servidor (http ou https)
+            size: Número máximo de conexões abertas ao mesmo tempo
+            timeout: Tempo máximo para abrir uma conexão, em segundos
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL não suportada: {url}")
+        self.host = parts.hostname or "localhost"
+        self.tls = parts.scheme == "https"
+        self.port = parts.port or (443 if self.tls else 80)
+        self.timeout = timeout
+        self.opened = 0
+        self._idle: List[Connection] = []
+        self._slots = asyncio.Semaphore(size)
+        self._ssl = ssl.create_default_context() if self.tls else None
+
+    async def acquire(self) -> Connection:
+        """Retorna uma conexão ociosa ou abre uma nova, aguardando se o pool estiver cheio."""
+        await self._slots.acquire()
+        while self._idle:
+            connection = self._idle.pop()
+            if not connection.closed:
+                return connection
+            connection.close()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port, ssl=self._ssl), self.timeout
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        self.opened += 1
+        return Connection(reader, writer)
+
+    def release(self, connection: Connection, reuse: bool) -> None:
+        """
+        Devolve uma conexão ao pool.
+
+        Args:
+            connection: Conexão obtida com acquire()
+            reuse: Se False, a conexão é fechada (por exemplo, após um erro)
+        """
+        if reuse and not connection.closed:
+            self._idle.append(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def close(self) -> None:
+        """Fecha as conexões ociosas."""
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
+
+
+class Completion:
+    """Resposta do modelo a um prompt."""
+
+    __slots__ = ("content", "model", "usage", "attempts", "error")
+
+    def __init__(
+        self,
+        content: str = "",
+        model: Optional[str] = None,
+        usage: Optional[Dict[str, Any]] = None,
+        attempts: int = 1,
+        error: Optional[str] = None,
+    ):
+        """
+        Inicializa a resposta.
+
+        Args:
+            content: Texto gerado pelo modelo
+            model: Modelo informado pelo servidor
+            usage: Contagem de tokens informada pelo servidor, se houver
+            attempts: Número de tentativas feitas
+            error: Descrição do erro, se o envio falhou
+        """
+        self.content = content
+        self.model = model
+        self.usage = usage
+        self.attempts = attempts
+        self.error = error
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {"model": self.model, "response": self.content, "attempts": self.attempts}
+        if self.usage is not None:
+            data["usage"] = self.usage
+        if self.error is not None:
+            data["error"] = self.error
+        return data
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Conexão encerrada pelo servidor")
+    try:
+        status = int(status_line.split()[1])
+    except (IndexError, ValueError):
+        raise SendError(f"Resposta HTTP inválida: {status_line[:80]!r}") from None
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return status, headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _read_body(
+    reader: asyncio.StreamReader, headers: Dict[str, str]
+) -> AsyncIterator[bytes]:
+    """Lê o corpo da resposta em blocos (chunked, Content-Length ou até o fim)."""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            line = await reader.readline()
+            size = int(line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Trailers opcionais até a linha em branco
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return
+            yield await reader.readexactly(size)
+            await reader.readexactly(2)
+    elif "content-length" in headers:
+        remaining = int(headers["content-length"])
+        while remaining > 0:
+            data = await reader.readexactly(min(remaining, READ_SIZE))
+            remaining -= len(data)
+            yield data
+    else:
+        while True:
+            data = await reader.read(READ_SIZE)
+            if not data:
+                return
+            yield data
+
+
+def _reusable(headers: Dict[str, str]) -> bool:
+    """Indica se a conexão pode ser reaproveitada depois desta resposta."""
+    if headers.get("connection", "").lower() == "close":
+        return False
+    return "content-length" in headers or "chunked" in headers.get(
+        "transfer-encoding", ""
+    ).lower()
+
+
+def _retry_after(headers: Dict[str, str]) -> float:
+    try:
+        return max(float(headers.get("retry-after", "0")), 0.0)
+    except ValueError:
+        return 0.0
+
+
+async def iterate_in_executor(items: Iterable[T]) -> AsyncIterator[T]:
+    """
+    Percorre um iterável síncrono no executor padrão, sem bloquear o loop de eventos.
+
+    Cada item é obtido em um thread do executor, um de cada vez: o iterável nunca é
+    avançado por dois threads ao mesmo tempo.
+
+    Args:
+        items: Iterável, como um gerador que faz o parse e gera os prompts
+
+    Yields:
+        Os itens do iterável, na ordem
+    """
+    loop = asyncio.get_running_loop()
+    iterator = iter(items)
+    end = object()
+    while True:
+        item = await loop.run_in_executor(None, next, iterator, end)
+        if item is end:
+            return
+        yield item
+
+
+class ChatSender:
+    """Envia prompts para um endpoint /chat/completions compatível com a OpenAI."""
+
+    def __init__(
+        self,
+        url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        retries: int = 5,
+        backoff: float = 0.5,
+        timeout: float = 300.0,
+        stream: bool = True,
+        temperature: Optional[float] = None,
+        count_tokens: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        Inicializa o cliente.
+
+        Args:
+            url: URL base da API (por exemplo, https://api.openai.com/v1)
+            model: Modelo usado nas requisições
+            api_key: Chave enviada no cabeçalho Authorization, se houver
+            concurrency: Número máximo de requisições simultâneas (e de conexões)
+            requests_per_minute: Limite de requisições por minuto. Se None, sem limite.
+            tokens_per_minute: Limite de tokens de prompt por minuto, contados com
+                               count_tokens. Se None, sem limite.
+            retries: Número de novas tentativas após falhas temporárias
+            backoff: Espera inicial entre tentativas, dobrada a cada falha
+            timeout: Tempo máximo de cada tentativa, em segundos
+            stream: Se True, pede a resposta em streaming (server-sent events)
+            temperature: Temperatura de amostragem. Se None, usa a do servidor.
+            count_tokens: Tokenizador usado com tokens_per_minute
+        """
+        parts = urlsplit(url)
+        self.url = url
+        self.path = parts.path.rstrip("/") + "/chat/completions"
+        self.host_header = parts.netloc
+        self.model = model
+        self.api_key = api_key
+        self.concurrency = max(concurrency, 1)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.stream = stream
+        self.temperature = temperature
+        self.count_tokens = count_tokens
+        self.pool = ConnectionPool(url, self.concurrency)
+        self._requests = (
+            TokenBucket(requests_per_minute / 60.0) if requests_per_minute else None
+        )
+        self._tokens = (
+            TokenBucket(tokens_per_minute / 60.0, tokens_per_minute)
+            if tokens_per_minute and count_tokens is not None
+            else None
+        )
+
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Configurações que influenciam as respostas (chave do cache de respostas)."""
+        return {"url": self.url, "model": self.model, "temperature": self.temperature}
+
+    def _payload(self, prompt: str) -> bytes:
+        body: Dict[str, Any] = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if self.temperature is not None:
+            body["temperature"] = self.temperature
+        if self.stream:
+            body["stream"] = True
+            body["stream_options"] = {"include_usage": True}
+        return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+    def _request_head(self, length: int) -> bytes:
+        lines = [
+            f"POST {self.path} HTTP/1.1",
+            f"Host: {self.host_header}",
+            "Content-Type: application/json",
+            f"Content-Length: {length}",
+            "Accept: " + ("text/event-stream" if self.stream else "application/json"),
+            "Connection: keep-alive",
+        ]
+        if self.api_key:
+            lines.append(f"Authorization: Bearer {self.api_key}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _exchange(
+        self,
+        connection: Connection,
+        payload: bytes,
+        on_delta: Optional[Callable[[str], None]],
+    ) -> Tuple[Completion, bool]:
+        """Faz uma requisição em uma conexão e retorna a resposta e se ela é reutilizável."""
+        connection.writer.write(self._request_head(len(payload)) + payload)
+        await connection.writer.drain()
+        status, headers = await _read_headers(connection.reader)
+        body = _read_body(connection.reader, headers)
+
+        if status != 200:
+            data = b"".join([chunk async for chunk in body])
+            message = data.decode("utf-8", "replace")[:500]
+            raise SendError(f"HTTP {status}: {message}", status, _retry_after(headers))
+
+        if "text/event-stream" in headers.get("content-type", ""):
+            completion = await self._read_events(body, on_delta)
+        else:
+            data = json.loads(b"".join([chunk async for chunk in body]))
+            completion = Completion(
+                data["choices"][0]["message"].get("content") or "",
+                data.get("model"),
+                data.get("usage"),
+            )
+            if on_delta is not None and completion.content:
+                on_delta(completion.content)
+        return completion, _reusable(headers)
+
+    @staticmethod
+    async def _read_events(
+        body: AsyncIterator[bytes], on_delta: Optional[Callable[[str], None]]
+    ) -> Completion:
+        """Monta a resposta a partir dos eventos data: {...} do streaming."""
+        parts: List[str] = []
+        completion = Completion()
+        buffer = b""
+
+        def handle(line: bytes) -> None:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                return
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                return
+            event = json.loads(data)
+            completion.model = event.get("model", completion.model)
+            if event.get("usage"):
+                completion.usage = event["usage"]
+            for choice in event.get("choices") or ():
+                delta = (choice.get("delta") or {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    if on_delta is not None:
+                        on_delta(delta)
+
+        async for chunk in body:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                handle(line)
+        handle(buffer)
+        completion.content = "".join(parts)
+        return completion
+
+    async def complete(
+        self, prompt: str, on_delta: Optional[Callable[[str], None]] = None
+    ) -> Completion:
+        """
+        Envia um prompt, repetindo a requisição após falhas temporárias.
+
+        Args:
+            prompt: Texto do prompt
+            on_delta: Chamada com cada trecho da resposta à medida que ele chega
+
+        Returns:
+            A resposta do modelo
+
+        Raises:
+            SendError: Se o envio falhar definitivamente
+        """
+        payload = self._payload(prompt)
+        if self._tokens is not None:
+            await self._tokens.acquire(self.count_tokens(prompt))
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self._requests is not None:
+                await self._requests.acquire()
+            connection = await self.pool.acquire()
+            reuse = False
+            try:
+                completion, reuse = await asyncio.wait_for(
+                    self._exchange(connection, payload, on_delta), self.timeout
+                )
+                completion.attempts = attempt
+                return completion
+            except SendError as e:
+                # A resposta de erro foi lida por inteiro: a conexão continua utilizável
+                reuse = e.status is not None
+                error = e
+            except (OSError, EOFError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                error = SendError(f"Falha de conexão: {e!r}")
+            except (ValueError, KeyError, IndexError) as e:
+                error = SendError(f"Resposta inválida: {e!r}", 200)
+            finally:
+                self.pool.release(connection, reuse)
+
+            if not error.retryable or attempt > self.retries:
+                error.attempts = attempt
+                raise error
+            delay = self.backoff * 2 ** (attempt - 1)
+            await asyncio.sleep(max(error.retry_after, delay * random.uniform(0.5, 1.0)))
+
+    async def send_all(
+        self, prompts: Union[Iterable[Tuple[Any, str]], AsyncIterable[Tuple[Any, str]]]
+    ) -> AsyncIterator[Tuple[Any, Completion]]:
+        """
+        Envia vários prompts com concorrência limitada.
+
+        Os prompts são consumidos sob demanda por uma tarefa que os passa aos workers por
+        uma fila limitada: nunca há mais que concurrency prompts gerados aguardando envio.
+        Um iterável síncrono é percorrido no executor padrão (veja iterate_in_executor()),
+        de modo que o parse e a geração dos prompts não bloqueiam os envios em andamento.
+
+        Args:
+            prompts: Tuplas (chave, prompt), síncronas ou assíncronas; a chave identifica
+                     o prompt na saída
+
+        Yields:
+            Tuplas (chave, resposta), na ordem em que as respostas terminam. Envios que
+            falharam definitivamente têm Completion.error preenchido.
+        """
+        if not isinstance(prompts, AsyncIterable):
+            prompts = iterate_in_executor(prompts)
+        pending: asyncio.Queue = asyncio.Queue(self.concurrency)
+        results: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for item in prompts:
+                    await pending.put(item)
+            finally:
+                for _ in range(self.concurrency):
+                    await pending.put(done)
+
+        async def worker() -> None:
+            while True:
+                item = await pending.get()
+                if item is done:
+                    return
+                key, prompt = item
+                try:
+                    completion = await self.complete(prompt)
+                except SendError as e:
+                    completion = Completion(model=self.model, attempts=e.attempts, error=str(e))
+                results.put_nowait((key, completion))
+
+        async def run() -> None:
+            workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+            workers.append(asyncio.create_task(produce()))
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # Um erro fora do envio (por exemplo, ao gerar os prompts) encerra todos
+                for task in workers:
+                    task.cancel()
+                raise
+            finally:
+                results.put_nowait(done)
+
+        runner = asyncio.create_task(run())
+        try:
+            while True:
+                item = await results.get()
+                if item is done:
+                    break
+                yield item
+            await runner
+        finally:
+            if not runner.done():
+                runner.cancel()
+            self.pool.close()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sessão de processamento em etapas.
+
+O processamento de um projeto segue as etapas de docs/especificacao/PROCESSADOR.md:
+parsing, validação, análise e geração. O resultado de cada etapa é memorizado na sessão
+e reaproveitado por todas as chamadas seguintes; invalidate() descarta uma etapa e as que
+dependem dela.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+
+from .manifest import ManifestEntry
+from .model import ParseResult
+
+if TYPE_CHECKING:
+    from .processor import LNEGCProcessor
+
+# Etapas, na ordem em que dependem umas das outras
+STAGES = ("parse", "validate", "analyze", "generate")
+
+# Seção de declaração esperada em cada tipo de especificação
+DECLARATIONS = {
+    "componentes": "COMPONENTE",
+    "entidades": "ENTIDADE",
+    "interfaces": "INTERFACE",
+    "testes": "TESTE",
+}
+
+
+class ParsedFiles:
+    """Resultado da etapa de parsing."""
+
+    __slots__ = ("files", "unchanged", "results")
+
+    def __init__(
+        self,
+        files: List[Tuple[str, Path]],
+        unchanged: Dict[str, ManifestEntry],
+        results: Dict[str, ParseResult],
+    ):
+        """
+        Inicializa o resultado.
+
+        Args:
+            files: Tuplas (tipo, caminho) encontradas pelo scanner
+            unchanged: Registros do manifesto dos arquivos inalterados (não processados)
+            results: Resultados do parse dos demais arquivos, por caminho
+        """
+        self.files = files
+        self.unchanged = unchanged
+        self.results = results
+
+
+class ProcessingSession:
+    """Executa as etapas do processamento uma única vez e memoriza os resultados."""
+
+    def __init__(self, processor: "LNEGCProcessor"):
+        """
+        Inicializa a sessão.
+
+        Args:
+            processor: Processador do projeto
+        """
+        self.processor = processor
+        self._outputs: Dict[str, Any] = {}
+        # Número de execuções de cada etapa
+        self.runs: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self._loaded = False
+
+    def _stage(self, name: str, compute: Callable[[], Any]) -> Any:
+        if name not in self._outputs:
+            self._outputs[name] = compute()
+            self.runs[name] += 1
+        return self._outputs[name]
+
+    def invalidate(self, stage: str = "parse") -> None:
+        """
+        Descarta o resultado de uma etapa e de todas as etapas seguintes.
+
+        Args:
+            stage: Nome da etapa (parse, validate, analyze ou generate)
+
+        Raises:
+            ValueError: Se a etapa não existir
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Etapa desconhecida: {stage}")
+        for name in STAGES[STAGES.index(stage):]:
+            output = self._outputs.pop(name, None)
+            if name == "parse" and output is not None:
+                # Libera os arquivos mapeados dos resultados descartados
+                for result in output.results.values():
+                    result.close()
+        if stage == "parse":
+            self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        """Indica se o resultado do parsing foi carregado com load()."""
+        return self._loaded
+
+    def load(self, parsed: ParsedFiles) -> None:
+        """
+        Usa um resultado de parsing já disponível (como uma IR) no lugar do parse.
+
+        As etapas seguintes são descartadas e executadas a partir desse resultado.
+
+        Args:
+            parsed: Arquivos e resultados do parse
+        """
+        self.invalidate("parse")
+        self._outputs["parse"] = parsed
+        self._loaded = True
+
+    def parse(self) -> ParsedFiles:
+        """Encontra as especificações e faz o parse das que mudaram."""
+        return self._stage("parse", self._parse)
+
+    def _parse(self) -> ParsedFiles:
+        processor = self.processor
+        files = processor.scan_files()
+        unchanged = processor._unchanged(files)
+
+        for results in processor._targets().values():
+            results.clear()
+        processor._load_files([(kind, file) for kind, file in files if str(file) not in unchanged])
+        if processor.cache is not None:
+            processor.cache.evict()
+
+        results = {
+            result.path: result
+            for results in processor._targets().values()
+            for result in results
+        }
+        return ParsedFiles(files, unchanged, results)
+
+    def validate(self) -> List[Tuple[str, str]]:
+        """
+        Verifica as especificações processadas.
+
+        Problemas encontrados não impedem a geração dos prompts.
+
+        Returns:
+            Tuplas (caminho do arquivo, mensagem)
+        """
+        return self._stage("validate", self._validate)
+
+    def _validate(self) -> List[Tuple[str, str]]:
+        parsed = self.parse()
+        problems = []
+        for kind, file in parsed.files:
+            result = parsed.results.get(str(file))
+            if result is None:
+                continue
+            declaration = DECLARATIONS[kind]
+            if declaration not in result.sections:
+                problems.append((str(file), f"Seção [{declaration}] não encontrada"))
+            elif "Nome" not in result.metadata:
+                problems.append((str(file), f"Campo 'Nome' ausente em [{declaration}]"))
+        return problems
+
+    def analyze(self) -> Dict[str, Dict[str, str]]:
+        """
+        Seleciona uma especificação por nome em cada tipo.
+
+        Returns:
+            Mapeamento tipo -> nome -> caminho do arquivo
+        """
+        return self._stage("analyze", self._analyze)
+
+    def _analyze(self) -> Dict[str, Dict[str, str]]:
+        parsed = self.parse()
+        self.validate()
+        names = {
+            str(file): self.processor._record(kind, file, parsed.results[str(file)])
+            for kind, file in parsed.files
+            if str(file) not in parsed.unchanged
+        }
+        return self.processor._select(parsed.files, parsed.unchanged, names)
+
+    def generate(self) -> Dict[str, List[str]]:
+        """
+        Gera os prompts das especificações selecionadas.
+
+        Returns:
+            Dicionário com os prompts gerados para cada tipo de arquivo
+        """
+        return self._stage("generate", self._generate)
+
+    def _generate(self) -> Dict[str, List[str]]:
+        processor = self.processor
+        parsed = self.parse()
+        prompts = {
+            kind: [
+                prompt
+                for path in paths.values()
+                for prompt in processor._render(kind, path, parsed.results)
+            ]
+            for kind, paths in self.analyze().items()
+        }
+        if processor.manifest is not None:
+            processor.manifest.save(parsed.files)
+        return prompts
+
+    def prompts(self) -> List[str]:
+        """Retorna todos os prompts gerados, na ordem dos tipos."""
+        return [prompt for prompts in self.generate().values() for prompt in prompts]
+
+    def counts(self) -> Dict[str, int]:
+        """Retorna o número de prompts gerados de cada tipo."""
+        return {kind: len(prompts) for kind, prompts in self.generate().items()}
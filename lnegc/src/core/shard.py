@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Divisão de um projeto entre vários nós (shards).
+
+Cada especificação pertence a um único shard, escolhido por um hash estável do seu caminho
+relativo ao projeto: a divisão não depende da ordem da varredura nem da máquina. Cada nó
+gera, em JSON Lines, os prompts do seu shard; merge() combina as saídas de todos os shards
+na mesma sequência de prompts que uma execução sem shards produziria.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Tuple
+
+# Ordem dos tipos na saída, a mesma de LNEGCProcessor.process()
+KIND_ORDER = ("componentes", "entidades", "interfaces", "testes")
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """
+    Interpreta a identificação de um shard no formato "i/N".
+
+    Args:
+        text: Texto como "2/4" (o segundo de quatro shards)
+
+    Returns:
+        Tupla (i, N), com 1 <= i <= N
+
+    Raises:
+        ValueError: Se o texto não estiver no formato esperado
+    """
+    index, separator, count = text.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        shard = None
+    if not separator or shard is None or not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Shard inválido: {text} (use i/N, com 1 <= i <= N)")
+    return shard
+
+
+def relative_path(file: Path, directory: Path) -> str:
+    """
+    Caminho de uma especificação relativo ao projeto, com separadores '/'.
+
+    É a chave da divisão em shards e da ordem da varredura dentro de cada raiz.
+    """
+    return Path(os.path.relpath(file, directory)).as_posix()
+
+
+def shard_of(relative: str, count: int) -> int:
+    """
+    Shard de uma especificação.
+
+    Args:
+        relative: Caminho do arquivo relativo ao projeto, com separadores '/'
+        count: Número de shards
+
+    Returns:
+        O número do shard, de 1 a count
+    """
+    digest = hashlib.sha256(relative.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def merge(shards: Iterable[IO[str]]) -> Iterator[Dict]:
+    """
+    Combina as saídas JSON Lines dos shards.
+
+    As raízes seguem a ordem em que foram informadas em --dir e, em cada raiz e tipo, as
+    especificações são ordenadas pelo caminho relativo à raiz, como na varredura;
+    especificações com o mesmo nome são reduzidas à última, na posição dela, como em
+    uma execução sem shards. As partes de uma especificação dividida pelo orçamento de
+    tokens permanecem juntas e na ordem original.
+
+    Args:
+        shards: Arquivos gerados com --format jsonl e --shard
+
+    Yields:
+        Os registros dos prompts, na ordem da execução sem shards
+
+    Raises:
+        ValueError: Se algum registro não tiver o nome da especificação
+    """
+    # raiz -> tipo -> caminho relativo -> (nome, registros das partes)
+    specs: Dict[str, Dict[str, Dict[str, Tuple[str, List[Dict]]]]] = {}
+    # raiz -> posição em --dir
+    positions: Dict[str, int] = {}
+    for stream in shards:
+        for number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "name" not in record:
+                raise ValueError(
+                    f"Linha {number}: registro sem nome; gere os shards com --format jsonl"
+                )
+            root = record.get("root")
+            kinds = specs.setdefault(root, {})
+            positions.setdefault(root, record.get("root_index", len(positions)))
+            files = kinds.setdefault(record["kind"], {})
+            relative = record.get("relative", record["source"])
+            files.setdefault(relative, (record["name"], []))[1].append(record)
+
+    for root in sorted(specs, key=positions.__getitem__):
+        kinds = specs[root]
+        for kind in KIND_ORDER:
+            unique: Dict[str, List[Dict]] = {}
+            for source in sorted(kinds.get(kind, {})):
+                name, records = kinds[kind][source]
+                unique.pop(name, None)
+                unique[name] = records
+            for records in unique.values():
+                yield from records
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Templates Jinja2 dos prompts.
+
+Os templates padrão ficam no pacote (lnegc/src/templates). Um projeto pode sobrescrever
+qualquer um deles com um arquivo de mesmo nome em .lnegc/templates. Cada template é
+compilado uma única vez por execução, e o código compilado é gravado em disco para que
+execuções seguintes não precisem compilá-lo novamente.
+
+No layout "prefixo" (templates em prefixo/), as instruções fixas e os blocos de
+referência vêm antes do conteúdo da especificação: prompts do mesmo tipo começam com o
+mesmo texto, que pode ser aproveitado pelo cache de prefixo do provedor do modelo.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+    UndefinedError,
+)
+
+from .model import ParseResult
+
+# Templates distribuídos com o pacote
+PACKAGE_TEMPLATES = Path(__file__).resolve().parent.parent / "templates"
+
+# Templates do projeto e cache de bytecode, relativos ao diretório do projeto
+PROJECT_TEMPLATES = Path(".lnegc") / "templates"
+BYTECODE_CACHE = Path(".lnegc") / "cache" / "templates"
+
+# Template de cada tipo de especificação
+TEMPLATE_NAMES = {
+    "componentes": "componente.j2",
+    "entidades": "entidade.j2",
+    "interfaces": "interface.j2",
+    "testes": "teste.j2",
+}
+
+# Layout dos prompts -> diretório dos seus templates
+LAYOUTS = {
+    "padrao": "",
+    "prefixo": "prefixo/",
+}
+
+
+def secao(spec: ParseResult, name: str, default: str = "") -> str:
+    """Texto de uma seção, procurada pelo nome e pelo nome em maiúsculas."""
+    return spec.sections.get(name, spec.sections.get(name.upper(), default))
+
+
+def tem_secao(spec: ParseResult, name: str) -> bool:
+    """Indica se a especificação tem uma seção, pelo nome ou pelo nome em maiúsculas."""
+    return name in spec.sections or name.upper() in spec.sections
+
+
+def lista(items: List[str], default: str) -> str:
+    """Formata uma lista de itens, um por linha, ou o texto padrão se estiver vazia."""
+    if not items:
+        return default
+    return "\n".join(f"- {item}" for item in items)
+
+
+class TemplateEngine:
+    """Carrega, compila e aplica os templates dos prompts."""
+
+    def __init__(
+        self,
+        directories: List[Path],
+        bytecode_cache: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Inicializa o ambiente Jinja2.
+
+        Args:
+            directories: Diretórios de templates, em ordem de prioridade
+            bytecode_cache: Diretório do cache de bytecode. Se None, os templates são
+                            compilados a cada execução.
+        """
+        self.directories = directories
+        cache = None
+        if bytecode_cache is not None:
+            Path(bytecode_cache).mkdir(parents=True, exist_ok=True)
+            cache = FileSystemBytecodeCache(str(bytecode_cache))
+
+        # Os templates não são recarregados durante a execução: cada um é compilado
+        # uma única vez e reutilizado em todos os prompts
+        self.environment = Environment(
+            loader=FileSystemLoader([str(d) for d in directories]),
+            bytecode_cache=cache,
+            auto_reload=False,
+            autoescape=False,
+            undefined=StrictUndefined,
+        )
+        self.environment.globals.update(secao=secao, tem_secao=tem_secao, lista=lista)
+        self._templates: Dict[str, Template] = {}
+        self._fingerprint: Optional[str] = None
+
+    @classmethod
+    def for_project(
+        cls, directory: Union[str, Path], cache_root: Optional[Union[str, Path]] = None
+    ) -> "TemplateEngine":
+        """
+        Cria o ambiente de um projeto (memorizado por diretório).
+
+        Args:
+            directory: Diretório do projeto; .lnegc/templates tem prioridade sobre os
+                       templates do pacote
+            cache_root: Diretório cujo .lnegc/cache/templates guarda o bytecode. Se None,
+                        usa o próprio diretório do projeto.
+
+        Returns:
+            O ambiente de templates
+        """
+        directory = Path(directory).absolute()
+        cache_root = Path(cache_root).absolute() if cache_root is not None else directory
+        project = directory / PROJECT_TEMPLATES
+        overrides = project if project.is_dir() else None
+        return _engine(overrides, cache_root / BYTECODE_CACHE)
+
+    def template(self, name: str) -> Template:
+        """Retorna um template compilado."""
+        template = self._templates.get(name)
+        if template is None:
+            template = self._templates[name] = self.environment.get_template(name)
+        return template
+
+    def render(
+        self,
+        kind: str,
+        spec: ParseResult,
+        language: str,
+        layout: str = "padrao",
+        part: Optional[str] = None,
+    ) -> str:
+        """
+        Gera o prompt de uma especificação.
+
+        Args:
+            kind: Tipo da especificação
+            spec: Resultado do parse
+            language: Linguagem alvo
+            layout: Layout do prompt (uma das chaves de LAYOUTS)
+            part: Parte da especificação dividida ("2 de 3"), ou None
+
+        Returns:
+            O prompt gerado
+        """
+        name = LAYOUTS[layout] + TEMPLATE_NAMES[kind]
+        return self.template(name).render(spec=spec, linguagem=language, parte=part)
+
+    def reference_blocks(self) -> List[str]:
+        """
+        Textos dos blocos de referência (templates em referencias/), que se repetem em
+        todos os prompts de um tipo.
+
+        Returns:
+            Os textos dos blocos que não dependem da especificação
+        """
+        blocks = []
+        for name in self.environment.list_templates():
+            if not name.startswith("referencias/"):
+                continue
+            try:
+                blocks.append(self.template(name).render())
+            except UndefinedError:
+                # Bloco sobrescrito que usa dados da especificação: não é compartilhado
+                continue
+        return blocks
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash do conteúdo de todos os templates em uso, para invalidar prompts antigos."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            loader = self.environment.loader
+            for name in sorted(self.environment.list_templates()):
+                source, _, _ = loader.get_source(self.environment, name)
+                digest.update(name.encode("utf-8") + b"\0" + source.encode("utf-8") + b"\0")
+            self._fingerprint = digest.hexdigest()[:16]
+        return self._fingerprint
+
+
+@lru_cache(maxsize=None)
+def _engine(overrides: Optional[Path], bytecode_cache: Path) -> TemplateEngine:
+    directories = [PACKAGE_TEMPLATES] if overrides is None else [overrides, PACKAGE_TEMPLATES]
+    return TemplateEngine(directories, bytecode_cache)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Estimativa de tokens e divisão de prompts grandes.
+
+A contagem é feita localmente, sem chamadas ao modelo, por um tokenizador registrado pelo
+nome. O estimador padrão não tem dependências; o tokenizador do tiktoken é usado se o
+pacote estiver instalado.
+
+No modo de orçamento, uma especificação cujo prompt excede o limite de tokens é dividida
+em várias partes: cada parte repete o cabeçalho de metadados e contém um subconjunto dos
+itens (atributos, validações, regras, ...), na ordem original.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .model import DECLARATION_SECTIONS, LIST_SECTIONS, ParseResult
+
+# Função que conta os tokens de um texto
+Tokenizer = Callable[[str], int]
+
+# Tokenizador usado quando nenhum é informado
+DEFAULT_TOKENIZER = "estimativa"
+
+# Pedaços contados como um token pelo estimador: até 4 caracteres de uma palavra, ou um
+# sinal de pontuação
+_PIECE = re.compile(r"\w{1,4}|[^\w\s]")
+
+# Início de um item de lista em uma seção de texto
+_ITEM = re.compile(r"(?:[-*+]|\d+[.)])\s")
+
+# Marcador que identifica o conteúdo de uma seção no prompt gerado
+_MARKER = "@@LNEGC_SECTION:{}@@"
+
+
+def estimate(text: str) -> int:
+    """Estima os tokens de um texto (palavras em pedaços de 4 caracteres e pontuação)."""
+    return len(_PIECE.findall(text))
+
+
+def characters(text: str) -> int:
+    """Estima os tokens de um texto como um token a cada 4 caracteres."""
+    return (len(text) + 3) // 4
+
+
+def _tiktoken(encoding: Optional[str] = None) -> Tokenizer:
+    try:
+        import tiktoken
+    except ImportError:
+        raise ValueError("O tokenizador tiktoken requer o pacote tiktoken") from None
+    codec = tiktoken.get_encoding(encoding or "cl100k_base")
+    return lambda text: len(codec.encode(text, disallowed_special=()))
+
+
+# Nome do tokenizador -> função que o cria, opcionalmente com um argumento
+TOKENIZERS: Dict[str, Callable[..., Tokenizer]] = {
+    "estimativa": lambda: estimate,
+    "caracteres": lambda: characters,
+    "tiktoken": _tiktoken,
+}
+
+
+def register_tokenizer(name: str, factory: Callable[..., Tokenizer]) -> None:
+    """
+    Registra um tokenizador.
+
+    Args:
+        name: Nome do tokenizador
+        factory: Função que cria o tokenizador. Recebe o argumento informado após ':'
+                 no nome (por exemplo, "tiktoken:o200k_base"), se houver.
+    """
+    TOKENIZERS[name] = factory
+    get_tokenizer.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(name: str = DEFAULT_TOKENIZER) -> Tokenizer:
+    """
+    Retorna um tokenizador registrado (memorizado por nome).
+
+    Args:
+        name: Nome do tokenizador, opcionalmente seguido de ':' e um argumento
+
+    Returns:
+        Função que conta os tokens de um texto
+
+    Raises:
+        ValueError: Se o tokenizador não existir ou não puder ser criado
+    """
+    base, _, argument = name.partition(":")
+    factory = TOKENIZERS.get(base)
+    if factory is None:
+        raise ValueError(f"Tokenizador desconhecido: {base}")
+    return factory(argument) if argument else factory()
+
+
+class PromptTooLargeError(ValueError):
+    """Prompt que excede o orçamento de tokens e não pode ser dividido."""
+
+    def __init__(self, path: Optional[str], tokens: int, budget: int):
+        """
+        Inicializa o erro.
+
+        Args:
+            path: Arquivo da especificação
+            tokens: Tokens do menor prompt que foi possível gerar
+            budget: Limite de tokens por prompt
+        """
+        super().__init__(
+            f"Prompt de {path or 'especificação'} tem {tokens} tokens, "
+            f"acima do limite de {budget}"
+        )
+        self.path = path
+        self.tokens = tokens
+        self.budget = budget
+
+
+def _blocks(text: str) -> List[str]:
+    """
+    Divide o texto de uma seção em itens de lista e parágrafos.
+
+    Blocos de código (```) nunca são divididos.
+    """
+    blocks: List[List[str]] = []
+    current: List[str] = []
+    fenced = False
+    for line in text.split("\n"):
+        starts = current and line.strip() and (_ITEM.match(line) or not current[-1].strip())
+        if starts and not fenced:
+            blocks.append(current)
+            current = []
+        current.append(line)
+        if line.lstrip().startswith("```"):
+            fenced = not fenced
+    blocks.append(current)
+    return ["\n".join(block) for block in blocks]
+
+
+def _rendered(
+    kind: str, spec: ParseResult, render: Callable[[ParseResult, Optional[str]], str]
+) -> Set[str]:
+    """
+    Listas (entidades) ou seções que o template do tipo inclui no prompt.
+
+    Cada candidata recebe um marcador e o prompt é gerado uma vez: as seções cujo
+    marcador aparece são as que o template usa. Templates do projeto podem usar seções
+    diferentes das dos templates padrão.
+    """
+    if kind == "entidades":
+        names = [attr for attr, _ in LIST_SECTIONS]
+        lists = {attr: [_MARKER.format(attr)] for attr in names}
+        probe = ParseResult(spec.metadata, spec.sections, spec.path, **lists)
+    else:
+        names = [name for name in spec.sections if name not in DECLARATION_SECTIONS]
+        sections = dict(spec.sections)
+        sections.update((name, _MARKER.format(name)) for name in names)
+        probe = ParseResult(spec.metadata, sections, spec.path)
+    prompt = render(probe, None)
+    return {name for name in names if _MARKER.format(name) in prompt}
+
+
+def _units(kind: str, spec: ParseResult, rendered: Set[str]) -> List[Tuple[str, str]]:
+    """
+    Itens que podem ser distribuídos entre as partes de uma especificação.
+
+    Apenas itens com texto de listas ou seções que o template inclui no prompt são
+    distribuídos: os demais deixariam partes sem conteúdo.
+
+    Returns:
+        Tuplas (atributo ou seção, texto do item)
+    """
+    if kind == "entidades":
+        units = [(attr, item) for attr, _ in LIST_SECTIONS for item in getattr(spec, attr)]
+    else:
+        units = [
+            (name, block)
+            for name, text in spec.sections.items()
+            if name not in DECLARATION_SECTIONS
+            for block in _blocks(text)
+        ]
+    return [(name, text) for name, text in units if name in rendered and text.strip()]
+
+
+def _part(
+    kind: str, spec: ParseResult, units: List[Tuple[str, str]], rendered: Set[str]
+) -> ParseResult:
+    """Cria uma especificação com os metadados de spec e apenas os itens informados."""
+    if kind == "entidades":
+        lists: Dict[str, List[str]] = {attr: [] for attr, _ in LIST_SECTIONS}
+        for attr, item in units:
+            lists[attr].append(item)
+        return ParseResult(spec.metadata, spec.sections, spec.path, **lists)
+
+    # Seções incluídas no prompt e sem itens nesta parte ficam vazias, para que os
+    # templates não usem o texto padrão de seções ausentes
+    grouped: Dict[str, List[str]] = {name: [] for name in spec.sections if name in rendered}
+    for name, block in units:
+        grouped[name].append(block)
+    sections = dict(spec.sections)
+    sections.update(
+        (name, "\n".join(blocks).strip("\n")) for name, blocks in grouped.items()
+    )
+    return ParseResult(spec.metadata, sections, spec.path)
+
+
+def split(
+    kind: str,
+    spec: ParseResult,
+    render: Callable[[ParseResult, Optional[str]], str],
+    count: Tokenizer,
+    budget: int,
+) -> List[str]:
+    """
+    Divide uma especificação em prompts que respeitam o orçamento de tokens.
+
+    Args:
+        kind: Tipo da especificação
+        spec: Resultado do parse
+        render: Gera o prompt de uma especificação; o segundo argumento identifica a
+                parte ("2 de 3"), ou é None se o prompt não for dividido
+        count: Tokenizador
+        budget: Limite de tokens por prompt
+
+    Returns:
+        Os prompts da especificação: apenas um, se ele couber no orçamento
+
+    Raises:
+        PromptTooLargeError: Se algum item, junto com o cabeçalho, exceder o orçamento
+    """
+    prompt = render(spec, None)
+    tokens = count(prompt)
+    if tokens <= budget:
+        return [prompt]
+
+    rendered = _rendered(kind, spec, render)
+    units = _units(kind, spec, rendered)
+    if len(units) < 2:
+        raise PromptTooLargeError(spec.path, tokens, budget)
+
+    # Distribui os itens pelo custo estimado de cada um e depois confere as partes
+    # geradas, dividindo ao meio as que ainda excederem o orçamento
+    header = count(render(_part(kind, spec, [], rendered), f"{len(units)} de {len(units)}"))
+    if header > budget:
+        raise PromptTooLargeError(spec.path, header, budget)
+
+    groups: List[List[Tuple[str, str]]] = [[]]
+    size = header
+    for unit in units:
+        cost = count(unit[1]) + 2
+        if groups[-1] and size + cost > budget:
+            groups.append([])
+            size = header
+        groups[-1].append(unit)
+        size += cost
+
+    while True:
+        total = len(groups)
+        prompts = [
+            render(_part(kind, spec, group, rendered), f"{number} de {total}")
+            for number, group in enumerate(groups, 1)
+        ]
+        for index, prompt in enumerate(prompts):
+            tokens = count(prompt)
+            if tokens > budget:
+                break
+        else:
+            return prompts
+
+        group = groups[index]
+        if len(group) < 2:
+            raise PromptTooLargeError(spec.path, tokens, budget)
+        middle = len(group) // 2
+        groups[index:index + 1] = [group[:middle], group[middle:]]
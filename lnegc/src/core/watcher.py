@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Observação de alterações em arquivos LNEGC.
+
+No Linux os eventos são recebidos do inotify (via ctypes, sem dependências externas). Em
+outros sistemas, ou se o inotify não estiver disponível, a árvore é comparada
+periodicamente com a varredura anterior.
+
+A sessão de observação mantém os resultados do parse e os prompts em memória e, a cada
+alteração, processa e gera novamente apenas os arquivos modificados.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .files import write_atomic
+from .ignore import IgnoreRules
+from .parser import LNEGCParser
+from .processor import LNEGCProcessor, select_unique
+from .scanner import is_pruned, scan
+from .shard import relative_path
+
+# Constantes do inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+WATCH_MASK = (
+    IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+)
+
+_EVENT = struct.Struct("iIII")
+
+# Tempo de espera por eventos adicionais após o primeiro, para agrupar gravações
+DEBOUNCE = 0.05
+
+
+class PollingWatcher:
+    """Observador que compara varreduras periódicas do projeto."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        interval: float = 1.0,
+        ignore: Optional[IgnoreRules] = None,
+        files: Optional[Callable[[], Iterable[Tuple[str, Path]]]] = None,
+    ):
+        """
+        Inicializa o observador.
+
+        Args:
+            directory: Diretório raiz do projeto
+            interval: Intervalo entre varreduras em segundos
+            ignore: Padrões de exclusão aplicados às varreduras
+            files: Função que lista os arquivos do projeto, como
+                   LNEGCProcessor.scan_files, para respeitar a seção [DIRETÓRIOS]. Se
+                   None, todo o diretório é percorrido.
+        """
+        self.directory = Path(directory)
+        self.interval = interval
+        self.ignore = ignore
+        self.files = files
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        if self.files is not None:
+            files = self.files()
+        else:
+            files = scan(self.directory, ignore=self.ignore)
+        for _, file in files:
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            snapshot[str(file)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Aguarda alterações.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos. Se None, espera um intervalo.
+
+        Returns:
+            Caminhos dos arquivos criados, alterados ou removidos
+        """
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        snapshot = self._scan()
+        changed = {
+            Path(path)
+            for path in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Observador baseado no inotify do Linux."""
+
+    def __init__(self, directory: Union[str, Path], ignore: Optional[IgnoreRules] = None):
+        """
+        Inicializa o observador e registra todos os diretórios do projeto.
+
+        Args:
+            directory: Diretório raiz do projeto
+            ignore: Padrões de exclusão; diretórios ignorados não são observados
+
+        Raises:
+            OSError: Se o inotify não estiver disponível
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify disponível apenas no Linux")
+
+        self.directory = Path(directory)
+        self.ignore = ignore
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        self._watches: Dict[int, str] = {}
+        self._add_tree(str(self.directory))
+
+    def _add_watch(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return
+            raise OSError(error, os.strerror(error), path)
+        self._watches[wd] = path
+
+    def _add_tree(self, root: str) -> List[Path]:
+        """Registra um diretório e seus subdiretórios, retornando os arquivos existentes."""
+        files = []
+        for path, directories, names in os.walk(root):
+            directories[:] = [
+                name for name in directories if not self._ignored(os.path.join(path, name))
+            ]
+            self._add_watch(path)
+            files.extend(Path(path) / name for name in names)
+        return files
+
+    def _ignored(self, directory: str) -> bool:
+        if self.ignore is None:
+            return is_pruned(os.path.basename(directory))
+        relative = self.ignore.relative(directory)
+        return relative is not None and self.ignore.match(relative, True)
+
+    def _read_events(self, changed: Set[Path]) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            base = self._watches.get(wd)
+            if base is None or not name:
+                continue
+            path = os.path.join(base, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not self._ignored(path):
+                    # Diretórios novos podem já conter arquivos quando o registro é feito
+                    changed.update(self._add_tree(path))
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    # Arquivos do diretório removido são identificados pela sessão
+                    changed.add(Path(path))
+                continue
+            changed.add(Path(path))
+
+    def poll(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Aguarda alterações.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos. Se None, espera indefinidamente.
+
+        Returns:
+            Caminhos dos arquivos e diretórios criados, alterados ou removidos
+        """
+        changed: Set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            self._read_events(changed)
+            ready, _, _ = select.select([self._fd], [], [], DEBOUNCE)
+        return changed
+
+    def close(self) -> None:
+        """Libera o descritor do inotify."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(
+    directory: Union[str, Path],
+    polling: bool = False,
+    interval: float = 1.0,
+    ignore: Optional[IgnoreRules] = None,
+    files: Optional[Callable[[], Iterable[Tuple[str, Path]]]] = None,
+) -> Union[InotifyWatcher, PollingWatcher]:
+    """
+    Cria o observador mais eficiente disponível.
+
+    Args:
+        directory: Diretório raiz do projeto
+        polling: Se True, usa sempre a varredura periódica
+        interval: Intervalo entre varreduras do observador por varredura
+        ignore: Padrões de exclusão do projeto
+        files: Função que lista os arquivos do projeto, usada pelo observador por
+               varredura
+
+    Returns:
+        Um InotifyWatcher, ou um PollingWatcher se o inotify não estiver disponível
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(directory, ignore)
+        except (OSError, AttributeError):
+            # AttributeError: libc sem as funções do inotify
+            pass
+    return PollingWatcher(directory, interval, ignore, files)
+
+
+class WatchSession:
+    """Mantém resultados e prompts em memória e os atualiza a cada alteração."""
+
+    def __init__(self, processor: LNEGCProcessor, output: Union[str, Path]):
+        """
+        Inicializa a sessão.
+
+        Args:
+            processor: Processador do projeto, com a configuração já carregada
+            output: Arquivo de saída dos prompts
+        """
+        self.processor = processor
+        self.output = Path(output)
+        # caminho -> (tipo, nome para unicidade, texto dos prompts)
+        self.specs: Dict[str, Tuple[str, str, str]] = {}
+        # A umask só pode ser lida alterando-a (veja writeback.write_files)
+        self._umask = os.umask(0o022)
+        os.umask(self._umask)
+
+    def build(self) -> None:
+        """Processa todo o projeto e grava a saída."""
+        self.specs.clear()
+        for kind, file in self.processor.scan_files():
+            self._render(kind, file)
+        self.write()
+
+    def _render(self, kind: str, file: Path) -> None:
+        with LNEGCParser(file, cache=self.processor.cache).parse() as result:
+            self.specs[str(file)] = (
+                kind,
+                self.processor._dedup_name(kind, result),
+                "\n\n".join(self.processor._generate_prompts(kind, result)),
+            )
+
+    def update(self, changed: Set[Path]) -> int:
+        """
+        Processa novamente os arquivos alterados e grava a saída se algo mudou.
+
+        Args:
+            changed: Caminhos informados pelo observador
+
+        Returns:
+            Número de especificações atualizadas ou removidas
+        """
+        updated = 0
+        for path in changed:
+            # Diretórios removidos: descarta as especificações contidas neles
+            prefix = str(path) + os.sep
+            removed = [spec for spec in self.specs if spec.startswith(prefix)]
+            for spec in removed:
+                del self.specs[spec]
+            updated += len(removed)
+
+            kind = self.processor.kind_of(path)
+            if kind is None:
+                continue
+            if path.is_file():
+                try:
+                    self._render(kind, path)
+                except (OSError, UnicodeDecodeError):
+                    # Arquivo removido ou gravado parcialmente; o próximo evento o atualiza
+                    continue
+                updated += 1
+            elif self.specs.pop(str(path), None) is not None:
+                updated += 1
+
+        if updated:
+            self.write()
+        return updated
+
+    def prompts(self) -> Dict[str, List[str]]:
+        """
+        Retorna os prompts atuais agrupados por tipo, sem especificações duplicadas.
+
+        As especificações seguem a ordem da varredura e as duplicadas são removidas como
+        em LNEGCProcessor.process(), independentemente da ordem das atualizações.
+        """
+        directory = self.processor.directory
+        paths = sorted(self.specs, key=lambda path: relative_path(Path(path), directory))
+        unique = select_unique(self.specs[path] for path in paths)
+        return {kind: list(prompts.values()) for kind, prompts in unique.items()}
+
+    def write(self) -> None:
+        """
+        Grava a saída a partir dos prompts em memória.
+
+        As permissões de uma saída existente são mantidas; uma saída nova recebe as
+        permissões padrão da umask, como um arquivo criado com open().
+        """
+        text = "\n\n".join(prompt for prompts in self.prompts().values() for prompt in prompts)
+        try:
+            mode = self.output.stat().st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o666 & ~self._umask
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.output, text, mode)
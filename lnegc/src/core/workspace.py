@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Processamento de vários projetos LNEGC em uma única execução.
+
+Cada raiz tem a sua própria configuração (config.lnegc) e o seu próprio manifesto
+incremental; o cache de parse, os pools de workers e os templates compilados são
+compartilhados entre todas. Os caches ficam no diretório .lnegc da primeira raiz.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cache import ParseCache
+from .processor import LNEGCProcessor, WorkerPools
+from .templates import TemplateEngine
+from .tokens import DEFAULT_TOKENIZER
+
+
+class Workspace:
+    """Conjunto de projetos LNEGC processados com recursos compartilhados."""
+
+    def __init__(
+        self,
+        directories: Iterable[Union[str, Path]],
+        target_language: Optional[str] = None,
+        cache: Optional[ParseCache] = None,
+        jobs: int = 1,
+        incremental: bool = False,
+        layout: str = "padrao",
+        budget: Optional[int] = None,
+        tokenizer: str = DEFAULT_TOKENIZER,
+        shard: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Inicializa o workspace.
+
+        Args:
+            directories: Diretórios raiz dos projetos. Raízes repetidas são ignoradas.
+            target_language: Linguagem alvo para todas as raízes. Se None, cada raiz usa
+                             a linguagem da sua configuração.
+            cache: Cache de parse compartilhado entre as raízes
+            jobs: Número de workers dos pools compartilhados. Valores menores que 1 usam
+                  o número de CPUs disponíveis.
+            incremental: Se True, cada raiz mantém o seu manifesto de build incremental
+            layout: Layout dos prompts de todas as raízes
+            budget: Limite de tokens por prompt; prompts maiores são divididos
+            tokenizer: Nome do tokenizador usado para contar os tokens
+            shard: Tupla (i, N): cada raiz processa apenas o i-ésimo de N shards
+        """
+        self.roots: List[Path] = list(dict.fromkeys(Path(d).absolute() for d in directories))
+        self.cache = cache
+        self.jobs = jobs if jobs >= 1 else (os.cpu_count() or 1)
+        self.pools = WorkerPools(self.jobs)
+        # Raízes sem templates próprios compartilham um único ambiente de templates
+        shared_root = self.cache_root(self.roots)
+        self.processors: Dict[Path, LNEGCProcessor] = {
+            root: LNEGCProcessor(
+                root,
+                target_language,
+                cache=cache,
+                jobs=self.jobs,
+                incremental=incremental,
+                pools=self.pools,
+                templates=TemplateEngine.for_project(root, shared_root),
+                layout=layout,
+                budget=budget,
+                tokenizer=tokenizer,
+                shard=shard,
+            )
+            for root in self.roots
+        }
+
+    @staticmethod
+    def cache_root(directories: Iterable[Union[str, Path]]) -> Path:
+        """
+        Diretório cujo .lnegc guarda os caches compartilhados pelas raízes (parse,
+        respostas e templates compilados): a primeira raiz.
+
+        O diretório comum às raízes não é usado: raízes sem relação entre si (como
+        /tmp/a e /var/tmp/b) teriam os caches gravados em /.lnegc.
+        """
+        return Path(next(iter(directories))).absolute()
+
+    def label(self, root: Path) -> str:
+        """Nome de uma raiz na saída, relativo ao diretório comum das raízes."""
+        base = Path(os.path.commonpath([os.fspath(r) for r in self.roots]))
+        relative = root.relative_to(base).as_posix()
+        return relative if relative != "." else root.name
+
+    def process(self) -> Iterator[Tuple[Path, Dict[str, List[str]]]]:
+        """
+        Processa cada raiz, na ordem em que foram informadas.
+
+        Yields:
+            Tuplas (raiz, prompts por tipo), como retornado por LNEGCProcessor.process()
+        """
+        for root, processor in self.processors.items():
+            yield root, processor.process()
+
+    def iter_prompts(self) -> Iterator[Tuple[Path, str, Path, str]]:
+        """
+        Gera os prompts de cada raiz um a um, sem mantê-los em memória.
+
+        Yields:
+            Tuplas (raiz, tipo, caminho do arquivo, prompt)
+        """
+        for root, kind, _, path, prompt in self.iter_specs():
+            yield root, kind, path, prompt
+
+    def iter_specs(self) -> Iterator[Tuple[Path, str, str, Path, str]]:
+        """
+        Gera os prompts de cada raiz um a um, com o nome de cada especificação.
+
+        Yields:
+            Tuplas (raiz, tipo, nome da especificação, caminho do arquivo, prompt)
+        """
+        for root, processor in self.processors.items():
+            for kind, name, path, prompt in processor.iter_specs():
+                yield root, kind, name, path, prompt
+
+    def close(self) -> None:
+        """Encerra os pools compartilhados."""
+        self.pools.close()
+
+    def __enter__(self) -> "Workspace":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
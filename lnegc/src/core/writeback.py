@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gravação do código gerado pelo modelo nos arquivos do projeto.
+
+Os blocos de código das respostas são gravados em <destino>/<diretório do tipo>/<Nome>,
+com o diretório do tipo vindo da seção [DIRETÓRIOS] da configuração. Um bloco pode indicar
+o próprio arquivo no rótulo (```python models/usuario.py). As gravações são paralelas e
+atômicas, e arquivos cujo conteúdo não mudou não são regravados: o horário de modificação
+é preservado e as ferramentas de build incrementais não recompilam o que não mudou.
+"""
+
+import os
+import re
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .cache import ParseCache
+from .config import ProjectConfig
+from .files import write_atomic
+from .parser import LNEGCParser
+
+# Extensão dos arquivos por linguagem (rótulo do bloco ou linguagem alvo do projeto)
+EXTENSIONS = {
+    "python": ".py",
+    "py": ".py",
+    "typescript": ".ts",
+    "ts": ".ts",
+    "tsx": ".tsx",
+    "javascript": ".js",
+    "js": ".js",
+    "jsx": ".jsx",
+    "react": ".tsx",
+    "vite/react": ".tsx",
+    "java": ".java",
+    "kotlin": ".kt",
+    "go": ".go",
+    "rust": ".rs",
+    "c#": ".cs",
+    "csharp": ".cs",
+    "php": ".php",
+    "ruby": ".rb",
+    "sql": ".sql",
+    "css": ".css",
+    "html": ".html",
+}
+
+# Rótulos de blocos que não contêm código do projeto (exemplos de uso, saída de comandos)
+IGNORED_LANGUAGES = frozenset(("bash", "sh", "shell", "console", "text", "plaintext"))
+
+# Bloco cercado por ``` ou ~~~, com o rótulo na linha de abertura
+_FENCE = re.compile(
+    r"^[ \t]*(`{3,}|~{3,})[ \t]*([^\n`]*)\n(.*?)^[ \t]*\1[ \t]*$", re.MULTILINE | re.DOTALL
+)
+
+# Caracteres que não podem aparecer no nome de um arquivo gerado a partir do Nome
+_UNSAFE = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+class CodeBlock:
+    """Bloco de código de uma resposta."""
+
+    __slots__ = ("language", "path", "code")
+
+    def __init__(self, language: str, path: Optional[str], code: str):
+        self.language = language
+        self.path = path
+        self.code = code
+
+
+def _info(info: str) -> Tuple[str, Optional[str]]:
+    """Separa a linguagem e o arquivo do rótulo de um bloco."""
+    tokens = info.split()
+    if not tokens:
+        return "", None
+    language, _, path = tokens[0].partition(":")
+    for token in tokens[1:]:
+        for prefix in ("title=", "file=", "filename="):
+            if token.startswith(prefix):
+                token = token[len(prefix):]
+        token = token.strip("\"'")
+        if "." in token or "/" in token:
+            path = token
+    return language.lower(), path or None
+
+
+def extract_blocks(text: str) -> List[CodeBlock]:
+    """
+    Extrai os blocos de código cercados de uma resposta.
+
+    Args:
+        text: Texto da resposta em Markdown
+
+    Returns:
+        Os blocos, na ordem em que aparecem
+    """
+    blocks = []
+    for match in _FENCE.finditer(text):
+        language, path = _info(match.group(2))
+        blocks.append(CodeBlock(language, path, match.group(3)))
+    return blocks
+
+
+def file_name(name: str) -> str:
+    """
+    Nome de arquivo seguro a partir do Nome de uma especificação.
+
+    Raises:
+        ValueError: Se o nome não produzir um nome de arquivo válido
+    """
+    safe = _UNSAFE.sub("_", name.strip()).strip("._")
+    if not safe:
+        raise ValueError(f"Nome inválido para um arquivo: {name!r}")
+    return safe
+
+
+def spec_name(source: Union[str, Path], cache: Optional[ParseCache] = None) -> str:
+    """
+    Nome dos arquivos gerados para uma especificação.
+
+    Args:
+        source: Arquivo .lnegc da especificação
+        cache: Cache de parse
+
+    Returns:
+        O campo Nome da especificação ou, se ele não existir, o nome do arquivo de origem
+    """
+    source = Path(source)
+    try:
+        with LNEGCParser(source, cache=cache).parse() as result:
+            name = result.metadata.get("Nome")
+    except OSError:
+        name = None
+    return name or source.stem
+
+
+def kind_directory(target: Path, kind: str, config: Optional[ProjectConfig]) -> Path:
+    """Diretório de destino dos arquivos de um tipo, da seção [DIRETÓRIOS]."""
+    directories = config.directories if config is not None else {}
+    return target / directories.get(kind, kind)
+
+
+def spec_files(
+    blocks: Iterable[CodeBlock], directory: Path, name: str, language: str, root: Path
+) -> List[Tuple[Path, str]]:
+    """
+    Arquivos de destino dos blocos de código da resposta de uma especificação.
+
+    Blocos sem arquivo no rótulo são gravados em <directory>/<name><extensão>, com a
+    extensão da linguagem do bloco ou, se ela não for conhecida, da linguagem alvo.
+    Blocos de linguagens de IGNORED_LANGUAGES são descartados.
+
+    Args:
+        blocks: Blocos da resposta
+        directory: Diretório de destino do tipo da especificação
+        name: Nome da especificação (veja spec_name())
+        language: Linguagem alvo do projeto
+        root: Diretório de destino, do qual os arquivos não podem sair
+
+    Returns:
+        Lista de tuplas (arquivo, código)
+
+    Raises:
+        ValueError: Se um bloco indicar um arquivo fora do diretório de destino
+    """
+    files = []
+    for block in blocks:
+        if block.language in IGNORED_LANGUAGES:
+            continue
+        if block.path is not None:
+            path = (directory / block.path).resolve()
+            if not path.is_relative_to(root.resolve()):
+                raise ValueError(f"Arquivo fora do diretório de destino: {block.path}")
+        else:
+            extension = EXTENSIONS.get(block.language) or EXTENSIONS.get(language.lower())
+            if extension is None:
+                continue
+            path = directory / (file_name(name) + extension)
+        files.append((path, block.code))
+    return files
+
+
+def write_if_changed(path: Path, text: str, umask: int = 0o022) -> bool:
+    """
+    Grava um arquivo via arquivo temporário e renomeação, se o conteúdo mudou.
+
+    Args:
+        path: Arquivo de destino
+        text: Conteúdo do arquivo
+        umask: Máscara aplicada às permissões de arquivos novos
+
+    Returns:
+        True se o arquivo foi gravado, False se já tinha o mesmo conteúdo
+    """
+    data = text.encode("utf-8")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        mode = 0o666 & ~umask
+    else:
+        if stat.st_size == len(data) and path.read_bytes() == data:
+            return False
+        mode = stat.st_mode & 0o7777
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, data, mode)
+    return True
+
+
+def write_files(files: Dict[Path, str], pool: Executor) -> Tuple[List[Path], List[Path]]:
+    """
+    Grava os arquivos em paralelo, ignorando os que não mudaram.
+
+    Args:
+        files: Arquivo -> conteúdo
+        pool: Pool de threads usado nas gravações
+
+    Returns:
+        Tupla (arquivos gravados, arquivos sem alteração)
+    """
+    # A umask só pode ser lida alterando-a; isso é feito antes das gravações em paralelo
+    umask = os.umask(0o022)
+    os.umask(umask)
+    paths = list(files)
+    changed = pool.map(lambda path: write_if_changed(path, files[path], umask), paths)
+    written: List[Path] = []
+    unchanged: List[Path] = []
+    for path, was_written in zip(paths, changed):
+        (written if was_written else unchanged).append(path)
+    return written, unchanged
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o formato de saída em pacote (bundle).
+"""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.bundle import BundleWriter, expand
+
+
+class TestBundle(TestCase):
+    """Testes para a gravação e a expansão de pacotes."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.project = self.temp_dir / "projeto"
+        (self.project / "componentes").mkdir(parents=True)
+        (self.project / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        for index in range(5):
+            (self.project / "componentes" / f"c{index}.lnegc").write_text(
+                f"[COMPONENTE]\nNome: C{index}\n\n## Metadados\n- **nome**: C{index}\n",
+                encoding="utf-8",
+            )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_blocks_stored_once_and_expanded(self):
+        """Testa que cada bloco é gravado uma vez e que a expansão reproduz a saída."""
+        text = self.temp_dir / "prompts.txt"
+        bundle = self.temp_dir / "prompts.jsonl"
+        expanded = self.temp_dir / "expandido.txt"
+        base = ["--dir", str(self.project), "--output"]
+        self.assertEqual(cli_main([*base, str(text)]), 0)
+        self.assertEqual(cli_main([*base, str(bundle), "--format", "bundle"]), 0)
+
+        records = [json.loads(line) for line in bundle.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual([r["type"] for r in records], ["header", "block"] + ["prompt"] * 5)
+        self.assertLess(bundle.stat().st_size, text.stat().st_size / 2)
+
+        self.assertEqual(cli_main(["bundle", "expand", str(bundle), "--output", str(expanded)]), 0)
+        self.assertEqual(expanded.read_bytes(), text.read_bytes())
+
+    def test_undefined_block(self):
+        """Testa o erro para marcadores de blocos que não foram definidos."""
+        stream = io.StringIO()
+        BundleWriter(stream, ["bloco compartilhado"]).write("testes", "a", "x bloco compartilhado")
+        records = stream.getvalue().splitlines()
+        self.assertEqual(list(expand(records))[0][1], "x bloco compartilhado")
+
+        with self.assertRaises(ValueError):
+            list(expand([records[0], records[2]]))
+        with self.assertRaises(ValueError):
+            list(expand(['{"type": "header", "format": "outro"}']))
+
+
+if __name__ == "__main__":
+    main()
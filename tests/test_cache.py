@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o cache persistente de parse do LNEGC.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.lazy import LazySections
+from lnegc.src.core.parser import PARSER_VERSION, LNEGCParser
+
+
+class TestParseCache(TestCase):
+    """Testes para o ParseCache."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.test_file = self.temp_dir / "componentes" / "validador.lnegc"
+        self.test_file.parent.mkdir()
+        self.test_file.write_text(
+            "[COMPONENTE]\nNome: ValidadorCPF\n\n[REGRAS]\n- CPF deve ter 11 dígitos\n",
+            encoding="utf-8",
+        )
+        self.cache = ParseCache.for_project(self.temp_dir, PARSER_VERSION)
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_hit_after_miss(self):
+        """Testa que o segundo parse do mesmo conteúdo vem do cache."""
+        first = LNEGCParser(self.test_file, cache=self.cache).parse()
+        second = LNEGCParser(self.test_file, cache=self.cache).parse()
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(second.to_dict(), first.to_dict())
+        self.assertEqual(second.path, str(self.test_file))
+
+    def test_changed_content_or_version_misses(self):
+        """Testa que conteúdo ou versão diferentes não usam a entrada antiga."""
+        LNEGCParser(self.test_file, cache=self.cache).parse()
+        self.test_file.write_text("[COMPONENTE]\nNome: Outro\n", encoding="utf-8")
+        result = LNEGCParser(self.test_file, cache=self.cache).parse()
+
+        self.assertEqual(result.metadata["Nome"], "Outro")
+        self.assertEqual(self.cache.misses, 2)
+
+        other = ParseCache(self.cache.root, "outra-versao")
+        LNEGCParser(self.test_file, cache=other).parse()
+        self.assertEqual(other.misses, 1)
+
+    def test_sections_stored_without_decoding(self):
+        """Testa que as seções são gravadas sem decodificação e lidas sob demanda."""
+        self.test_file.write_text(
+            "[COMPONENTE]\nNome: ValidadorCPF\n\n[IMPLEMENTAÇÃO]\n```python\nx = 1\n```\n",
+            encoding="utf-8",
+        )
+        first = LNEGCParser(self.test_file, cache=self.cache).parse()
+        self.assertNotIn("IMPLEMENTAÇÃO", first.sections._texts)
+
+        second = LNEGCParser(self.test_file, cache=self.cache).parse()
+        self.assertEqual(self.cache.hits, 1)
+        self.assertIsInstance(second.sections, LazySections)
+        self.assertEqual(dict(second.sections), dict(first.sections))
+        self.assertEqual(second.to_dict(), first.to_dict())
+
+    def test_evict_by_age_and_size(self):
+        """Testa a remoção de entradas antigas e excedentes."""
+        LNEGCParser(self.test_file, cache=self.cache).parse()
+        entry = next(self.cache.root.glob("*/*.json"))
+        old = time.time() - self.cache.max_age - 1
+        os.utime(entry, (old, old))
+        self.assertEqual(self.cache.evict(), 1)
+
+        LNEGCParser(self.test_file, cache=self.cache).parse()
+        self.cache.max_size = 0
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertEqual(list(self.cache.root.glob("*/*.json")), [])
+
+    def test_cli_clear_and_rebuild(self):
+        """Testa os subcomandos `cache clear` e `cache rebuild`."""
+        self.assertEqual(cli_main(["cache", "rebuild", "--dir", str(self.temp_dir)]), 0)
+        self.assertEqual(len(list(self.cache.root.glob("*/*.json"))), 1)
+
+        self.assertEqual(cli_main(["cache", "clear", "--dir", str(self.temp_dir)]), 0)
+        self.assertFalse(self.cache.root.exists())
+
+
+if __name__ == "__main__":
+    main()
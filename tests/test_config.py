@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a configuração de projetos LNEGC.
+"""
+
+import io
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core import config
+from lnegc.src.core.config import clear_config_cache, load_config
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestProjectConfig(TestCase):
+    """Testes para a leitura e o uso de config.lnegc."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        clear_config_cache()
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "config.lnegc").write_text(
+            """# LNEGC v1.0
+
+[PROJETO]
+Nome: Loja
+Versão: 1.0.0
+
+[CONFIGURAÇÕES]
+Linguagem_Padrão: TypeScript
+Encoding: UTF-8
+
+[DIRETÓRIOS]
+Componentes: src/componentes/
+Entidades: src/modelos/
+
+[EXTENSÕES]
+- .lnegc: Arquivos LNEGC
+""",
+            encoding="utf-8",
+        )
+        for name in ["src/componentes", "src/modelos", "legado/componentes"]:
+            (self.temp_dir / name).mkdir(parents=True)
+        (self.temp_dir / "src/componentes/botao.lnegc").write_text("[COMPONENTE]\nNome: Botao\n")
+        (self.temp_dir / "src/modelos/cliente.lnegc").write_text("[ENTIDADE]\nNome: Cliente\n")
+        (self.temp_dir / "legado/componentes/antigo.lnegc").write_text("[COMPONENTE]\n")
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+        clear_config_cache()
+
+    def test_parse_sections(self):
+        """Testa as seções interpretadas do arquivo de configuração."""
+        project = load_config(self.temp_dir)
+
+        self.assertEqual(project.name, "Loja")
+        self.assertEqual(project.project["Versão"], "1.0.0")
+        self.assertEqual(project.language, "typescript")
+        self.assertEqual(
+            project.directories, {"componentes": "src/componentes/", "entidades": "src/modelos/"}
+        )
+        self.assertEqual(project.extensions, {".lnegc": "Arquivos LNEGC"})
+
+    def test_load_is_memoized(self):
+        """Testa que a configuração é lida uma única vez por diretório."""
+        first = load_config(self.temp_dir)
+        (self.temp_dir / "config.lnegc").unlink()
+        self.assertIs(load_config(self.temp_dir), first)
+        self.assertIs(LNEGCProcessor(self.temp_dir).config, first)
+        self.assertEqual(config._load.cache_info().misses, 1)
+
+    def test_load_is_silent(self):
+        """Testa que a leitura da configuração não escreve na saída padrão."""
+        with redirect_stdout(io.StringIO()) as out:
+            load_config(self.temp_dir)
+            LNEGCProcessor(self.temp_dir)
+        self.assertEqual(out.getvalue(), "")
+
+    def test_directories_limit_scan(self):
+        """Testa que apenas os diretórios de [DIRETÓRIOS] são percorridos."""
+        processor = LNEGCProcessor(self.temp_dir)
+        files = {(kind, path.name) for kind, path in processor.scan_files()}
+
+        self.assertEqual(files, {("componentes", "botao.lnegc"), ("entidades", "cliente.lnegc")})
+        self.assertEqual(processor.target_language, "typescript")
+        self.assertEqual(LNEGCProcessor(self.temp_dir, "go").target_language, "go")
+        self.assertIsNone(processor.kind_of(self.temp_dir / "legado/componentes/antigo.lnegc"))
+
+    def test_inherited_config_does_not_limit_scan(self):
+        """Testa que a configuração de um diretório pai não restringe a varredura."""
+        processor = LNEGCProcessor(self.temp_dir / "legado")
+        self.assertEqual(processor.config.name, "Loja")
+        self.assertEqual([kind for kind, _ in processor.scan_files()], ["componentes"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para os padrões de exclusão (.lnegcignore).
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main, mock
+
+from lnegc.src.core.ignore import IGNORE_FILE, IgnoreRules
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.scanner import scan
+
+
+class TestIgnoreRules(TestCase):
+    """Testes para a compilação e a aplicação dos padrões."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for relative in [
+            "componentes/validador.lnegc",
+            "componentes/rascunho.lnegc",
+            "fixtures/componentes/externo.lnegc",
+            "vendor/a/b/componentes/pacote.lnegc",
+            "build/componentes/gerado.lnegc",
+            "entidades/cliente.lnegc",
+        ]:
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("", encoding="utf-8")
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_gitignore_semantics(self):
+        """Testa curingas, âncoras, diretórios e negações."""
+        rules = IgnoreRules(
+            self.temp_dir,
+            ["# comentário", "", "*.tmp", "/fixtures/", "docs/**/*.lnegc", "!docs/manter.lnegc"],
+        )
+
+        self.assertTrue(rules.match("a/b/x.tmp", False))
+        self.assertTrue(rules.match("fixtures", True))
+        self.assertFalse(rules.match("fixtures", False))
+        self.assertFalse(rules.match("sub/fixtures", True))
+        self.assertTrue(rules.match("docs/a/b/x.lnegc", False))
+        self.assertTrue(rules.match("docs/x.lnegc", False))
+        self.assertFalse(rules.match("docs/manter.lnegc", False))
+        self.assertFalse(rules.match("componentes/x.lnegc", False))
+
+    def test_ignored_directories_are_not_entered(self):
+        """Testa que a varredura não entra em diretórios ignorados."""
+        (self.temp_dir / IGNORE_FILE).write_text(
+            "fixtures/\nvendor/\nrascunho.lnegc\n", encoding="utf-8"
+        )
+        rules = IgnoreRules.for_project(self.temp_dir)
+
+        visited = []
+        scandir = os.scandir
+
+        def recording_scandir(path):
+            visited.append(Path(path).relative_to(self.temp_dir).as_posix())
+            return scandir(path)
+
+        with mock.patch("lnegc.src.core.scanner.os.scandir", recording_scandir):
+            found = sorted(
+                path.relative_to(self.temp_dir).as_posix()
+                for _, path in scan(self.temp_dir, ignore=rules)
+            )
+
+        self.assertEqual(found, ["componentes/validador.lnegc", "entidades/cliente.lnegc"])
+        self.assertEqual(sorted(visited), [".", "componentes", "entidades"])
+
+    def test_processor_applies_ignore_file(self):
+        """Testa que o processador aplica o .lnegcignore do projeto."""
+        (self.temp_dir / IGNORE_FILE).write_text("fixtures/\n!build/\n", encoding="utf-8")
+        processor = LNEGCProcessor(self.temp_dir)
+
+        found = {path.relative_to(self.temp_dir).as_posix() for _, path in processor.scan_files()}
+        self.assertIn("build/componentes/gerado.lnegc", found)
+        self.assertNotIn("fixtures/componentes/externo.lnegc", found)
+        self.assertIsNone(processor.kind_of(self.temp_dir / "fixtures/componentes/externo.lnegc"))
+        self.assertEqual(
+            processor.kind_of(self.temp_dir / "componentes/rascunho.lnegc"), "componentes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o índice SQLite das especificações.
+"""
+
+import io
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.index import ProjectIndex, relationship_targets
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestProjectIndex(TestCase):
+    """Testes para ProjectIndex e `lnegc query`."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "entidades").mkdir()
+        (self.temp_dir / "componentes").mkdir()
+        (self.temp_dir / "entidades" / "cliente.lnegc").write_text(
+            "[ENTIDADE]\nNome: Cliente\nTipo: Domínio\n\n[ATRIBUTOS]\n- id: int (chave)\n"
+            "- cpf: str (obrigatório)\n\n[REGRAS]\n- CPF deve ser válido\n\n"
+            "[RELACIONAMENTOS]\n- Um Cliente pode ter vários Pedidos (1:N)\n"
+            "- Um Cliente pertence a uma Cidade (N:1)\n",
+            encoding="utf-8",
+        )
+        (self.temp_dir / "entidades" / "cidade.lnegc").write_text(
+            "[ENTIDADE]\nNome: Cidade\n\n## Atributos\n- nome: str\n",
+            encoding="utf-8",
+        )
+        (self.temp_dir / "componentes" / "validador.lnegc").write_text(
+            "[COMPONENTE]\nNome: ValidadorCPF\nTipo: Utilitário\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _update(self, index):
+        with redirect_stdout(io.StringIO()):
+            return index.update(LNEGCProcessor(self.temp_dir))
+
+    def test_queries(self):
+        """Testa as consultas por atributo, relacionamento, metadado e validação."""
+        with ProjectIndex.for_project(self.temp_dir) as index:
+            self.assertEqual(self._update(index), (3, 0))
+
+            def names(**criteria):
+                return [name for _, name, _ in index.query(**criteria)]
+
+            self.assertEqual(names(attribute="CPF"), ["Cliente"])
+            self.assertEqual(names(attribute="cpf", attribute_type="int"), [])
+            self.assertEqual(names(relates_to="Cidade"), ["Cliente"])
+            self.assertEqual(names(relates_to="Pedido"), ["Cliente"])
+            self.assertEqual(names(metadata=[("Tipo", "Utilitário")]), ["ValidadorCPF"])
+            self.assertEqual(names(validation="deve ser"), ["Cliente"])
+            self.assertEqual(names(kind="entidades", attribute="nome"), ["Cidade"])
+
+    def test_incremental_update(self):
+        """Testa que apenas arquivos alterados ou removidos são atualizados."""
+        with ProjectIndex.for_project(self.temp_dir) as index:
+            self._update(index)
+            self.assertEqual(self._update(index), (0, 0))
+
+            city = self.temp_dir / "entidades" / "cidade.lnegc"
+            city.write_text("[ENTIDADE]\nNome: Cidade\n\n## Atributos\n- cep: str\n")
+            os.utime(city, (1000, 1000))
+            (self.temp_dir / "componentes" / "validador.lnegc").unlink()
+
+            self.assertEqual(self._update(index), (1, 1))
+            self.assertEqual([r[1] for r in index.query(attribute="cep")], ["Cidade"])
+            self.assertEqual(index.query(attribute="nome"), [])
+            self.assertEqual(index.query(kind="componentes"), [])
+
+    def test_relationship_targets(self):
+        """Testa a extração dos nomes citados em um relacionamento."""
+        self.assertEqual(
+            relationship_targets("Um Cliente pertence a uma Cidade (N:1)", "Cliente"),
+            ["Cidade"],
+        )
+
+    def test_query_command(self):
+        """Testa `lnegc query`."""
+        args = ["query", "--dir", str(self.temp_dir), "--attribute", "cpf"]
+        with redirect_stdout(io.StringIO()) as stdout:
+            code = cli_main(args)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(
+            stdout.getvalue(),
+            f"entidades\tCliente\t{os.path.join('entidades', 'cliente.lnegc')}\n",
+        )
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(cli_main(args[:3] + ["--relates-to", "Estado"]), 1)
+
+        # Um índice corrompido é um erro do comando, não uma exceção
+        (self.temp_dir / ".lnegc" / "index.sqlite").write_bytes(b"x" * 4096)
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(cli_main(args), 2)
+        self.assertIn("Erro:", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    main()
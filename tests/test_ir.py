@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a representação intermediária (IR) de projetos.
+"""
+
+import importlib.util
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main, skipUnless
+
+from lnegc.src.core.ir import IR_VERSION, loads
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestIR(TestCase):
+    """Testes para a exportação e o carregamento da IR."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "entidades").mkdir()
+        (self.temp_dir / "componentes").mkdir()
+        (self.temp_dir / "entidades" / "usuario.lnegc").write_text(
+            "[ENTIDADE]\nNome: Usuario\n\n## Metadados\n- **Nome**: Usuario\n"
+            "- **nome**: Usuario\n\n## Atributos\n- id: int\n- email: str\n\n"
+            "## Relacionamentos\n- possui muitos Pedido\n",
+            encoding="utf-8",
+        )
+        (self.temp_dir / "componentes" / "login.lnegc").write_text(
+            "[COMPONENTE]\nNome: Login\n\n## Interface\nEntrada: usuario\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _roundtrip(self, encoding):
+        expected = LNEGCProcessor(self.temp_dir).process_all()
+        path = self.temp_dir / f"projeto.{encoding}"
+        LNEGCProcessor(self.temp_dir).export_ir(path, encoding)
+
+        # Os arquivos .lnegc não são necessários para gerar os prompts a partir da IR
+        for spec in self.temp_dir.glob("*/*.lnegc"):
+            spec.unlink()
+        processor = LNEGCProcessor(self.temp_dir)
+        processor.load_ir(path)
+        self.assertEqual(processor.process_all(), expected)
+        self.assertEqual([prompt for _, _, prompt in processor.iter_prompts()], expected)
+        self.assertEqual(processor.session.runs["generate"], 1)
+        return loads(path.read_bytes())
+
+    def test_json_roundtrip(self):
+        """Testa o conteúdo da IR em JSON e a geração dos prompts a partir dela."""
+        ir = self._roundtrip("json")
+
+        self.assertEqual(ir["version"], IR_VERSION)
+        specs = {spec["path"]: spec for spec in ir["specs"]}
+        user = specs["entidades/usuario.lnegc"]
+        self.assertEqual(user["kind"], "entidades")
+        self.assertTrue(user["selected"])
+        self.assertEqual(user["attributes"], ["id: int", "email: str"])
+        self.assertEqual(user["relationships"], ["possui muitos Pedido"])
+        self.assertEqual(user["metadata"]["Nome"], "Usuario")
+        self.assertIn("Interface", specs["componentes/login.lnegc"]["sections"])
+
+    @skipUnless(importlib.util.find_spec("msgpack"), "msgpack não instalado")
+    def test_msgpack_roundtrip(self):
+        """Testa a IR em msgpack."""
+        ir = self._roundtrip("msgpack")
+        self.assertEqual(len(ir["specs"]), 2)
+
+    def test_rejects_other_versions(self):
+        """Testa que IRs de outras versões não são carregadas."""
+        path = self.temp_dir / "antiga.json"
+        path.write_text(json.dumps({"format": "lnegc-ir", "version": IR_VERSION + 1}))
+
+        with self.assertRaises(ValueError):
+            LNEGCProcessor(self.temp_dir).load_ir(path)
+
+
+if __name__ == "__main__":
+    main()
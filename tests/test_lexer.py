@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o lexer e a AST do LNEGC.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.lazy import LazySections
+from lnegc.src.core.lexer import COMMENT, EOF, FENCE, LIST_ITEM, SECTION, TEXT, Lexer
+from lnegc.src.core.parser import LNEGCParser
+
+
+class TestLexer(TestCase):
+    """Testes para o Lexer do LNEGC."""
+
+    def test_tokenize_positions(self):
+        """Testa tipos, linhas e colunas dos tokens."""
+        source = "# Título\n[SEÇÃO]\n- item\ntexto\n## Outra\n"
+        tokens = Lexer(source).tokenize()
+
+        self.assertEqual(
+            [t.type for t in tokens],
+            [COMMENT, SECTION, LIST_ITEM, TEXT, SECTION, TEXT, EOF],
+        )
+        self.assertEqual(tokens[1].value, "SEÇÃO")
+        self.assertEqual((tokens[1].line, tokens[1].column), (2, 2))
+        self.assertEqual((tokens[2].line, tokens[2].column), (3, 3))
+        self.assertEqual(tokens[4].value, "Outra")
+        self.assertEqual((tokens[4].line, tokens[4].column), (5, 4))
+
+    def test_fenced_code_is_not_interpreted(self):
+        """Testa que linhas dentro de blocos de código são texto."""
+        source = "[IMPLEMENTAÇÃO]\n```python\n# comentário\n[1, 2]\n```\n## Exemplos\n"
+        tokens = Lexer(source).tokenize()
+
+        self.assertEqual(
+            [t.type for t in tokens],
+            [SECTION, FENCE, TEXT, TEXT, FENCE, SECTION, TEXT, EOF],
+        )
+
+    def test_empty_source(self):
+        """Testa tokenização de texto vazio."""
+        tokens = Lexer("").tokenize()
+        self.assertEqual(tokens[-1].type, EOF)
+
+
+class TestParserDocument(TestCase):
+    """Testes para a construção da AST pelo LNEGCParser."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = Path(self.temp_dir) / "cliente.lnegc"
+        self.test_file.write_text(
+            """# LNEGC v1.0
+# Autor: LNEGC Team
+
+[ENTIDADE]
+Nome: Cliente
+
+## Metadados
+- **Nome**: Cliente
+- **Tipo**: Domínio
+
+## Atributos
+- id: int
+- nome: str
+
+[IMPLEMENTAÇÃO]
+```python
+# comentário no código
+class Cliente: ...
+```
+""",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_parse_document(self):
+        """Testa o cabeçalho e as seções da AST."""
+        document = LNEGCParser(self.test_file).parse_document()
+
+        self.assertEqual(document.header.name, "LNEGC v1.0")
+        self.assertEqual(document.header.author, "LNEGC Team")
+        self.assertEqual(
+            [s.name for s in document.sections],
+            ["ENTIDADE", "Metadados", "Atributos", "IMPLEMENTAÇÃO"],
+        )
+        self.assertEqual(document.sections[2].line, 11)
+
+    def test_parse_walks_document(self):
+        """Testa o resultado de parse() a partir da AST."""
+        result = LNEGCParser(self.test_file).parse()
+
+        self.assertEqual(result["metadata"], {"Nome": "Cliente", "Tipo": "Domínio"})
+        self.assertEqual(result["attributes"], ["id: int", "nome: str"])
+        self.assertEqual(result["sections"]["ENTIDADE"], "Nome: Cliente")
+        self.assertIn("# comentário no código", result["sections"]["IMPLEMENTAÇÃO"])
+
+    def test_sections_materialized_on_access(self):
+        """Testa que o texto das seções só é montado quando lido."""
+        result = LNEGCParser(self.test_file).parse()
+
+        self.assertIsInstance(result.sections, LazySections)
+        self.assertNotIn("IMPLEMENTAÇÃO", result.sections._texts)
+        start, end = result.sections.span("ENTIDADE")
+        self.assertEqual(self.test_file.read_text(encoding="utf-8")[start:end], "Nome: Cliente\n\n")
+        self.assertEqual(result.sections["ENTIDADE"], "Nome: Cliente")
+        self.assertIn("ENTIDADE", result.sections._texts)
+        with self.assertRaises(KeyError):
+            result.sections["Inexistente"]
+
+
+if __name__ == "__main__":
+    main()
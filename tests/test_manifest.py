@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o build incremental do processador LNEGC.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.manifest import BUILD_DIR
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestIncrementalBuild(TestCase):
+    """Testes para o manifesto de build incremental."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        for kind in ["componentes", "entidades"]:
+            (self.temp_dir / kind).mkdir()
+        self.component = self.temp_dir / "componentes" / "validador.lnegc"
+        self.component.write_text("[COMPONENTE]\nNome: Validador\n\n## Regras\n- Regra 1\n")
+        self.entity = self.temp_dir / "entidades" / "cliente.lnegc"
+        self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: int\n")
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_unchanged_files_are_not_parsed(self):
+        """Testa que apenas arquivos novos ou alterados são processados."""
+        first = LNEGCProcessor(self.temp_dir, incremental=True)
+        expected = first.process()
+        manifest = json.loads((self.temp_dir / BUILD_DIR / "manifest.json").read_text())
+        entry = manifest["files"]["entidades/cliente.lnegc"]
+        self.assertEqual(entry["kind"], "entidades")
+        self.assertEqual(entry["size"], self.entity.stat().st_size)
+        self.assertIsNotNone(entry["prompt"])
+
+        second = LNEGCProcessor(self.temp_dir, incremental=True)
+        self.assertEqual(second.process(), expected)
+        self.assertEqual(second.manifest.reused, 2)
+        self.assertEqual(second._components + second._entities, [])
+
+        self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: uuid\n")
+        third = LNEGCProcessor(self.temp_dir, incremental=True)
+        prompts = third.process()
+        self.assertEqual(len(third._entities), 1)
+        self.assertEqual(third._components, [])
+        self.assertIn("id: uuid", prompts["entidades"][0])
+        self.assertEqual(prompts, LNEGCProcessor(self.temp_dir).process())
+
+    def test_edit_during_processing_is_not_recorded(self):
+        """Testa que uma alteração feita após o parse é processada na execução seguinte."""
+        processor = LNEGCProcessor(self.temp_dir, incremental=True)
+        dedup_name = processor._dedup_name
+
+        def edit_after_parse(kind, result):
+            if kind == "entidades":
+                self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: uuid\n")
+            return dedup_name(kind, result)
+
+        processor._dedup_name = edit_after_parse
+        self.assertIn("id: int", processor.process()["entidades"][0])
+
+        prompts = LNEGCProcessor(self.temp_dir, incremental=True).process()
+        self.assertIn("id: uuid", prompts["entidades"][0])
+
+    def test_language_change_invalidates_prompts(self):
+        """Testa que prompts de outra linguagem alvo não são reaproveitados."""
+        LNEGCProcessor(self.temp_dir, "python", incremental=True).process()
+
+        processor = LNEGCProcessor(self.temp_dir, "java", incremental=True)
+        prompts = processor.process()
+        self.assertEqual(processor.manifest.reused, 0)
+        self.assertIn("em java", prompts["entidades"][0])
+
+    def test_removed_files_leave_manifest(self):
+        """Testa que arquivos removidos saem do manifesto."""
+        LNEGCProcessor(self.temp_dir, incremental=True).process()
+        self.component.unlink()
+
+        LNEGCProcessor(self.temp_dir, incremental=True).process()
+        manifest = json.loads((self.temp_dir / BUILD_DIR / "manifest.json").read_text())
+        self.assertEqual(list(manifest["files"]), ["entidades/cliente.lnegc"])
+        self.assertEqual(len(list((self.temp_dir / BUILD_DIR / "prompts").glob("*.txt"))), 1)
+
+
+if __name__ == "__main__":
+    main()
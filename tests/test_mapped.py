@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o modo mapeado em memória do parser LNEGC.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main, skipUnless
+from unittest.mock import patch
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.mapped import MappedSections
+from lnegc.src.core.parser import PARSER_VERSION, LNEGCParser
+from lnegc.src.core.processor import LNEGCProcessor
+
+CONTENT = """# LNEGC v1.0
+
+[COMPONENTE]
+Nome: ValidadorCPF
+Tipo: Utilitário
+
+[REGRAS]
+- CPF deve ter 11 dígitos
+
+[IMPLEMENTAÇÃO]
+```python
+[x for x in range(3)]
+```
+
+## Exemplos
+Exemplo 1: CPF válido
+"""
+
+
+class TestMappedParser(TestCase):
+    """Testes para o parse no modo mapeado."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = Path(self.temp_dir) / "validador.lnegc"
+        self.test_file.write_text(CONTENT, encoding="utf-8")
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_same_result_as_text_mode(self):
+        """Testa que os dois modos produzem o mesmo resultado."""
+        mapped = LNEGCParser(self.test_file, mmap_mode=True).parse()
+        text = LNEGCParser(self.test_file, mmap_mode=False).parse()
+
+        self.assertIsInstance(mapped.sections, MappedSections)
+        self.assertEqual(mapped.to_dict(), text.to_dict())
+        self.assertEqual(
+            list(mapped.sections), ["COMPONENTE", "REGRAS", "IMPLEMENTAÇÃO", "Exemplos"]
+        )
+
+    def test_sections_decoded_on_access(self):
+        """Testa que seções não acessadas não são decodificadas."""
+        implementation = "[IMPLEMENTAÇÃO]\n```python\n".encode("utf-8") + b"\xff\xfe\n```\n"
+        self.test_file.write_bytes(CONTENT.encode("utf-8") + implementation)
+
+        result = LNEGCParser(self.test_file, mmap_mode=True).parse()
+
+        self.assertEqual(result.metadata["Nome"], "ValidadorCPF")
+        self.assertEqual(result.sections["REGRAS"], "- CPF deve ter 11 dígitos")
+        with self.assertRaises(UnicodeDecodeError):
+            result.sections["IMPLEMENTAÇÃO"]
+
+    def test_empty_file(self):
+        """Testa o modo mapeado com arquivo vazio."""
+        self.test_file.write_text("")
+
+        result = LNEGCParser(self.test_file, mmap_mode=True).parse()
+
+        self.assertEqual(result.metadata, {})
+        self.assertEqual(dict(result.sections), {})
+
+    @skipUnless(os.path.isdir("/proc/self/fd"), "requer /proc/self/fd")
+    def test_mappings_are_released(self):
+        """Testa que os arquivos mapeados não mantêm descritores abertos."""
+
+        def descriptors():
+            return len(os.listdir("/proc/self/fd"))
+
+        cache = ParseCache(Path(self.temp_dir) / "cache", PARSER_VERSION)
+        before = descriptors()
+        # Com cache, o mapeamento é liberado após a gravação no cache ou a leitura dele
+        results = [
+            LNEGCParser(self.test_file, mmap_mode=True, cache=cache).parse() for _ in range(50)
+        ]
+        self.assertEqual(descriptors(), before)
+        self.assertEqual(results[-1].sections["REGRAS"], "- CPF deve ter 11 dígitos")
+
+        # Sem cache, o resultado é fechado ao final do bloco with
+        for _ in range(50):
+            with LNEGCParser(self.test_file, mmap_mode=True).parse() as result:
+                results.append(result)
+        self.assertEqual(descriptors(), before)
+
+        # O processador fecha os resultados que descarta
+        project = Path(self.temp_dir) / "projeto"
+        (project / "componentes").mkdir(parents=True)
+        (project / "config.lnegc").write_text("[PROJETO]\nNome: T\n", encoding="utf-8")
+        (project / "componentes" / "validador.lnegc").write_text(CONTENT, encoding="utf-8")
+        with patch("lnegc.src.core.parser.MMAP_THRESHOLD", 0):
+            processor = LNEGCProcessor(project)
+            self.assertEqual(len(list(processor.iter_prompts())), 1)
+            self.assertEqual(descriptors(), before)
+            processor.process()
+            processor.invalidate()
+            self.assertEqual(descriptors(), before)
+
+
+if __name__ == "__main__":
+    main()
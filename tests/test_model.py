@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o modelo de resultado do parse do LNEGC.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.model import ParseResult
+from lnegc.src.core.parser import LNEGCParser
+
+
+class TestParseResult(TestCase):
+    """Testes para o ParseResult."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = Path(self.temp_dir) / "cliente.lnegc"
+        self.test_file.write_text(
+            """# LNEGC v1.0
+
+[ENTIDADE]
+Nome: Cliente
+Tipo: Domínio
+Linguagem: Python
+
+## Atributos
+- id: int
+""",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_declaration_metadata(self):
+        """Testa extração dos metadados da seção de declaração."""
+        result = LNEGCParser(self.test_file).parse()
+
+        self.assertIsInstance(result, ParseResult)
+        self.assertEqual(result.metadata["Nome"], "Cliente")
+        self.assertEqual(result.metadata["Linguagem"], "Python")
+        self.assertEqual(result.attributes, ["id: int"])
+        self.assertEqual(result.path, str(self.test_file))
+
+    def test_interned_keys(self):
+        """Testa que chaves de metadados e nomes de seções são internados."""
+        first = LNEGCParser(self.test_file).parse()
+        second = LNEGCParser(self.test_file).parse()
+
+        for a, b in zip(first.metadata, second.metadata):
+            self.assertIs(a, b)
+        self.assertIs(next(iter(first.sections)), sys.intern("ENTIDADE"))
+
+    def test_slots_and_dict_access(self):
+        """Testa __slots__ e o acesso no formato de dicionário."""
+        result = LNEGCParser(self.test_file).parse()
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertEqual(result["attributes"], result.attributes)
+        self.assertEqual(result.get("inexistente", []), [])
+        self.assertEqual(ParseResult.from_dict(result.to_dict()).to_dict(), result.to_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para os formatos de saída dos prompts.
+"""
+
+import io
+import json
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.manifest import text_hash
+from lnegc.src.core.output import JsonlWriter
+
+
+class FlushCounter(io.StringIO):
+    """Saída que conta as chamadas de flush()."""
+
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class TestJsonlOutput(TestCase):
+    """Testes para a saída JSON Lines."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        (self.temp_dir / "entidades").mkdir()
+        (self.temp_dir / "interfaces").mkdir()
+        (self.temp_dir / "entidades" / "cliente.lnegc").write_text(
+            "[ENTIDADE]\nNome: Cliente\n\n## Metadados\n- **Nome**: Cliente\n",
+            encoding="utf-8",
+        )
+        (self.temp_dir / "interfaces" / "repositorio.lnegc").write_text(
+            "[INTERFACE]\nNome: Repo\n", encoding="utf-8"
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_writer_flushes_in_chunks(self):
+        """Testa que os registros são gravados em blocos e pendentes saem no flush()."""
+        stream = FlushCounter()
+        writer = JsonlWriter(stream, chunk=2)
+        for number in range(3):
+            writer.write("entidades", f"e{number}.lnegc", f"prompt {number}")
+
+        self.assertEqual(stream.getvalue().count("\n"), 2)
+        self.assertEqual(stream.flushes, 1)
+        writer.flush()
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual([r["source"] for r in records], ["e0.lnegc", "e1.lnegc", "e2.lnegc"])
+        self.assertEqual(records[2]["hash"], text_hash("prompt 2"))
+        self.assertNotIn("root", records[0])
+
+    def test_cli_jsonl_to_stdout(self):
+        """Testa que `--output -` grava apenas os registros na saída padrão."""
+        text_file = self.temp_dir / "prompts.txt"
+        cli_main(["--dir", str(self.temp_dir), "--output", str(text_file)])
+
+        with redirect_stdout(io.StringIO()) as out, redirect_stderr(io.StringIO()) as err:
+            code = cli_main(
+                ["--dir", str(self.temp_dir), "--output", "-", "--format", "jsonl", "--verbose"]
+            )
+
+        self.assertEqual(code, 0)
+        self.assertIn("Processamento concluído", err.getvalue())
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r["kind"] for r in records], ["entidades", "interfaces"])
+        self.assertTrue(records[0]["source"].endswith("cliente.lnegc"))
+        self.assertEqual(
+            "\n\n".join(r["prompt"] for r in records), text_file.read_text(encoding="utf-8")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o carregamento paralelo do processador LNEGC.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestParallelLoading(TestCase):
+    """Testes para o parâmetro jobs do LNEGCProcessor."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for kind in ["componentes", "entidades", "interfaces", "testes"]:
+            (self.temp_dir / kind).mkdir()
+            for index in range(5):
+                (self.temp_dir / kind / f"{kind}{index}.lnegc").write_text(
+                    f"[ENTIDADE]\nNome: {kind}{index}\n\n## Atributos\n- id: int\n"
+                    f"- campo{index}: str\n",
+                    encoding="utf-8",
+                )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _load(self, **kwargs):
+        processor = LNEGCProcessor(self.temp_dir, **kwargs)
+        processor._load_files()
+        return [
+            [result.to_dict() for result in results]
+            for results in (
+                processor._components,
+                processor._entities,
+                processor._interfaces,
+                processor._tests,
+            )
+        ]
+
+    def test_parallel_matches_serial(self):
+        """Testa que o carregamento paralelo produz o mesmo resultado, na mesma ordem."""
+        self.assertEqual(self._load(jobs=3), self._load(jobs=1))
+
+    def test_parallel_uses_cache(self):
+        """Testa que o carregamento paralelo consulta e preenche o cache."""
+        cache = ParseCache.for_project(self.temp_dir, PARSER_VERSION)
+        first = self._load(jobs=2, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 20))
+
+        second = self._load(jobs=2, cache=cache)
+        self.assertEqual(cache.hits, 20)
+        self.assertEqual(first, second)
+
+    def test_workers_write_cache(self):
+        """Testa que os processos do pool gravam o cache e devolvem seções não decodificadas."""
+        cache = ParseCache.for_project(self.temp_dir, PARSER_VERSION)
+        self.assertEqual(cache.evict(), 0)
+        processor = LNEGCProcessor(self.temp_dir, jobs=2, cache=cache)
+        processor._load_files()
+
+        self.assertEqual(len(list(cache.root.glob("*/*.json"))), 20)
+        for result in processor._entities:
+            self.assertEqual(result.sections._texts, {})
+            self.assertIn("- id: int", result.sections["Atributos"])
+
+        # As gravações feitas pelos processos contam para a próxima remoção
+        cache.max_size = 0
+        self.assertEqual(cache.evict(), 20)
+
+
+if __name__ == "__main__":
+    main()
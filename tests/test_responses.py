@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o cache de respostas do modelo.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.responses import ResponseCache
+
+
+class TestResponseCache(TestCase):
+    """Testes para ResponseCache."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_key_depends_on_language_and_settings(self):
+        """Testa que a chave muda com a linguagem e as configurações do modelo."""
+        settings = {"url": "u", "model": "m", "temperature": None}
+        key = ResponseCache.key("prompt", "Python", settings)
+
+        self.assertEqual(key, ResponseCache.key("prompt", "Python", dict(settings)))
+        self.assertNotEqual(key, ResponseCache.key("prompt", "Java", settings))
+        self.assertNotEqual(key, ResponseCache.key("prompt", "Python", {**settings, "model": "n"}))
+        self.assertNotEqual(key, ResponseCache.key("outro", "Python", settings))
+
+    def test_lru_eviction_keeps_pinned(self):
+        """Testa que a remoção segue a ordem de uso e preserva as entradas fixadas."""
+        responses = ResponseCache(self.temp_dir, max_size=250)
+        keys = [ResponseCache.key(f"p{n}", "Python", {}) for n in range(4)]
+        for age, key in enumerate(keys):
+            responses.put(key, {"response": "x" * 90})
+            mtime = 1000 + age
+            os.utime(responses._path(key), (mtime, mtime))
+
+        # keys[0] é a mais antiga, mas foi fixada; keys[1] passa a ser a mais recente
+        self.assertEqual(responses.pin([keys[0], "ausente"]), ["ausente"])
+        self.assertIsNotNone(responses.get(keys[1]))
+
+        self.assertEqual(responses.evict(), 1)
+        self.assertIsNone(responses.get(keys[2]))
+        for key in (keys[0], keys[1], keys[3]):
+            self.assertIsNotNone(responses.get(key))
+
+        responses.clear()
+        self.assertEqual([e.name[:-5] for e in responses.entries()], [keys[0]])
+        self.assertEqual(ResponseCache(self.temp_dir).pins, {keys[0]})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a descoberta de arquivos do LNEGC.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.scanner import scan
+
+
+class TestScanner(TestCase):
+    """Testes para o scanner de arquivos."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        for relative in [
+            "config.lnegc",
+            "componentes/validador.lnegc",
+            "componentes/tests/validador.lnegc",
+            "modulo/entities/cliente.lnegc",
+            "interfaces/repositorio.lnegc",
+            "interfaces/leiame.md",
+            "outros/validador.test.lnegc",
+            "node_modules/componentes/pacote.lnegc",
+            ".git/componentes/objeto.lnegc",
+        ]:
+            path = self.temp_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("", encoding="utf-8")
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_classifies_each_file_once(self):
+        """Testa que cada arquivo é retornado uma vez, com o tipo mais próximo."""
+        found = sorted(
+            (kind, path.relative_to(self.temp_dir).as_posix()) for kind, path in scan(self.temp_dir)
+        )
+
+        self.assertEqual(
+            found,
+            [
+                ("componentes", "componentes/validador.lnegc"),
+                ("entidades", "modulo/entities/cliente.lnegc"),
+                ("interfaces", "interfaces/repositorio.lnegc"),
+                ("testes", "componentes/tests/validador.lnegc"),
+                ("testes", "outros/validador.test.lnegc"),
+            ],
+        )
+
+    def test_root_path_does_not_classify(self):
+        """Testa que diretórios acima da raiz não influenciam a classificação."""
+        root = self.temp_dir / "testes" / "projeto"
+        (root / "componentes").mkdir(parents=True)
+        (root / "componentes" / "x.lnegc").write_text("", encoding="utf-8")
+
+        self.assertEqual([kind for kind, _ in scan(root)], ["componentes"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o envio de prompts a um endpoint compatível com a OpenAI.
+"""
+
+import asyncio
+import io
+import json
+import tempfile
+import threading
+import time
+from contextlib import redirect_stderr
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.sender import ChatSender, TokenBucket
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Servidor de teste: responde com o tamanho do prompt, em streaming ou não."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _chunk(self, text):
+        data = text.encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.clients.add(self.client_address)
+            server.requests += 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            status = server.statuses.pop(0) if server.statuses else 200
+        time.sleep(0.02)
+        with server.lock:
+            server.active -= 1
+
+        if status != 200:
+            error = b'{"error": "falha"}'
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(error)))
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(error)
+            return
+
+        content = f"Resposta {len(body['messages'][0]['content'])}"
+        if not body.get("stream"):
+            data = json.dumps(
+                {"model": body["model"], "choices": [{"message": {"content": content}}]}
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for piece in (content[:4], content[4:]):
+            event = {"model": body["model"], "choices": [{"delta": {"content": piece}}]}
+            self._chunk(f"data: {json.dumps(event)}\n\n")
+        self._chunk('data: {"choices": [], "usage": {"total_tokens": 7}}\n\ndata: [DONE]\n\n')
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class TestSend(TestCase):
+    """Testes para `lnegc send` contra um servidor local."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.project = self.temp_dir / "projeto"
+        (self.project / "entidades").mkdir(parents=True)
+        (self.project / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        for number in range(6):
+            (self.project / "entidades" / f"e{number}.lnegc").write_text(
+                f"[ENTIDADE]\nNome: E{number}\n\n## Metadados\n- **Nome**: E{number}\n"
+                f"- **nome**: E{number}\n\n## Atributos\n" + "- a: int\n" * number,
+                encoding="utf-8",
+            )
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.clients = set()
+        self.server.requests = self.server.active = self.server.max_active = 0
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        self.output = self.temp_dir / "respostas.jsonl"
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def _send(self, *extra):
+        args = ["send", "--dir", str(self.project), "--output", str(self.output)]
+        with redirect_stderr(io.StringIO()):
+            code = cli_main(args + ["--model", "m", "--url", self.url, *extra])
+        records = [json.loads(line) for line in self.output.read_text().splitlines()]
+        return code, records
+
+    def test_streaming_with_pool_and_retry(self):
+        """Testa streaming, conexões reaproveitadas, concorrência limitada e repetição."""
+        self.server.statuses = [503]
+        code, records = self._send("-c", "2", "--retries", "2")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(len(records), 6)
+        self.assertEqual(sorted(r["name"] for r in records), [f"E{n}" for n in range(6)])
+        for record in records:
+            self.assertNotIn("error", record)
+            self.assertTrue(record["response"].startswith("Resposta "))
+            self.assertEqual(record["usage"], {"total_tokens": 7})
+        self.assertEqual(sum(r["attempts"] for r in records), 7)
+        self.assertEqual(self.server.requests, 7)
+        self.assertLessEqual(self.server.max_active, 2)
+        self.assertLessEqual(len(self.server.clients), 2)
+
+    def test_non_retryable_error(self):
+        """Testa que erros definitivos são registrados sem novas tentativas."""
+        self.server.statuses = [400]
+        code, records = self._send("-c", "1", "--no-stream")
+
+        self.assertEqual(code, 1)
+        failed = [r for r in records if "error" in r]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0]["attempts"], 1)
+        self.assertIn("HTTP 400", failed[0]["error"])
+        self.assertEqual(self.server.requests, 6)
+
+    def test_response_cache(self):
+        """Testa que respostas em cache não são enviadas de novo e o modo --cache-only."""
+        self._send()
+        (self.project / "entidades" / "e0.lnegc").write_text(
+            "[ENTIDADE]\nNome: E0\n\n## Metadados\n- **Nome**: E0\n- **nome**: E0\n\n"
+            "## Atributos\n- b: str\n",
+            encoding="utf-8",
+        )
+        code, records = self._send("--cache-only")
+
+        self.assertEqual(code, 1)
+        self.assertEqual(self.server.requests, 6)
+        failed = [r for r in records if "error" in r]
+        self.assertEqual([r["name"] for r in failed], ["E0"])
+        self.assertIn("--cache-only", failed[0]["error"])
+        for record in records:
+            if "error" not in record:
+                self.assertTrue(record["cached"])
+                self.assertEqual(record["attempts"], 0)
+                self.assertTrue(record["response"].startswith("Resposta "))
+
+        code, records = self._send()
+        self.assertEqual(code, 0)
+        self.assertEqual(self.server.requests, 7)
+        self.assertEqual(sum(1 for r in records if r.get("cached")), 5)
+
+        # Configurações diferentes do modelo não usam as respostas armazenadas
+        self._send("--temperature", "0.5")
+        self.assertEqual(self.server.requests, 13)
+
+    def test_cache_only_requires_response_cache(self):
+        """Testa que --cache-only com --no-response-cache é rejeitado sem acessar a rede."""
+        with self.assertRaises(SystemExit) as raised:
+            self._send("--cache-only", "--no-response-cache")
+
+        self.assertEqual(raised.exception.code, 2)
+        self.assertEqual(self.server.requests, 0)
+        self.assertFalse(self.output.exists())
+
+    def test_budget_renders_once(self):
+        """Testa que a verificação de --budget não gera os prompts duas vezes."""
+        generate = LNEGCProcessor._generate_prompts
+        with patch.object(LNEGCProcessor, "_generate_prompts", autospec=True) as render:
+            render.side_effect = generate
+            code, records = self._send("--budget", "100000")
+
+        self.assertEqual(code, 0)
+        self.assertEqual(len(records), 6)
+        self.assertEqual(render.call_count, 6)
+
+    def test_prompts_generated_off_loop(self):
+        """Testa que os prompts de um iterável síncrono são gerados fora do loop."""
+        threads = []
+
+        def prompts():
+            for number in range(5):
+                threads.append(threading.current_thread())
+                yield number, f"prompt {number}"
+
+        async def collect(sender):
+            keys = []
+            async for key, completion in sender.send_all(prompts()):
+                self.assertIsNone(completion.error)
+                keys.append(key)
+            return keys
+
+        sender = ChatSender(self.url, "m", concurrency=2)
+        self.assertEqual(sorted(asyncio.run(collect(sender))), list(range(5)))
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_token_bucket_rate(self):
+        """Testa que o token bucket limita o ritmo de consumo."""
+
+        async def consume():
+            bucket = TokenBucket(50.0, capacity=1)
+            start = time.monotonic()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        self.assertGreaterEqual(asyncio.run(consume()), 0.09)
+
+
+if __name__ == "__main__":
+    main()
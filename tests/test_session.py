@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a sessão de processamento em etapas.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestProcessingSession(TestCase):
+    """Testes para a memorização e a invalidação das etapas."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        for kind in ["componentes", "entidades"]:
+            (self.temp_dir / kind).mkdir()
+        self.component = self.temp_dir / "componentes" / "validador.lnegc"
+        self.component.write_text("## Regras\n- Regra 1\n")
+        self.entity = self.temp_dir / "entidades" / "cliente.lnegc"
+        self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: int\n")
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_repeated_calls_reuse_one_computation(self):
+        """Testa que process(), process_all() e counts() não repetem o processamento."""
+        processor = LNEGCProcessor(self.temp_dir)
+        session = processor.session
+
+        prompts = processor.process()
+        self.assertIs(processor.process(), prompts)
+        self.assertEqual(processor.process_all(), prompts["componentes"] + prompts["entidades"])
+        self.assertEqual(session.counts()["entidades"], 1)
+        self.assertEqual(session.runs, {"parse": 1, "validate": 1, "analyze": 1, "generate": 1})
+        self.assertEqual(len(processor._entities), 1)
+
+    def test_invalidate(self):
+        """Testa que a invalidação executa novamente a etapa e as seguintes."""
+        processor = LNEGCProcessor(self.temp_dir)
+        processor.process()
+
+        self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: uuid\n")
+        self.assertNotIn("id: uuid", processor.process()["entidades"][0])
+        processor.invalidate("parse")
+        self.assertIn("id: uuid", processor.process()["entidades"][0])
+        self.assertEqual(len(processor._entities), 1)
+
+        processor.invalidate("generate")
+        processor.process()
+        self.assertEqual(processor.session.runs["parse"], 2)
+        self.assertEqual(processor.session.runs["generate"], 3)
+        with self.assertRaises(ValueError):
+            processor.invalidate("deploy")
+
+    def test_validate(self):
+        """Testa os problemas apontados pela etapa de validação."""
+        problems = LNEGCProcessor(self.temp_dir).session.validate()
+        self.assertEqual(problems, [(str(self.component), "Seção [COMPONENTE] não encontrada")])
+
+
+if __name__ == "__main__":
+    main()
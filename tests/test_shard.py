@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a divisão do projeto em shards e a combinação das saídas.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.shard import parse_shard
+
+
+class TestShard(TestCase):
+    """Testes para --shard e `lnegc merge`."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.project = self.temp_dir / "projeto"
+        (self.project / "componentes").mkdir(parents=True)
+        (self.project / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        for number in range(30):
+            # Nomes repetidos em arquivos diferentes: apenas o último de cada nome é usado
+            (self.project / "componentes" / f"c{number}.lnegc").write_text(
+                f"[COMPONENTE]\nNome: C{number}\n\n## Metadados\n- **nome**: C{number % 20}\n\n"
+                f"[DESCRIÇÃO]\nComponente {number}\n",
+                encoding="utf-8",
+            )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_parse_shard(self):
+        """Testa a leitura de i/N."""
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for text in ["0/4", "5/4", "2", "a/b"]:
+            with self.assertRaises(ValueError):
+                parse_shard(text)
+
+    def test_shards_partition_project(self):
+        """Testa que cada arquivo pertence a exatamente um shard e a ordem é estável."""
+        files = LNEGCProcessor(self.project).scan_files()
+        self.assertEqual(files, sorted(files, key=lambda item: str(item[1])))
+
+        shards = [LNEGCProcessor(self.project, shard=(i, 3)).scan_files() for i in (1, 2, 3)]
+        self.assertEqual(sorted(sum(shards, []), key=lambda item: str(item[1])), files)
+        self.assertTrue(all(shards))
+        with self.assertRaises(ValueError):
+            LNEGCProcessor(self.project, shard=(4, 3))
+
+    def test_merge_matches_single_run(self):
+        """Testa que `lnegc merge` reproduz a saída de uma execução sem shards."""
+        single = self.temp_dir / "prompts.txt"
+        self.assertEqual(cli_main(["--dir", str(self.project), "--output", str(single)]), 0)
+
+        outputs = []
+        for index in (1, 2, 3):
+            output = self.temp_dir / f"shard{index}.jsonl"
+            args = ["--dir", str(self.project), "--output", str(output), "--format", "jsonl"]
+            self.assertEqual(cli_main(args + ["--shard", f"{index}/3"]), 0)
+            outputs.append(str(output))
+
+        merged = self.temp_dir / "merged.txt"
+        self.assertEqual(cli_main(["merge", *outputs[::-1], "--output", str(merged)]), 0)
+        self.assertEqual(merged.read_text(encoding="utf-8"), single.read_text(encoding="utf-8"))
+        self.assertEqual(merged.read_text(encoding="utf-8").count("Por favor, gere"), 20)
+
+    def test_merge_matches_multi_root_run(self):
+        """Testa que merge mantém a ordem das raízes em --dir e dos caminhos em cada raiz."""
+        # A primeira raiz tem um único arquivo: os shards sem ele começam pela segunda
+        first = self.temp_dir / "zeta"
+        (first / "componentes").mkdir(parents=True)
+        (first / "componentes" / "z.lnegc").write_text(
+            "[COMPONENTE]\nNome: Z\n\n[DESCRIÇÃO]\nComponente Z\n", encoding="utf-8"
+        )
+        roots = ["--dir", str(first), str(self.project)]
+        single = self.temp_dir / "prompts.jsonl"
+        self.assertEqual(cli_main([*roots, "--output", str(single), "--format", "jsonl"]), 0)
+
+        outputs = []
+        for index in (1, 2, 3):
+            output = self.temp_dir / f"shard{index}.jsonl"
+            args = [*roots, "--output", str(output), "--format", "jsonl"]
+            self.assertEqual(cli_main(args + ["--shard", f"{index}/3"]), 0)
+            outputs.append(output)
+        outputs.sort(key=lambda output: '"root": "zeta"' in output.read_text(encoding="utf-8"))
+
+        merged = self.temp_dir / "merged.jsonl"
+        args = ["merge", *map(str, outputs), "--output", str(merged), "--format", "jsonl"]
+        self.assertEqual(cli_main(args), 0)
+        self.assertEqual(merged.read_bytes(), single.read_bytes())
+        self.assertIn('"root": "zeta"', merged.read_text(encoding="utf-8").splitlines()[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a geração de prompts sob demanda (iter_prompts).
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION, LNEGCParser
+from lnegc.src.core.processor import LNEGCProcessor
+
+
+class TestIterPrompts(TestCase):
+    """Testes para LNEGCProcessor.iter_prompts."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        for kind in ["componentes", "entidades", "interfaces"]:
+            (self.temp_dir / kind).mkdir()
+        (self.temp_dir / "interfaces" / "repositorio.lnegc").write_text("[INTERFACE]\nNome: Repo\n")
+        (self.temp_dir / "componentes" / "validador.lnegc").write_text("[COMPONENTE]\nNome: V\n")
+        (self.temp_dir / "entidades" / "cliente.lnegc").write_text(
+            "[ENTIDADE]\nNome: Cliente\n\n## Metadados\n- **Nome**: Cliente\n"
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_same_prompts_as_process(self):
+        """Testa que os prompts e a ordem são os mesmos de process_all()."""
+        processor = LNEGCProcessor(self.temp_dir)
+        streamed = list(processor.iter_prompts())
+
+        self.assertEqual(
+            [prompt for _, _, prompt in streamed], LNEGCProcessor(self.temp_dir).process_all()
+        )
+        self.assertEqual(
+            [(kind, path.name) for kind, path, _ in streamed],
+            [
+                ("componentes", "validador.lnegc"),
+                ("entidades", "cliente.lnegc"),
+                ("interfaces", "repositorio.lnegc"),
+            ],
+        )
+        # Nenhum resultado do parse fica retido no processador
+        self.assertEqual(sum(map(len, processor._targets().values())), 0)
+
+    def test_second_pass_uses_cache(self):
+        """Testa que a segunda passagem carrega os resultados do cache de parse."""
+        cache = ParseCache.for_project(self.temp_dir, PARSER_VERSION)
+        prompts = LNEGCProcessor(self.temp_dir, cache=cache, jobs=2).iter_prompts()
+
+        kind, path, prompt = next(prompts)
+        self.assertEqual(kind, "componentes")
+        self.assertEqual(cache.misses, 3)
+        self.assertEqual(len(list(prompts)), 2)
+        self.assertEqual(cache.hits, 3)
+
+    def test_each_file_is_parsed_once(self):
+        """Testa que cada arquivo passa pelo parse uma única vez, com e sem cache."""
+        # Especificação substituída por outra de mesmo nome: não gera prompt
+        (self.temp_dir / "componentes" / "antigo.lnegc").write_text("[COMPONENTE]\nNome: A\n")
+        build = LNEGCParser._build_result
+        for cache in (None, ParseCache.for_project(self.temp_dir, PARSER_VERSION)):
+            with patch.object(LNEGCParser, "_build_result", autospec=True) as parse:
+                parse.side_effect = build
+                prompts = list(LNEGCProcessor(self.temp_dir, cache=cache).iter_prompts())
+            self.assertEqual(len(prompts), 3)
+            self.assertEqual(parse.call_count, 4)
+
+
+if __name__ == "__main__":
+    main()
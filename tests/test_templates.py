@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para os templates Jinja2 dos prompts.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.parser import LNEGCParser
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.templates import BYTECODE_CACHE, PROJECT_TEMPLATES, TemplateEngine
+from lnegc.src.core.workspace import Workspace
+
+
+class TestTemplateEngine(TestCase):
+    """Testes para o carregamento, a compilação e a sobrescrita de templates."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.projects = []
+        for name in ["loja", "estoque"]:
+            project = self.temp_dir / name
+            (project / "entidades").mkdir(parents=True)
+            (project / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+            (project / "entidades" / "cliente.lnegc").write_text(
+                "[ENTIDADE]\nNome: Cliente\n\n## Metadados\n- **Nome**: Cliente\n\n"
+                "## Atributos\n- id: int\n",
+                encoding="utf-8",
+            )
+            self.projects.append(project)
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_templates_compiled_once_with_bytecode_cache(self):
+        """Testa que cada template é compilado uma vez e gravado no cache de bytecode."""
+        processor = LNEGCProcessor(self.projects[0])
+        engine = processor.templates
+
+        self.assertIs(TemplateEngine.for_project(self.projects[0]), engine)
+        prompt = processor.process()["entidades"][0]
+        self.assertIn("- id: int", prompt)
+        self.assertIs(engine.template("entidade.j2"), engine.template("entidade.j2"))
+        self.assertTrue(list((self.projects[0] / BYTECODE_CACHE).glob("*.cache")))
+
+    def test_project_override(self):
+        """Testa que .lnegc/templates sobrescreve o template do pacote."""
+        default = LNEGCProcessor(self.projects[0])
+        overrides = self.projects[1] / PROJECT_TEMPLATES
+        overrides.mkdir(parents=True)
+        (overrides / "entidade.j2").write_text(
+            "Entidade {{ spec.metadata['Nome'] }} em {{ linguagem }}:\n"
+            "{{ lista(spec.attributes, '-') }}\n",
+            encoding="utf-8",
+        )
+        custom = LNEGCProcessor(self.projects[1], "go")
+
+        self.assertEqual(custom.process()["entidades"], ["Entidade Cliente em go:\n- id: int"])
+        self.assertNotEqual(custom.templates.fingerprint, default.templates.fingerprint)
+        self.assertNotEqual(
+            custom._render_key(), LNEGCProcessor(self.projects[0], "go")._render_key()
+        )
+
+    def test_workspace_shares_engine(self):
+        """Testa que raízes sem templates próprios compartilham o mesmo ambiente."""
+        workspace = Workspace(self.projects)
+        engines = {id(processor.templates) for processor in workspace.processors.values()}
+
+        self.assertEqual(len(engines), 1)
+        engine = workspace.processors[self.projects[0]].templates
+        self.assertEqual(
+            engine.environment.bytecode_cache.directory,
+            str(self.projects[0].absolute() / BYTECODE_CACHE),
+        )
+
+    def test_prefix_layout_shares_prefix(self):
+        """Testa que, no layout prefixo, prompts do mesmo tipo começam com o mesmo texto."""
+        specs = {
+            "componentes": "[COMPONENTE]\nNome: {0}\n\n[DESCRIÇÃO]\nValida {0}\n",
+            "entidades": "[ENTIDADE]\nNome: {0}\n\n## Metadados\n- **Nome**: {0}\n",
+            "interfaces": "[INTERFACE]\nNome: {0}\n\n[MÉTODOS]\n- obter{0}()\n",
+            "testes": "[TESTE]\nNome: {0}\n\n[DESCRIÇÃO]\nTesta {0}\n",
+        }
+        processor = LNEGCProcessor(self.projects[0], layout="prefixo")
+        for kind, text in specs.items():
+            prompts = []
+            for name in ["Pedido", "Fatura"]:
+                path = self.temp_dir / f"{kind}-{name}.lnegc"
+                path.write_text(text.format(name), encoding="utf-8")
+                prompts.append(processor._generate_prompt(kind, LNEGCParser(path).parse()))
+
+            # A parte fixa termina onde começa o conteúdo da especificação
+            static = prompts[0].index("Por favor, gere")
+            self.assertGreater(static, 0)
+            self.assertEqual(prompts[0][:static], prompts[1][:static])
+            self.assertTrue(prompts[0][:static].startswith("Gere "))
+            self.assertIn("Pedido", prompts[0][static:])
+
+        default = LNEGCProcessor(self.projects[0])
+        self.assertTrue(default.process()["entidades"][0].startswith("Por favor, gere"))
+        self.assertNotEqual(default._render_key(), processor._render_key())
+        with self.assertRaises(ValueError):
+            LNEGCProcessor(self.projects[0], layout="outro")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a estimativa de tokens e a divisão de prompts grandes.
+"""
+
+import io
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.tokens import (
+    PromptTooLargeError,
+    estimate,
+    get_tokenizer,
+    register_tokenizer,
+)
+
+
+class TestTokens(TestCase):
+    """Testes para os tokenizadores e o modo de orçamento."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "entidades").mkdir()
+        (self.temp_dir / "componentes").mkdir()
+        (self.temp_dir / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        attributes = "".join(f"- campo{i}: string\n" for i in range(300))
+        (self.temp_dir / "entidades" / "cliente.lnegc").write_text(
+            "[ENTIDADE]\nNome: Cliente\n\n## Metadados\n- **Nome**: Cliente\n"
+            "- **Versão**: 2.0.0\n\n## Atributos\n" + attributes
+            + "\n## Validações\n- campo0 é obrigatório\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_tokenizers(self):
+        """Testa o estimador padrão e o registro de tokenizadores."""
+        self.assertEqual(estimate("Olá, mundo"), 4)
+        self.assertIs(get_tokenizer(), estimate)
+        with self.assertRaises(ValueError):
+            get_tokenizer("inexistente")
+
+        register_tokenizer("palavras", lambda: lambda text: len(text.split()))
+        self.assertEqual(get_tokenizer("palavras")("um dois três"), 3)
+
+    def test_budget_splits_entity(self):
+        """Testa que uma entidade grande é dividida mantendo o cabeçalho em cada parte."""
+        whole = LNEGCProcessor(self.temp_dir).process()["entidades"]
+        self.assertEqual(len(whole), 1)
+        self.assertGreater(estimate(whole[0]), 1500)
+
+        processor = LNEGCProcessor(self.temp_dir, budget=1500)
+        parts = processor.process()["entidades"]
+
+        self.assertGreater(len(parts), 1)
+        for number, part in enumerate(parts, 1):
+            self.assertLessEqual(estimate(part), 1500)
+            self.assertTrue(part.startswith(f"Parte {number} de {len(parts)}:"))
+            self.assertIn("- Nome: Cliente", part)
+            self.assertIn("- Versão: 2.0.0", part)
+        text = "\n".join(parts)
+        for i in range(300):
+            self.assertEqual(text.count(f"- campo{i}: string\n"), 1)
+        self.assertEqual(text.count("- campo0 é obrigatório"), 1)
+
+    def test_budget_splits_only_rendered_sections(self):
+        """Testa que seções que o template não usa não geram partes sem conteúdo."""
+        description = "\n\n".join(f"Parágrafo {i} da descrição." for i in range(60))
+        implementation = "\n\n".join(f"Passo {i} da implementação." for i in range(60))
+        (self.temp_dir / "componentes" / "grande.lnegc").write_text(
+            f"[COMPONENTE]\nNome: Grande\n\n[DESCRIÇÃO]\n{description}\n\n"
+            f"[IMPLEMENTAÇÃO]\n{implementation}\n",
+            encoding="utf-8",
+        )
+        processor = LNEGCProcessor(self.temp_dir, budget=1200)
+        parts = processor.process()["componentes"]
+
+        self.assertGreater(len(parts), 1)
+        for part in parts:
+            self.assertLessEqual(estimate(part), 1200)
+            self.assertIn("Parágrafo", part)
+            self.assertNotIn("Passo", part)
+        text = "\n".join(parts)
+        for i in range(60):
+            self.assertEqual(text.count(f"Parágrafo {i} da descrição."), 1)
+
+    def test_oversized_prompt_is_rejected(self):
+        """Testa que um prompt que não pode ser dividido é rejeitado localmente."""
+        (self.temp_dir / "componentes" / "grande.lnegc").write_text(
+            "[COMPONENTE]\nNome: Grande\n\n[DESCRIÇÃO]\n" + "texto " * 2000 + "\n",
+            encoding="utf-8",
+        )
+        processor = LNEGCProcessor(self.temp_dir, budget=1500)
+        with self.assertRaises(PromptTooLargeError) as context:
+            processor.process()
+        self.assertEqual(context.exception.budget, 1500)
+
+    def test_cli_report(self):
+        """Testa o relatório do subcomando `tokens` com e sem limite excedido."""
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(cli_main(["tokens", "--dir", str(self.temp_dir)]), 0)
+        self.assertIn("entidades", out.getvalue())
+        self.assertIn("total (1 prompts)", out.getvalue())
+
+        with redirect_stdout(io.StringIO()) as out, redirect_stderr(io.StringIO()):
+            code = cli_main(["tokens", "--dir", str(self.temp_dir), "--budget", "100"])
+        self.assertEqual(code, 1)
+        self.assertIn("acima do limite", out.getvalue())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o modo de observação do processador LNEGC.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.core.processor import LNEGCProcessor
+from lnegc.src.core.watcher import InotifyWatcher, PollingWatcher, WatchSession
+
+
+class TestWatchSession(TestCase):
+    """Testes para a sessão e os observadores de arquivos."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        (self.temp_dir / "config.lnegc").write_text("[PROJETO]\nNome: Teste\n", encoding="utf-8")
+        (self.temp_dir / "entidades").mkdir()
+        self.entity = self.temp_dir / "entidades" / "cliente.lnegc"
+        self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: int\n")
+        self.output = self.temp_dir / "out" / "prompts.txt"
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_update_renders_only_changed_files(self):
+        """Testa que apenas os arquivos alterados são processados novamente."""
+        processor = LNEGCProcessor(self.temp_dir)
+        session = WatchSession(processor, self.output)
+        session.build()
+        self.assertEqual(
+            self.output.read_text(encoding="utf-8"),
+            "\n\n".join(LNEGCProcessor(self.temp_dir).process_all()),
+        )
+
+        rendered = []
+        generate = processor._generate_prompt
+        processor._generate_prompt = lambda kind, result: (
+            rendered.append(kind) or generate(kind, result)
+        )
+
+        (self.temp_dir / "componentes").mkdir()
+        component = self.temp_dir / "componentes" / "validador.lnegc"
+        component.write_text("[COMPONENTE]\nNome: Validador\n")
+        self.assertEqual(session.update({component, self.temp_dir / "notas.txt"}), 1)
+        self.assertEqual(rendered, ["componentes"])
+        self.assertEqual(len(session.prompts()["componentes"]), 1)
+
+        self.entity.unlink()
+        self.assertEqual(session.update({self.entity}), 1)
+        self.assertEqual(session.prompts()["entidades"], [])
+        self.assertEqual(session.update(set()), 0)
+        self.assertNotIn("Cliente", self.output.read_text(encoding="utf-8"))
+
+    def test_duplicate_names_match_process(self):
+        """Testa que especificações de mesmo nome são reduzidas à última, como em process()."""
+        (self.temp_dir / "componentes").mkdir()
+        for stem, name in [("a", "Botao"), ("b", "Campo"), ("c", "Botao")]:
+            (self.temp_dir / "componentes" / f"{stem}.lnegc").write_text(
+                f"[COMPONENTE]\nNome: {stem}\n\n## Metadados\n- **nome**: {name}\n\n"
+                f"[DESCRIÇÃO]\nComponente {stem}\n"
+            )
+        session = WatchSession(LNEGCProcessor(self.temp_dir), self.output)
+        session.build()
+        expected = "\n\n".join(LNEGCProcessor(self.temp_dir).process_all())
+        self.assertLess(expected.index("Componente b"), expected.index("Componente c"))
+        self.assertEqual(self.output.read_text(encoding="utf-8"), expected)
+
+        # Atualizar o primeiro arquivo não o torna o selecionado
+        session.update({self.temp_dir / "componentes" / "a.lnegc"})
+        self.assertEqual(session.prompts(), LNEGCProcessor(self.temp_dir).process())
+
+    def test_output_permissions(self):
+        """Testa que a saída nova segue a umask e a existente mantém as permissões."""
+        umask = os.umask(0o022)
+        try:
+            session = WatchSession(LNEGCProcessor(self.temp_dir), self.output)
+            session.build()
+            self.assertEqual(self.output.stat().st_mode & 0o777, 0o644)
+
+            self.output.chmod(0o640)
+            self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: uuid\n")
+            session.update({self.entity})
+            self.assertEqual(self.output.stat().st_mode & 0o777, 0o640)
+        finally:
+            os.umask(umask)
+
+    def test_polling_watcher(self):
+        """Testa a detecção de alterações por varredura periódica."""
+        watcher = PollingWatcher(self.temp_dir, interval=0.01)
+        self.assertEqual(watcher.poll(), set())
+        self.entity.write_text("[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: uuid\n")
+        self.assertEqual(watcher.poll(), {self.entity})
+
+    def test_polling_watcher_uses_configured_directories(self):
+        """Testa que a varredura periódica percorre os diretórios de [DIRETÓRIOS]."""
+        (self.temp_dir / "config.lnegc").write_text(
+            "[PROJETO]\nNome: Teste\n\n[DIRETÓRIOS]\nComponentes: ui/\n", encoding="utf-8"
+        )
+        (self.temp_dir / "ui").mkdir()
+        component = self.temp_dir / "ui" / "botao.lnegc"
+        component.write_text("[COMPONENTE]\nNome: Botao\n")
+        processor = LNEGCProcessor(self.temp_dir)
+        watcher = PollingWatcher(self.temp_dir, 0.01, processor.ignore, processor.scan_files)
+        self.assertEqual(watcher.poll(), set())
+        component.write_text("[COMPONENTE]\nNome: Botao\n\n[DESCRIÇÃO]\nBotão primário\n")
+        self.assertEqual(watcher.poll(), {component})
+
+    def test_inotify_watcher(self):
+        """Testa a detecção de alterações pelo inotify, incluindo diretórios novos."""
+        try:
+            watcher = InotifyWatcher(self.temp_dir)
+        except (OSError, AttributeError):
+            self.skipTest("inotify indisponível")
+        try:
+            self.assertEqual(watcher.poll(0.01), set())
+            self.entity.write_text("[ENTIDADE]\nNome: Cliente\n")
+            self.assertIn(self.entity, watcher.poll(1))
+
+            (self.temp_dir / "testes").mkdir()
+            watcher.poll(1)
+            test = self.temp_dir / "testes" / "cliente.test.lnegc"
+            test.write_text("[TESTE]\nNome: Cliente\n")
+            self.assertIn(test, watcher.poll(1))
+        finally:
+            watcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para o processamento de várias raízes em uma única execução.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.cache import ParseCache
+from lnegc.src.core.parser import PARSER_VERSION
+from lnegc.src.core.workspace import Workspace
+
+
+class TestWorkspace(TestCase):
+    """Testes para o Workspace e a opção --dir com várias raízes."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.roots = []
+        for name, language in [("loja", "Go"), ("estoque", "Rust")]:
+            root = self.temp_dir / "projetos" / name
+            (root / "entidades").mkdir(parents=True)
+            (root / "config.lnegc").write_text(
+                f"[CONFIGURAÇÕES]\nLinguagem_Padrão: {language}\n", encoding="utf-8"
+            )
+            (root / "entidades" / "cliente.lnegc").write_text(
+                "[ENTIDADE]\nNome: Cliente\n\n## Atributos\n- id: int\n", encoding="utf-8"
+            )
+            self.roots.append(root)
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def test_roots_share_cache_and_pools(self):
+        """Testa configuração por raiz com cache e pools compartilhados."""
+        cache = ParseCache.for_project(Workspace.cache_root(self.roots), PARSER_VERSION)
+        with Workspace(self.roots, cache=cache, jobs=2) as workspace:
+            results = dict(workspace.process())
+            pools = {id(processor.pools) for processor in workspace.processors.values()}
+
+        self.assertEqual(len(pools), 1)
+        self.assertIn("em go", results[self.roots[0]]["entidades"][0])
+        self.assertIn("em rust", results[self.roots[1]]["entidades"][0])
+        # O conteúdo é igual nas duas raízes: o segundo arquivo vem do cache
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+        self.assertEqual(cache.root, self.roots[0] / ".lnegc" / "cache")
+
+    def test_cache_root_is_first_root(self):
+        """Testa que raízes sem relação entre si não gravam os caches no ancestral comum."""
+        other = Path(tempfile.mkdtemp())
+        try:
+            self.assertEqual(Workspace.cache_root([self.roots[0], other]), self.roots[0])
+            self.assertEqual(Workspace.cache_root([other, self.roots[0]]), other)
+        finally:
+            other.rmdir()
+
+    def test_cli_labels_prompts_by_root(self):
+        """Testa que a saída indica a raiz de cada prompt."""
+        output = self.temp_dir / "prompts.txt"
+        args = ["--dir", *map(str, self.roots), "--output", str(output)]
+        self.assertEqual(cli_main(args), 0)
+
+        text = output.read_text(encoding="utf-8")
+        self.assertTrue(text.startswith("# Raiz: loja\n\nPor favor, gere uma entidade em go"))
+        self.assertIn("# Raiz: estoque\n\nPor favor, gere uma entidade em rust", text)
+
+
+if __name__ == "__main__":
+    main()
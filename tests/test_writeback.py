@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Testes para a gravação do código gerado nos arquivos do projeto.
+"""
+
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import TestCase, main
+
+from lnegc.src.cli.main import main as cli_main
+from lnegc.src.core.writeback import extract_blocks
+
+
+class TestWriteBack(TestCase):
+    """Testes para `lnegc apply`."""
+
+    def setUp(self):
+        """Prepara ambiente para os testes."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.project = self.temp_dir / "projeto"
+        self.project.mkdir()
+        (self.project / "config.lnegc").write_text(
+            "[PROJETO]\nNome: Teste\n\n[CONFIGURAÇÕES]\nLinguagem_Padrão: TypeScript\n\n"
+            "[DIRETÓRIOS]\nEntidades: modelos/\nComponentes: telas/\n",
+            encoding="utf-8",
+        )
+        self.responses = self.temp_dir / "respostas.jsonl"
+        self.target = self.temp_dir / "src"
+
+    def tearDown(self):
+        """Limpa ambiente após os testes."""
+        import shutil
+
+        shutil.rmtree(self.temp_dir)
+
+    def _apply(self, records):
+        with open(self.responses, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        args = ["apply", str(self.responses), "--dir", str(self.project)]
+        with redirect_stdout(io.StringIO()):
+            return cli_main(args + ["--target", str(self.target)])
+
+    def test_extract_blocks(self):
+        """Testa a extração dos blocos e do arquivo indicado no rótulo."""
+        blocks = extract_blocks(
+            "Texto\n```ts\nconst a = 1;\n```\n\n~~~python title=\"pkg/b.py\"\nb = 2\n~~~\n"
+        )
+
+        self.assertEqual([b.language for b in blocks], ["ts", "python"])
+        self.assertEqual([b.path for b in blocks], [None, "pkg/b.py"])
+        self.assertEqual(blocks[0].code, "const a = 1;\n")
+
+    def _spec(self, directory, stem, declaration, name, key=None):
+        text = f"[{declaration}]\nNome: {name}\n"
+        if key is not None:
+            # Chave usada pelo processador para remover especificações repetidas
+            text += f"\n## Metadados\n- **nome**: {key}\n"
+        path = self.project / directory / f"{stem}.lnegc"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def _process(self):
+        """Gera os registros dos prompts do projeto com --format jsonl."""
+        prompts = self.temp_dir / "prompts.jsonl"
+        args = ["--dir", str(self.project), "--output", str(prompts), "--format", "jsonl"]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(cli_main(args), 0)
+        return [json.loads(line) for line in prompts.read_text().splitlines()]
+
+    @staticmethod
+    def _respond(records, extra=""):
+        """Simula as respostas do modelo com o nome do arquivo de origem."""
+        return [
+            {**record, "response": f"```ts\n// {Path(record['source']).stem}{extra}\n```"}
+            for record in records
+        ]
+
+    def test_apply_writes_only_changed_files(self):
+        """Testa os destinos pelo Nome e a preservação de arquivos sem alteração."""
+        self._spec("modelos", "usuario", "ENTIDADE", "Usuario", key="u")
+        self._spec("modelos", "pedido", "ENTIDADE", "Pedido", key="p")
+        self._spec("telas", "login", "COMPONENTE", "Tela Login")
+        records = self._process()
+        self.assertEqual(len(records), 3)
+        self.assertEqual(self._apply(self._respond(records)), 0)
+
+        user = self.target / "modelos" / "Usuario.ts"
+        order = self.target / "modelos" / "Pedido.ts"
+        login = self.target / "telas" / "Tela_Login.ts"
+        self.assertEqual(user.read_text(), "// usuario\n")
+        self.assertEqual(order.read_text(), "// pedido\n")
+        self.assertEqual(login.read_text(), "// login\n")
+
+        os.utime(user, (1000, 1000))
+        os.utime(order, (1000, 1000))
+        responses = [
+            self._respond([record], " v2")[0] if record["source"].endswith("usuario.lnegc")
+            else response
+            for record, response in zip(records, self._respond(records))
+        ]
+        self.assertEqual(self._apply(responses), 0)
+        self.assertNotEqual(user.stat().st_mtime, 1000)
+        self.assertEqual(order.stat().st_mtime, 1000)
+        self.assertEqual(user.read_text(), "// usuario v2\n")
+        self.assertEqual(list(self.target.rglob("*.tmp")), [])
+
+    def test_apply_rejects_specs_with_the_same_file(self):
+        """Testa que duas especificações não podem gravar o mesmo arquivo."""
+        self._spec("modelos", "usuario", "ENTIDADE", "Usuario", key="u")
+        self._spec("modelos", "usuario_antigo", "ENTIDADE", "Usuario", key="v")
+        self._spec("modelos", "pedido", "ENTIDADE", "Pedido", key="p")
+        with redirect_stderr(io.StringIO()) as stderr:
+            code = self._apply(self._respond(self._process()))
+
+        self.assertEqual(code, 1)
+        self.assertIn("geram o mesmo arquivo", stderr.getvalue())
+        self.assertFalse((self.target / "modelos" / "Usuario.ts").exists())
+        self.assertTrue((self.target / "modelos" / "Pedido.ts").exists())
+
+    def test_apply_rejects_paths_outside_target(self):
+        """Testa que blocos não podem gravar fora do diretório de destino."""
+        self._spec("modelos", "e", "ENTIDADE", "E")
+        records = [
+            {**record, "response": "```ts ../../fora.ts\nx\n```"} for record in self._process()
+        ]
+        with redirect_stderr(io.StringIO()) as stderr:
+            code = self._apply(records)
+
+        self.assertEqual(code, 1)
+        self.assertIn("fora do diretório de destino", stderr.getvalue())
+        self.assertFalse((self.temp_dir / "fora.ts").exists())
+
+
+if __name__ == "__main__":
+    main()